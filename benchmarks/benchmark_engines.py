@@ -0,0 +1,68 @@
+"""
+Compare the pandas and Polars engines of the filter statistics on the bundled datasets.
+
+Run from the repository root:
+
+    python -m benchmarks.benchmark_engines [--repeat 5] [--scale 10]
+
+`--scale` stacks each dataset that many times to approximate larger tables.
+"""
+import argparse
+import glob
+import time
+
+import pandas as pd
+
+from models import polars_engine
+from models.column_profile import ColumnProfile, constant_columns
+
+
+def best_time(function, repeat):
+    """Fastest of `repeat` runs of `function`, in milliseconds, and its last result."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+    return 1000 * min(timings), result
+
+
+def benchmark(path, repeat, scale):
+    data = pd.read_csv(path)
+    data = pd.concat([data] * scale, ignore_index=True)
+
+    rows = []
+    for engine in ('pandas', 'polars'):
+        profile_ms, profile = best_time(lambda: ColumnProfile(data, n_jobs=1, engine=engine), repeat)
+        dummies_ms, dummies = best_time(lambda: polars_engine.get_dummies(data, engine), repeat)
+        rows.append({'dataset': path, 'shape': '%d x %d' % data.shape, 'engine': engine,
+                     'profile_ms': profile_ms, 'one_hot_ms': dummies_ms,
+                     'stats': profile.stats, 'dummies': dummies})
+
+    constant_ms, _ = best_time(lambda: constant_columns(data), repeat)
+    for row in rows:
+        row['constant_ms'] = constant_ms
+
+    # Both engines must return the same statistics and encoding
+    rows[1]['identical'] = rows[0]['stats'].equals(rows[1]['stats']) and rows[0]['dummies'].equals(rows[1]['dummies'])
+    rows[0]['identical'] = rows[1]['identical']
+
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--scale', type=int, default=1)
+    args = parser.parse_args()
+
+    if not polars_engine.available():
+        raise SystemExit('polars is not installed; only the pandas engine is available.')
+
+    rows = [row for path in sorted(glob.glob('data/*.csv')) for row in benchmark(path, args.repeat, args.scale)]
+    results = pd.DataFrame(rows)[['dataset', 'shape', 'engine', 'profile_ms', 'one_hot_ms', 'constant_ms', 'identical']]
+    print(results.to_string(index=False, float_format='%.1f'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Micro-benchmark every statistics kernel with its NumPy and compiled Numba implementations.
+
+Run from the repository root:
+
+    python -m benchmarks.benchmark_kernels [--samples 100000] [--features 50] [--repeat 5]
+
+The first Numba call of each kernel compiles it (or loads it from the cache) and is not timed.
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from models import kernels, statistics
+
+
+def best_time(function, repeat):
+    """Fastest of `repeat` runs of `function`, in milliseconds, and its last result."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+    return 1000 * min(timings), result
+
+
+def make_cases(n_samples, n_features, seed=0):
+    """Benchmark inputs: name -> function of the backend returning a comparable result."""
+    rng = np.random.default_rng(seed)
+    features = rng.normal(size=(n_samples, n_features)) @ rng.normal(size=(n_features, n_features))
+    features[rng.random(features.shape) < 0.05] = np.nan
+    edges = statistics.quantile_edges(features, 10)
+    codes = statistics.bin_codes(features, edges, 'numpy')
+    target_codes = rng.integers(0, 3, n_samples)
+    buffer = np.ascontiguousarray(features, dtype=np.float32)
+
+    def permute(backend):
+        statistics.permute_columns(buffer, np.random.default_rng(seed), backend)
+        # Compare what survives any permutation: the sorted values of every column
+        return np.sort(buffer, axis=0)
+
+    return {
+        'bin_codes': lambda backend: statistics.bin_codes(features, edges, backend),
+        'joint_histograms': lambda backend: statistics.joint_histograms(codes, target_codes, 12, 3, backend),
+        'column_histograms': lambda backend: statistics.column_histograms(codes, 12, backend),
+        'permute_columns': permute,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--samples', type=int, default=100000)
+    parser.add_argument('--features', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    if not kernels.available():
+        raise SystemExit('numba is not installed; only the NumPy kernels are available.')
+
+    rows = []
+    for name, kernel in make_cases(args.samples, args.features).items():
+        numpy_ms, expected = best_time(lambda: kernel('numpy'), args.repeat)
+        start = time.perf_counter()
+        kernel('numba')
+        compile_ms = 1000 * (time.perf_counter() - start)
+        numba_ms, result = best_time(lambda: kernel('numba'), args.repeat)
+        rows.append({'kernel': name, 'numpy_ms': numpy_ms, 'numba_ms': numba_ms, 'first_call_ms': compile_ms,
+                     'speedup': numpy_ms / numba_ms,
+                     'identical': np.allclose(expected, result, rtol=1e-9, atol=1e-12, equal_nan=True)})
+
+    print('%d samples x %d features, %d Numba threads' % (args.samples, args.features, kernels.numba.get_num_threads()))
+    print(pd.DataFrame(rows).to_string(index=False, float_format='%.2f'))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QFileDialog, QTableWidgetItem, QMessageBox, QTableWidget, QInputDialog, QLineEdit, QDialog
@@ -8,6 +9,7 @@ from views.themes import ALL_THEMES
 from views.themes_dialog import ThemesDialog
 from views.plotting_view import PlottingView
 
+from models import dtype_plan, polars_engine
 from models.feature_selector_model import FeatureSelectorModel
 from models.feature_selector_thread import FeatureSelectionThread
 from models.plotting_model import PlottingModel
@@ -22,6 +24,8 @@ class FeatureSelectorController:
         self.current_page = None
         self.page_size = None
         self.data = None
+        # Loaded datasets keyed by their data table
+        self.datasets = {}
         self.result_data = None
         self.model = FeatureSelectorModel()
         self.view = FeatureSelectorView(self.app)
@@ -46,6 +50,10 @@ class FeatureSelectorController:
         self.view.switch_theme_action.triggered.connect(self.switch_theme)
         self.view.run_action.triggered.connect(self.execute_selected_methods)
         self.view.feature_select_action.triggered.connect(self.open_feature_selection_dialog)
+        self.view.add_row_signal.connect(self.add_row)
+        self.view.delete_row_signal.connect(self.delete_row)
+        self.view.add_column_signal.connect(self.add_column)
+        self.view.delete_column_signal.connect(self.delete_column)
         self.view.rename_column_signal.connect(self.rename_column)
         self.view.set_target_column_signal.connect(self.set_target_column)
 
@@ -53,8 +61,13 @@ class FeatureSelectorController:
         file_names, _ = QFileDialog.getOpenFileNames(self.view, "Open CSV", "", "CSV files (*.csv);;All files (*)")
         for file_name in file_names:
             if file_name:
-                self.data = pd.read_csv(file_name)
+                # Narrow the dtypes without changing any value; floats narrow only if they round-trip exactly
+                self.data, report = dtype_plan.optimize_dtypes(pd.read_csv(file_name))
                 self.display_data_in_table(self.data, file_name)
+                saved = report['memory_before'] - report['memory_after']
+                self.view.status_bar.showMessage(
+                    f"Loaded data from {file_name}: {len(report['plan'])} columns narrowed, "
+                    f"{saved / 2 ** 20:.1f} MB saved ({saved / max(report['memory_before'], 1):.0%})")
 
     def new_file(self):
         self.view.add_new_data_table()
@@ -68,9 +81,11 @@ class FeatureSelectorController:
         data_table.customContextMenuRequested.connect(self.view.show_table_context_menu)
         data_table.horizontalHeader().setContextMenuPolicy(Qt.CustomContextMenu)
         data_table.horizontalHeader().customContextMenuRequested.connect(self.view.show_header_context_menu)
+        data_table.itemChanged.connect(lambda item: self.update_cell(data_table, item))
 
         # Add table to data tables widget
         self.view.data_tables.addTab(data_table, title.split('/')[-1])
+        self.datasets[data_table] = data
 
         # Set the page size
         self.page_size = 500
@@ -89,10 +104,13 @@ class FeatureSelectorController:
         start_row = self.current_page * self.page_size
         end_row = (self.current_page + 1) * self.page_size
 
+        # Filling the table is not an edit of the data
+        table.blockSignals(True)
         for row in range(start_row, min(end_row, data.shape[0])):
             table.insertRow(row)  # Insert a new row at the end
             for col in range(data.shape[1]):
                 table.setItem(row, col, QTableWidgetItem(str(data.iloc[row, col])))
+        table.blockSignals(False)
 
         self.current_page += 1
 
@@ -155,10 +173,17 @@ class FeatureSelectorController:
         # Get the selected methods and parameters from the dialog
         methods = self.feature_methods_dialog.get_selected_methods()
         keep_one_hot = self.feature_methods_dialog.get_one_hot() == 'True'
+        cascade = self.feature_methods_dialog.get_cascade()
         if methods is None:
             QMessageBox.warning(self.view, "Select Methods", "Please select methods before running.")
             return
 
+        engine = self.feature_methods_dialog.get_engine()
+        if engine == 'polars' and not polars_engine.available():
+            QMessageBox.warning(self.view, "Polars Not Installed",
+                                "The polars engine requires the polars package. Choose pandas or auto instead.")
+            return
+
         # Check if the target column has been set
         if self.view.target_column_index is None:
             QMessageBox.warning(self.view, "Select Target", "Please select a target column before running.")
@@ -175,16 +200,32 @@ class FeatureSelectorController:
         target_column_name = current_table.horizontalHeaderItem(self.view.target_column_index).text()
 
         # Extract data from the current table
-        data = self.data
+        data = self.datasets.get(current_table, self.data)
+
+        # The other open datasets are compared against the current one for drift
+        comparison_data = {}
+        for index in range(self.view.data_tables.count()):
+            table = self.view.data_tables.widget(index)
+            if table is not current_table and table in self.datasets:
+                comparison_data[self.view.data_tables.tabText(index)] = self.datasets[table]
 
         # Load the data in the model
-        self.model.load_data(data)
+        self.model.load_data(data, comparison_data)
+        # Categorical columns above the cardinality cap are not one-hot encoded
+        encoding_policy = self.feature_methods_dialog.get_encoding_policy()
+        if encoding_policy is not None:
+            self.model.one_hot.max_levels = encoding_policy['max_levels']
+            self.model.one_hot.high_cardinality = encoding_policy['high_cardinality']
+        # Memory budget in bytes for the run, None for no budget
+        self.model.memory_budget = self.feature_methods_dialog.get_memory_budget()
+        self.model.engine = engine
         # Connect signals to slots for updating the view
         self.model.method_result_signal.connect(self.view.display_method_result)
         self.model.final_results_signal.connect(self.view.display_final_results)
 
         # Using the thread to perform feature selection
-        self.feature_selection_thread = FeatureSelectionThread(self.model, methods, target_column_name, keep_one_hot)
+        self.feature_selection_thread = FeatureSelectionThread(self.model, methods, target_column_name, keep_one_hot,
+                                                               cascade)
         self.feature_selection_thread.start()
         self.feature_selection_thread.finished.connect(
             self.on_feature_selection_done)  # connect to a method to handle after selection
@@ -192,19 +233,105 @@ class FeatureSelectorController:
     def open_feature_selection_dialog(self):
         self.feature_methods_dialog.exec_()
 
+    def update_cell(self, table, item):
+        # Write a cell edit into the dataframe and tell the model which column changed
+        data = self.datasets.get(table)
+        if data is None or item.row() >= data.shape[0] or item.column() >= data.shape[1]:
+            return
+        column = data.columns[item.column()]
+        current = data.iloc[item.row(), item.column()]
+        text = item.text()
+        if text == str(current):
+            return
+
+        if text in ('', 'nan'):
+            value = np.nan
+        elif pd.api.types.is_numeric_dtype(data[column]):
+            value = pd.to_numeric(text, errors='coerce')
+            value = text if pd.isna(value) else value
+        else:
+            value = text
+        # Rebuild the column so a value of another type (a float in an integer column,
+        # text in a numeric one) gives the column the type that holds both
+        values = data[column].astype(object)
+        values.iloc[item.row()] = value
+        values = values.infer_objects()
+        if isinstance(data[column].dtype, pd.CategoricalDtype) and not pd.api.types.is_numeric_dtype(values):
+            # Keep the categorical type of the dtype plan
+            values = values.astype('category')
+        data[column] = values
+
+        self.model.update_columns(data, changed=[column])
+
+    def add_row(self):
+        current_table = self.view.data_tables.currentWidget()
+        data = self.datasets.get(current_table)
+        if data is None:
+            current_table.insertRow(current_table.rowCount())
+            return
+
+        # Rows not shown yet are loaded with the next page, the new one included
+        if current_table.rowCount() == data.shape[0]:
+            current_table.insertRow(current_table.rowCount())
+        data.loc[data.index.max() + 1 if data.shape[0] else 0] = np.nan
+        self.model.update_columns(data, changed=list(data.columns))
+
+    def delete_row(self, row_index):
+        current_table = self.view.data_tables.currentWidget()
+        data = self.datasets.get(current_table)
+        current_table.removeRow(row_index)
+        if data is not None and 0 <= row_index < data.shape[0]:
+            data.drop(index=data.index[row_index], inplace=True)
+            self.model.update_columns(data, changed=list(data.columns))
+
+    def add_column(self):
+        current_table = self.view.data_tables.currentWidget()
+        data = self.datasets.get(current_table)
+        column_index = current_table.columnCount()
+        new_name = f"Column {column_index + 1}"
+        while data is not None and new_name in data.columns:
+            new_name += "_new"
+
+        current_table.insertColumn(column_index)
+        current_table.setHorizontalHeaderItem(column_index, QTableWidgetItem(new_name))
+        if data is not None:
+            data[new_name] = np.nan
+            self.model.update_columns(data, changed=[new_name])
+
+    def delete_column(self, column_index):
+        current_table = self.view.data_tables.currentWidget()
+        data = self.datasets.get(current_table)
+        current_table.removeColumn(column_index)
+        if self.view.target_column_index is not None:
+            if self.view.target_column_index == column_index:
+                self.view.target_column_index = None
+            elif self.view.target_column_index > column_index:
+                self.view.target_column_index -= 1
+        if data is not None and 0 <= column_index < data.shape[1]:
+            column = data.columns[column_index]
+            data.drop(columns=[column], inplace=True)
+            self.model.update_columns(data, removed=[column])
+
     def rename_column(self, column_index):
         current_table = self.view.data_tables.currentWidget()
         old_name = current_table.horizontalHeaderItem(column_index).text()
         new_name, ok = QInputDialog.getText(self.view, "Rename Column", "New Name:", QLineEdit.Normal, old_name)
         if ok and new_name:
             current_table.setHorizontalHeaderItem(column_index, QTableWidgetItem(new_name))
+            data = self.datasets.get(current_table)
+            if data is not None and old_name in data.columns:
+                data.rename(columns={old_name: new_name}, inplace=True)
+                self.model.update_columns(data, changed=[new_name], removed=[old_name])
             self.view.status_bar.showMessage(f"Renamed column {old_name} to {new_name}")
 
     def set_target_column(self, column_index):
         self.view.target_column_index = column_index
         current_table = self.view.data_tables.currentWidget()
+        # Highlighting the target is not an edit of the data
+        current_table.blockSignals(True)
         for row in range(current_table.rowCount()):
             current_table.item(row, column_index).setBackground(Qt.yellow)
+        current_table.blockSignals(False)
         self.view.status_bar.showMessage(f"Set column {column_index} as Target")
 
     def on_feature_selection_done(self):
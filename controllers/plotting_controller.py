@@ -11,13 +11,19 @@ class PlottingController:
             if plot_type == "Missing Values":
                 self.view.plot_missing()
             elif plot_type == "Unique Values":
-                self.view.plot_unique()
+                self.view.plot_unique(params.get('approximate', False))
             elif plot_type == "Collinear Features":
                 self.view.plot_collinear(params.get('plot_all', False))
             elif plot_type == "Feature Importances":
                 plot_n = params.get('plot_n', 15)
                 threshold = params.get('threshold', None)
                 self.view.plot_feature_importances(plot_n, threshold)
+            elif plot_type == "Validation Curve":
+                self.view.plot_validation_curve()
+            elif plot_type == "Stability Selection":
+                self.view.plot_stability(params.get('plot_n', 15))
+            elif plot_type == "L1 Path":
+                self.view.plot_l1_path()
         except Exception as e:
             self.view.message_label.setText(f"Error: {str(e)}")
 
@@ -19,6 +19,11 @@ import gc
 # utilities
 from itertools import chain
 
+# shared single-pass column statistics and approximate distinct counts
+from models import hyperloglog, polars_engine
+from models.column_profile import ChunkedColumnProfile, ColumnProfile, constant_columns
+from models.column_registry import ColumnRegistry
+
 
 class FeatureSelector():
     """
@@ -55,7 +60,7 @@ class FeatureSelector():
         The fraction of missing values for features with missing fraction above threshold
         
     unique_stats : dataframe
-        Number of unique values for all features
+        Number of unique values for all features, computed on first use by `get_unique_stats`
     
     record_single_unique : dataframe
         Records the features that have a single unique value
@@ -81,6 +86,8 @@ class FeatureSelector():
     
         - All 5 operations can be run with the `identify_all` method.
         - If using feature importances, one-hot encoding is used for categorical variables which creates new columns
+        - For files too large to load, `FeatureSelector.from_csv` runs the missing, single unique and
+          collinear methods over chunks of the file
     
     """
 
@@ -105,31 +112,106 @@ class FeatureSelector():
 
         self.missing_stats = None
         self.unique_stats = None
+        self.unique_sketches = None
         self.corr_matrix = None
         self.feature_importances = None
 
+        # Per-column statistics shared by the missing and single unique methods
+        self.column_profile = None
+
+        # CSV file read in chunks by the filter methods instead of `data` (see `from_csv`)
+        self.csv_path = None
+        self.chunksize = None
+        self.read_csv_kwargs = {}
+
         # Dictionary to hold removal operations
         self.ops = {}
 
         self.one_hot_correlated = False
 
+    @classmethod
+    def from_csv(cls, path, chunksize=100000, labels=None, **read_csv_kwargs):
+        """
+        Create a feature selector for a CSV file that is read in chunks of `chunksize` rows instead of
+        being loaded. `identify_missing`, `identify_single_unique` and `identify_collinear` produce the
+        same records as for the loaded data from one pass over the file that keeps only mergeable
+        per-column statistics; `data` holds just the header, so the importance methods are not available.
+
+        Parameters
+        --------
+        path : str
+            Path of the CSV file
+
+        chunksize : int, default = 100000
+            Number of rows read at a time
+
+        labels : array or series, default = None
+            Training labels, as for the constructor
+
+        read_csv_kwargs :
+            Further arguments passed to `pd.read_csv`
+        """
+        selector = cls(pd.read_csv(path, nrows=0, **read_csv_kwargs), labels)
+        selector.csv_path = path
+        selector.chunksize = chunksize
+        selector.read_csv_kwargs = read_csv_kwargs
+        return selector
+
+    def get_column_profile(self):
+        """
+        Return the column profile of the data, computed in one scan of each column on first use.
+        For a CSV file this is the chunked profile of the whole file.
+        """
+        if self.column_profile is None:
+            if self.csv_path is not None:
+                self.column_profile = ChunkedColumnProfile.from_csv(self.csv_path, self.chunksize,
+                                                                    **self.read_csv_kwargs)
+            else:
+                self.column_profile = ColumnProfile(self.data)
+        return self.column_profile
+
+    def get_unique_stats(self, approximate=False):
+        """
+        Number of unique values for all features, computed on first use.
+
+        Parameters
+        --------
+        approximate : boolean, default = False
+            Estimate the counts with per-column HyperLogLog sketches instead of the exact column
+            profile. Columns with at most 4096 distinct values are still counted exactly; the
+            others have a relative standard error of about 0.8%.
+        """
+        if self.csv_path is not None:
+            # Only the sketches of the chunks are kept for a CSV file
+            return self.get_column_profile().unique_stats()
+
+        if approximate:
+            if self.unique_sketches is None:
+                self.unique_sketches = hyperloglog.sketch_columns(self.data)
+            counts = pd.Series({column: sketch.count() for column, sketch in self.unique_sketches.items()},
+                               dtype=np.int64)
+            counts.index.name = 'feature'
+            return pd.DataFrame({'nunique': counts}).sort_values('nunique', ascending=True)
+
+        if self.unique_stats is None:
+            self.unique_stats = self.get_column_profile().unique_stats()
+        return self.unique_stats
+
     def identify_missing(self, missing_threshold):
         """Find the features with a fraction of missing values above `missing_threshold`"""
 
         self.missing_threshold = missing_threshold
 
-        # Calculate the fraction of missing in each column 
-        missing_series = self.data.isnull().sum() / self.data.shape[0]
-        self.missing_stats = pd.DataFrame(missing_series).rename(columns={'index': 'feature', 0: 'missing_fraction'})
+        # Read the fraction of missing in each column from the shared profile
+        profile = self.get_column_profile()
+        null_count = profile.null_count if self.csv_path is not None else profile.stats['null_count']
+        missing_series = (null_count / profile.n_rows).rename('missing_fraction')
 
-        # Sort with highest number of missing values on top
-        self.missing_stats = self.missing_stats.sort_values('missing_fraction', ascending=False)
+        # Sorted with highest number of missing values on top
+        self.missing_stats = profile.missing_stats()
 
         # Find the columns with a missing percentage above the threshold
-        record_missing = pd.DataFrame(missing_series[missing_series > missing_threshold]).reset_index().rename(columns=
-                                                                                                               {
-                                                                                                                   'index': 'feature',
-                                                                                                                   0: 'missing_fraction'})
+        record_missing = missing_series[missing_series > missing_threshold].reset_index()
 
         to_drop = list(record_missing['feature'])
 
@@ -142,15 +224,15 @@ class FeatureSelector():
     def identify_single_unique(self):
         """Finds features with only a single unique value. NaNs do not count as a unique value. """
 
-        # Calculate the unique counts in each column
-        unique_counts = self.data.nunique()
-        self.unique_stats = pd.DataFrame(unique_counts).rename(columns={'index': 'feature', 0: 'nunique'})
-        self.unique_stats = self.unique_stats.sort_values('nunique', ascending=True)
-
-        # Find the columns with only one unique count
-        record_single_unique = pd.DataFrame(unique_counts[unique_counts == 1]).reset_index().rename(
-            columns={'index': 'feature',
-                     0: 'nunique'})
+        # Compare every column against its first value, stopping at the first difference;
+        # the full unique counts are only computed on demand by `get_unique_stats`
+        self.unique_stats = None
+        self.unique_sketches = None
+        if self.csv_path is not None:
+            constant = self.get_column_profile().constant_columns()
+        else:
+            constant = constant_columns(self.data)
+        record_single_unique = pd.DataFrame({'feature': constant, 'nunique': 1})
 
         to_drop = list(record_single_unique['feature'])
 
@@ -181,15 +263,21 @@ class FeatureSelector():
         self.correlation_threshold = correlation_threshold
         self.one_hot_correlated = one_hot
 
+        if one_hot and self.csv_path is not None:
+            raise ValueError('One-hot correlations are not available for a CSV file read in chunks.')
+
         # Calculate the correlations between every column
-        if one_hot:
+        if self.csv_path is not None:
+            corr_matrix = self.get_column_profile().correlation()
+
+        elif one_hot:
 
             # One hot encoding
-            features = pd.get_dummies(self.data)
+            features = polars_engine.get_dummies(self.data)
             self.one_hot_features = [column for column in features.columns if column not in self.base_features]
 
-            # Add one hot encoded data to original data
-            self.data_all = pd.concat([features[self.one_hot_features], self.data], axis=1)
+            # Register the one hot encoded columns next to the original data, without copying either
+            self.data_all = ColumnRegistry([(features, self.one_hot_features), (self.data, self.data.columns)])
 
             corr_matrix = pd.get_dummies(features).corr()
 
@@ -199,7 +287,7 @@ class FeatureSelector():
         self.corr_matrix = corr_matrix
 
         # Extract the upper triangle of the correlation matrix
-        upper = corr_matrix.where(np.triu(np.ones(corr_matrix.shape), k=1).astype(np.bool))
+        upper = corr_matrix.where(np.triu(np.ones(corr_matrix.shape), k=1).astype(bool))
 
         # Select the features with correlations above the threshold
         # Need to use the absolute value
@@ -223,7 +311,7 @@ class FeatureSelector():
                                               'corr_value': corr_values})
 
             # Add to dataframe
-            record_collinear = record_collinear.append(temp_df, ignore_index=True)
+            record_collinear = pd.concat([record_collinear, temp_df], ignore_index=True)
 
         self.record_collinear = record_collinear
         self.ops['collinear'] = to_drop
@@ -285,11 +373,11 @@ class FeatureSelector():
             raise ValueError("No training labels provided.")
 
         # One hot encoding
-        features = pd.get_dummies(self.data)
+        features = polars_engine.get_dummies(self.data)
         self.one_hot_features = [column for column in features.columns if column not in self.base_features]
 
-        # Add one hot encoded data to original data
-        self.data_all = pd.concat([features[self.one_hot_features], self.data], axis=1)
+        # Register the one hot encoded columns next to the original data, without copying either
+        self.data_all = ColumnRegistry([(features, self.one_hot_features), (self.data, self.data.columns)])
 
         # Extract feature names
         feature_names = list(features.columns)
@@ -517,7 +605,7 @@ class FeatureSelector():
                 data = self.data_all
 
             else:
-                data = self.data
+                data = ColumnRegistry([(self.data, self.data.columns)])
 
             # Iterate through the specified methods
             for method in methods:
@@ -543,8 +631,8 @@ class FeatureSelector():
 
                 features_to_drop = list(set(features_to_drop) | set(self.one_hot_features))
 
-        # Remove the features and return the data
-        data = data.drop(columns=features_to_drop)
+        # Remove the features and copy only the surviving columns
+        data = data.drop(columns=features_to_drop).materialize()
         self.removed_features = features_to_drop
 
         if not keep_one_hot:
@@ -571,15 +659,18 @@ class FeatureSelector():
         plt.ylabel('Count of Features', size=14);
         plt.title("Fraction of Missing Values Histogram", size=16);
 
-    def plot_unique(self):
-        """Histogram of number of unique values in each feature"""
+    def plot_unique(self, approximate=False):
+        """
+        Histogram of number of unique values in each feature. With `approximate`, the counts
+        of high-cardinality columns are HyperLogLog estimates (see `get_unique_stats`).
+        """
         if self.record_single_unique is None:
             raise NotImplementedError('Unique values have not been calculated. Run `identify_single_unique`')
 
         self.reset_plot()
 
         # Histogram of number of unique values
-        self.unique_stats.plot.hist(edgecolor='k', figsize=(7, 5))
+        self.get_unique_stats(approximate).plot.hist(edgecolor='k', figsize=(7, 5))
         plt.ylabel('Frequency', size=14);
         plt.xlabel('Unique Values', size=14);
         plt.title('Number of Unique Values Histogram', size=16);
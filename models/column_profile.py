@@ -0,0 +1,274 @@
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
+
+from models import polars_engine, statistics
+from models.hyperloglog import HyperLogLog
+
+
+class ColumnProfile:
+    """
+    Per-column statistics of a dataframe computed in a single scan of each column.
+
+    Every column is factorized once; the null count, distinct count and dominant value follow from
+    the codes, and min, max, mean and variance of numeric columns follow from the distinct values
+    weighted by their counts, so no further pass over the rows is needed.
+
+    Columns are independent, so on large frames they are split into contiguous shards profiled
+    in a process pool; joblib memory-maps the numeric blocks of each shard so the workers read
+    shared pages instead of pickled copies. The result is identical to a sequential run.
+
+    With the Polars engine the distinct values and counts of all columns come from multithreaded
+    Polars group-bys instead, in the same first-appearance order, so the statistics are identical.
+
+    Parameters
+    --------
+    data : dataframe
+        Data to profile
+
+    n_jobs : int, default = -1
+        Number of worker processes; -1 uses all cores
+
+    min_parallel_cells : int, default = 5000000
+        Frames with fewer cells than this are profiled in the calling process, where the pool
+        start-up would cost more than it saves
+
+    engine : {'pandas', 'polars', 'auto'}, default = 'pandas'
+        Library computing the value counts; see `polars_engine.use_polars`
+
+    stats : dataframe, default = None
+        Statistics of the columns of `data` computed earlier, for example cached per column;
+        given, no column is scanned
+
+    Attributes
+    --------
+    n_rows : int
+        Number of rows of the profiled data
+
+    stats : dataframe
+        One row per column with 'null_count', 'nunique', 'dominant_value', 'dominant_count',
+        'min', 'max', 'mean' and 'variance' (sample variance; NaN for non-numeric columns)
+    """
+
+    def __init__(self, data, n_jobs=-1, min_parallel_cells=5000000, engine='pandas', stats=None):
+        self.data = data
+        self.n_rows = data.shape[0]
+        if stats is not None:
+            self.stats = stats
+            return
+
+        n_shards = min(effective_n_jobs(n_jobs), data.shape[1])
+        if polars_engine.use_polars(engine):
+            profiles = [self.profile_levels(*counts, numeric=pd.api.types.is_numeric_dtype(data.iloc[:, position]))
+                        if counts is not None else self.profile_column(data.iloc[:, position])
+                        for position, counts in enumerate(polars_engine.level_counts(data))]
+        elif n_shards > 1 and data.size >= min_parallel_cells:
+            shards = np.array_split(np.arange(data.shape[1]), n_shards)
+            shard_profiles = Parallel(n_jobs=n_shards)(
+                delayed(profile_shard)(data.iloc[:, shard]) for shard in shards)
+            profiles = [profile for shard_profile in shard_profiles for profile in shard_profile]
+        else:
+            profiles = profile_shard(data)
+
+        # A new index, so naming it leaves the columns of `data` untouched
+        self.stats = pd.DataFrame(profiles, index=pd.Index(data.columns, name='feature'))
+
+    @staticmethod
+    def profile_column(series):
+        """Statistics of one column from a single factorize."""
+        codes, levels = pd.factorize(series)
+        counts = np.bincount(codes[codes >= 0], minlength=len(levels))
+        return ColumnProfile.profile_levels(levels, counts, int((codes < 0).sum()),
+                                            numeric=pd.api.types.is_numeric_dtype(series))
+
+    @staticmethod
+    def profile_levels(levels, counts, null_count, numeric):
+        """Statistics of one column from its distinct values in order of first appearance and their counts."""
+        profile = {'null_count': null_count, 'nunique': len(levels), 'dominant_value': np.nan,
+                   'dominant_count': 0, 'min': np.nan, 'max': np.nan, 'mean': np.nan, 'variance': np.nan}
+
+        if len(levels) == 0:
+            return profile
+
+        dominant = int(np.argmax(counts))
+        profile['dominant_value'] = levels[dominant]
+        profile['dominant_count'] = int(counts[dominant])
+
+        if numeric:
+            values = np.asarray(levels, dtype=np.float64)
+            n_values = counts.sum()
+            mean = (values * counts).sum() / n_values
+            profile['min'] = values.min()
+            profile['max'] = values.max()
+            profile['mean'] = mean
+            # Two-pass variance over the distinct values weighted by their counts
+            if n_values > 1:
+                profile['variance'] = (counts * (values - mean) ** 2).sum() / (n_values - 1)
+
+        return profile
+
+    def missing_stats(self):
+        """Fraction of missing values for every column, highest first."""
+        missing_fraction = self.stats['null_count'] / self.n_rows
+        return pd.DataFrame({'missing_fraction': missing_fraction}).sort_values('missing_fraction', ascending=False)
+
+    def unique_stats(self):
+        """Number of distinct non-missing values for every column, lowest first."""
+        return pd.DataFrame({'nunique': self.stats['nunique']}).sort_values('nunique', ascending=True)
+
+    def dominant_fraction(self):
+        """Fraction of the non-missing values taken by the most frequent value of every column."""
+        non_missing = self.n_rows - self.stats['null_count']
+        return (self.stats['dominant_count'] / non_missing.where(non_missing > 0)).astype(np.float64)
+
+
+def profile_shard(data):
+    """Profiles of the columns of one shard of a dataframe, in column order."""
+    return [ColumnProfile.profile_column(data.iloc[:, position]) for position in range(data.shape[1])]
+
+
+def is_constant(series, block_size=1024, max_block_size=1 << 20):
+    """
+    Whether a column has exactly one distinct non-missing value, without hashing its values.
+    The column is compared against its first non-missing value in blocks that double in size,
+    stopping at the first block with a different value, so most varying columns are decided
+    from their first rows. Categorical columns are compared on their integer codes.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        values, missing = series.cat.codes.to_numpy(), -1
+    else:
+        values, missing = series.to_numpy(), None
+    first = None
+    start = 0
+    while start < len(values):
+        block = values[start:start + block_size]
+        if missing is not None:
+            observed = block != missing
+        elif block.dtype.kind in 'iub':
+            observed = np.ones(len(block), dtype=bool)
+        else:
+            observed = ~pd.isna(block)
+        if first is None and observed.any():
+            first = block[np.argmax(observed)]
+        if first is not None and ((block != first) & observed).any():
+            return False
+        start += block_size
+        block_size = min(2 * block_size, max_block_size)
+
+    return first is not None
+
+
+def constant_columns(data):
+    """Columns of a dataframe with a single distinct non-missing value."""
+    return [column for column in data.columns if is_constant(data[column])]
+
+
+class ChunkedColumnProfile:
+    """
+    Mergeable per-column statistics of a table read in chunks, for data too large to load.
+
+    Each chunk adds its null counts, whether each column still holds a single value, a HyperLogLog
+    sketch of its distinct values and the pairwise-complete moments of its numeric
+    columns. All of them merge without revisiting rows (sums, Chan updates and sketch merges), so
+    profiles of different chunks or files can be combined with `merge`, and memory stays bounded
+    by the number of columns.
+
+    Parameters
+    --------
+    columns : list
+        Column names of the table
+
+    numeric_columns : list
+        Columns whose pairwise correlations are accumulated
+    """
+
+    def __init__(self, columns, numeric_columns):
+        self.columns = list(columns)
+        self.numeric_columns = list(numeric_columns)
+        self.n_rows = 0
+        self.null_count = pd.Series(0, index=self.columns, dtype=np.int64)
+        self.null_count.index.name = 'feature'
+        self.first_value = {}
+        self.varying = set()
+        self.sketches = {column: HyperLogLog() for column in self.columns}
+
+        # Pairwise-complete count, mean, M2 and comoment of the numeric columns
+        n_numeric = len(self.numeric_columns)
+        self.pair_moments = tuple(np.zeros((n_numeric, n_numeric)) for _ in range(4))
+
+    @classmethod
+    def from_csv(cls, path, chunksize=100000, **read_csv_kwargs):
+        """Profile a CSV file chunk by chunk; numeric columns are those parsed as numbers in the first chunk."""
+        profile = None
+        for chunk in pd.read_csv(path, chunksize=chunksize, **read_csv_kwargs):
+            if profile is None:
+                profile = cls(chunk.columns, chunk.select_dtypes(include=['number', 'bool']).columns)
+            profile.update(chunk)
+
+        return profile
+
+    def update(self, chunk):
+        """Add the statistics of one chunk with the profiled columns."""
+        self.n_rows += chunk.shape[0]
+        self.null_count += chunk.isnull().sum().to_numpy()
+
+        for position, column in enumerate(self.columns):
+            series = chunk.iloc[:, position]
+            if pd.api.types.is_numeric_dtype(series):
+                # A column may parse as integers in one chunk and floats in another
+                series = series.astype(np.float64)
+            self.sketches[column].update(series)
+
+            if column in self.varying:
+                continue
+            observed = series.dropna()
+            if len(observed) == 0:
+                continue
+            first = self.first_value.setdefault(column, observed.iloc[0])
+            if (observed != first).any():
+                self.varying.add(column)
+
+        numeric = chunk[self.numeric_columns].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+        self.pair_moments = statistics.merge_pairwise_moments(self.pair_moments, statistics.pairwise_moments(numeric))
+
+    def merge(self, other):
+        """Combine with the profile of other chunks of the same table."""
+        if other.columns != self.columns or other.numeric_columns != self.numeric_columns:
+            raise ValueError('Only profiles of the same columns can be merged.')
+
+        merged = ChunkedColumnProfile(self.columns, self.numeric_columns)
+        merged.n_rows = self.n_rows + other.n_rows
+        merged.null_count = self.null_count + other.null_count
+        merged.sketches = {column: self.sketches[column].merge(other.sketches[column]) for column in self.columns}
+
+        merged.varying = self.varying | other.varying
+        merged.first_value = {**other.first_value, **self.first_value}
+        for column in set(self.first_value) & set(other.first_value):
+            if self.first_value[column] != other.first_value[column]:
+                merged.varying.add(column)
+
+        merged.pair_moments = statistics.merge_pairwise_moments(self.pair_moments, other.pair_moments)
+
+        return merged
+
+    def missing_stats(self):
+        """Fraction of missing values for every column, highest first."""
+        missing_fraction = self.null_count / self.n_rows
+        return pd.DataFrame({'missing_fraction': missing_fraction}).sort_values('missing_fraction', ascending=False)
+
+    def constant_columns(self):
+        """Columns with a single distinct non-missing value."""
+        return [column for column in self.columns if column in self.first_value and column not in self.varying]
+
+    def unique_stats(self):
+        """Number of distinct non-missing values for every column (exact up to 4096), lowest first."""
+        counts = pd.Series({column: sketch.count() for column, sketch in self.sketches.items()}, dtype=np.int64)
+        counts.index.name = 'feature'
+        return pd.DataFrame({'nunique': counts}).sort_values('nunique', ascending=True)
+
+    def correlation(self):
+        """Pairwise-complete Pearson correlation matrix of the numeric columns, as DataFrame.corr computes it."""
+        count, _, m2, comoment = self.pair_moments
+        corr = statistics.moments_correlation(count, m2, comoment)
+
+        return pd.DataFrame(corr, index=self.numeric_columns, columns=self.numeric_columns)
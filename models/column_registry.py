@@ -0,0 +1,63 @@
+import pandas as pd
+
+
+class ColumnRegistry:
+    """
+    Lazy view of named columns drawn from several dataframes, such as the one-hot dummies and
+    the original data.
+
+    The registry only records which frame holds each column, so building it and dropping
+    columns from it copy no data; the surviving columns are copied once, by `materialize`,
+    when the result is requested or saved.
+
+    Parameters
+    --------
+    sources : list of (dataframe, list) pairs
+        Frames and the columns taken from each, in column order. A name that is already
+        registered keeps its first source.
+    """
+
+    def __init__(self, sources=()):
+        self.sources = {}
+        for frame, columns in sources:
+            for column in columns:
+                self.sources.setdefault(column, frame)
+
+    @property
+    def columns(self):
+        return list(self.sources)
+
+    @property
+    def shape(self):
+        n_rows = next(iter(self.sources.values())).shape[0] if self.sources else 0
+        return n_rows, len(self.sources)
+
+    def __len__(self):
+        return len(self.sources)
+
+    def __contains__(self, column):
+        return column in self.sources
+
+    def drop(self, columns, errors='raise'):
+        """Registry without `columns`; with errors='ignore', names that are not registered are skipped."""
+        columns = set(columns)
+        missing = columns - self.sources.keys()
+        if missing and errors == 'raise':
+            raise KeyError('%s not found in the registry' % sorted(missing))
+
+        registry = ColumnRegistry()
+        registry.sources = {column: frame for column, frame in self.sources.items() if column not in columns}
+        return registry
+
+    def materialize(self):
+        """Dataframe of the registered columns, selecting each run of columns from the same frame at once."""
+        runs = []
+        for column, frame in self.sources.items():
+            if runs and runs[-1][0] is frame:
+                runs[-1][1].append(column)
+            else:
+                runs.append((frame, [column]))
+
+        if not runs:
+            return pd.DataFrame()
+        return pd.concat([frame[columns] for frame, columns in runs], axis=1)
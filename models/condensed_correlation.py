@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+
+from models import statistics
+
+
+class CondensedCorrelation:
+    """
+    Symmetric correlation matrix stored as its strict upper triangle in float32, row by row
+    (the condensed layout of scipy's squareform), which takes an eighth of the memory of the
+    dense float64 matrix with its redundant lower triangle and diagonal.
+
+    Parameters
+    --------
+    values : array
+        Condensed upper triangle, n_features * (n_features - 1) / 2 correlations
+
+    columns : index
+        Feature names
+    """
+
+    def __init__(self, values, columns):
+        self.values = values
+        self.columns = pd.Index(columns)
+        n_features = len(self.columns)
+        # Position of the first pair (i, i + 1) of every row i in `values`
+        rows = np.arange(n_features, dtype=np.int64)
+        self.offsets = rows * n_features - rows * (rows + 1) // 2
+
+    @classmethod
+    def from_features(cls, features, tile_size=256):
+        """
+        Pairwise-complete correlations of the columns of a dataframe, computed in tiles of
+        `tile_size` rows of the triangle, so at most tile_size x n_features float64 correlations
+        exist at once.
+        """
+        values = features.to_numpy(dtype=np.float64)
+        n_features = values.shape[1]
+        condensed = np.empty(n_features * (n_features - 1) // 2, dtype=np.float32)
+        correlation = cls(condensed, features.columns)
+
+        for start in range(0, n_features, tile_size):
+            stop = min(start + tile_size, n_features)
+            # Only the columns from `start` on, the ones in the upper triangle of these rows
+            block = statistics.cross_corr(values[:, start:stop], values[:, start:])
+            for row in range(start, stop):
+                offset = correlation.offsets[row]
+                condensed[offset:offset + n_features - row - 1] = block[row - start, row - start + 1:]
+
+        return correlation
+
+    @property
+    def shape(self):
+        return len(self.columns), len(self.columns)
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes
+
+    def pairs(self, positions):
+        """Row and column of the pairs at `positions` of the condensed triangle."""
+        rows = np.searchsorted(self.offsets, positions, side='right') - 1
+        return rows, positions - self.offsets[rows] + rows + 1
+
+    def pairs_above(self, threshold):
+        """Rows, columns and correlations of the pairs with a correlation magnitude above `threshold`."""
+        with np.errstate(invalid='ignore'):
+            positions = np.flatnonzero(np.abs(self.values) > threshold)
+        rows, columns = self.pairs(positions)
+        return rows, columns, self.values[positions].astype(np.float64)
+
+    def column_maxima(self):
+        """Largest correlation magnitude of every feature with an earlier feature (NaN for none)."""
+        n_features = len(self.columns)
+        maxima = np.full(n_features, np.nan)
+        for row in range(n_features - 1):
+            offset = self.offsets[row]
+            segment = np.abs(self.values[offset:offset + n_features - row - 1])
+            maxima[row + 1:] = np.fmax(maxima[row + 1:], segment)
+        return maxima
+
+    def to_frame(self):
+        """Dense float64 correlation matrix as a dataframe, for plotting."""
+        n_features = len(self.columns)
+        dense = np.full((n_features, n_features), np.nan)
+        rows, columns = np.triu_indices(n_features, k=1)
+        dense[rows, columns] = self.values
+        dense[columns, rows] = self.values
+        # A feature correlates with itself unless it is constant, which shows as NaN in every pair
+        diagonal = np.flatnonzero(~np.isnan(dense).all(axis=1))
+        dense[diagonal, diagonal] = 1.0
+
+        return pd.DataFrame(dense, index=self.columns, columns=self.columns)
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+
+
+def plan_dtypes(data, max_category_fraction=0.5, rtol=0):
+    """
+    Smallest dtype of every column of `data` that holds its values: integers get the narrowest
+    signed integer type covering their range, float64 columns become float32 when every value
+    stays within a relative `rtol` of the original, and string columns with at most
+    `max_category_fraction` distinct values per row become categoricals. By default every value
+    is kept exactly, so only floats that round-trip through float32 narrow. CSV decimals rarely
+    do; a positive `rtol` such as 1e-6 (about the 7 significant digits float32 holds) opts in to
+    narrowing them at the cost of moving every value by up to `rtol`.
+
+    Parameters
+    --------
+    data : dataframe
+        Data as read, with the default 64-bit and object types
+
+    max_category_fraction : float, default = 0.5
+        Largest ratio of distinct values to rows of a string column converted to a categorical;
+        ID-like columns above it stay strings, where a categorical would only add its codes
+
+    rtol : float, default = 0
+        Largest relative change of a float value narrowed to float32; 0 narrows only columns
+        whose values round-trip exactly
+
+    Returns
+    --------
+    plan : dict
+        New dtype of every column whose type narrows
+    """
+    plan = {}
+    for column in data.columns:
+        series = data[column]
+        if len(series) == 0 or pd.api.types.is_extension_array_dtype(series.dtype) and not \
+                pd.api.types.is_string_dtype(series.dtype):
+            continue
+
+        if pd.api.types.is_integer_dtype(series.dtype):
+            values = series.to_numpy()
+            # Signed types only, so differences of non-negative columns cannot wrap around
+            for dtype in (np.int8, np.int16, np.int32):
+                info = np.iinfo(dtype)
+                if np.dtype(dtype).itemsize >= values.dtype.itemsize:
+                    break
+                if info.min <= values.min() and values.max() <= info.max:
+                    plan[column] = np.dtype(dtype)
+                    break
+
+        elif series.dtype == np.float64:
+            values = series.to_numpy()
+            with np.errstate(over='ignore'):
+                narrowed = values.astype(np.float32)
+            # Values beyond the float32 range overflow to infinity and are never close
+            if np.allclose(narrowed.astype(np.float64), values, rtol=rtol, atol=0, equal_nan=True):
+                plan[column] = np.dtype(np.float32)
+
+        elif pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype):
+            if series.nunique() <= max_category_fraction * len(series):
+                plan[column] = 'category'
+
+    return plan
+
+
+def optimize_dtypes(data, max_category_fraction=0.5, rtol=0):
+    """
+    Convert `data` to the dtypes of `plan_dtypes` and report the memory saved.
+
+    Returns
+    --------
+    data : dataframe
+        Data with narrowed dtypes and the same values; floats within `rtol` if it is positive
+
+    report : dict
+        'memory_before' and 'memory_after' in bytes (strings measured deeply) and 'plan'
+    """
+    memory_before = int(data.memory_usage(deep=True).sum())
+    plan = plan_dtypes(data, max_category_fraction, rtol)
+    if plan:
+        data = data.astype(plan)
+    memory_after = int(data.memory_usage(deep=True).sum())
+
+    return data, {'memory_before': memory_before, 'memory_after': memory_after, 'plan': plan}
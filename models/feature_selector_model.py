@@ -2,17 +2,87 @@ from itertools import chain
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
 from PyQt5.QtCore import pyqtSignal, QObject, QThread
+from scipy.stats import binom
 from sklearn.inspection import permutation_importance
+from sklearn.linear_model import Lasso, LogisticRegression
 from sklearn.model_selection import train_test_split
 import lightgbm as lgb
 import gc
 
+from models import hyperloglog, l1_path, statistics
+from models.column_profile import ColumnProfile, constant_columns
+from models.column_registry import ColumnRegistry
+from models.condensed_correlation import CondensedCorrelation
+from models.memory_monitor import PeakRSSMonitor
+from models.one_hot import OneHotEncoding
+
+# LightGBM evaluation metrics for which a larger validation score is better
+HIGHER_IS_BETTER_METRICS = ['auc', 'average_precision', 'map', 'ndcg']
+
+
+def fit_validation_score(train_features, train_labels, valid_features, valid_labels, columns, task, eval_metric):
+    """Train a GBM with early stopping on `columns` and return its best validation score."""
+    lgb_params = {
+        'n_jobs': 1,
+        'n_estimators': 2000,
+        'learning_rate': 0.05,
+        'verbose': -1
+    }
+    if task == 'classification':
+        model = lgb.LGBMClassifier(**lgb_params)
+    else:
+        model = lgb.LGBMRegressor(**lgb_params)
+
+    model.fit(train_features[:, columns], train_labels, eval_metric=eval_metric,
+              eval_set=[(valid_features[:, columns], valid_labels)],
+              callbacks=[lgb.callback.early_stopping(stopping_rounds=100, verbose=False)])
+
+    return model.best_score_['valid_0'][eval_metric]
+
+
+def fit_subsample_support(features, labels, sample_indices, task, estimator, alpha):
+    """Fit an L1 linear model or a shallow GBM on one subsample and return the selected feature mask."""
+    train_features, train_labels = features[sample_indices], labels[sample_indices]
+
+    if estimator == 'l1':
+        if task == 'classification':
+            # C is the inverse of alpha on the Lasso scale of the data-fit term
+            model = LogisticRegression(l1_ratio=1, solver='liblinear', C=1.0 / (alpha * len(sample_indices)))
+        else:
+            model = Lasso(alpha=alpha)
+        model.fit(train_features, train_labels)
+        return np.any(np.atleast_2d(model.coef_) != 0, axis=0)
+
+    lgb_params = {
+        'n_jobs': 1,
+        'n_estimators': 100,
+        'learning_rate': 0.1,
+        'max_depth': 3,
+        'num_leaves': 8,
+        'verbose': -1
+    }
+    if task == 'classification':
+        model = lgb.LGBMClassifier(**lgb_params)
+    else:
+        model = lgb.LGBMRegressor(**lgb_params)
+    model.fit(train_features, train_labels)
+    return model.feature_importances_ > 0
+
 
 class FeatureSelectorModel(QObject):
     # Signal definitions
     method_result_signal = pyqtSignal(list, str)
     final_results_signal = pyqtSignal(dict)
+    # Methods in ascending order of cost, the order in which a cascade runs them
+    cascade_order = ['Missing Values', 'Single Unique Value', 'Near Constant', 'Univariate Statistics',
+                     'Target Leakage', 'Distribution Drift', 'Low Mutual Information', 'Collinear Features',
+                     'mRMR', 'L1 Path', 'Zero Importance Features', 'Low Importance Features', 'Validation Curve',
+                     'Stability Selection', 'Boruta Shadow Features']
+    # Removal methods that identify one-hot encoded features
+    one_hot_removal_methods = ['zero_importance', 'low_importance', 'boruta', 'validation_curve', 'stability',
+                               'l1_path']
 
     def __init__(self):
         super().__init__()
@@ -26,86 +96,409 @@ class FeatureSelectorModel(QObject):
         self.correlation_threshold = None
         self.corr_matrix = None
         self.unique_stats = None
+        self.unique_sketches = None
         self.missing_threshold = None
         self.missing_stats = None
         self.result_data = None
         self.original_features = None
         self.data = None
+        # Other loaded datasets with the same schema, compared against `data` for drift
+        self.comparison_data = {}
+        # Shared per-column statistics of `data`, computed on first use
+        self.column_profile = None
+        # Version of every column of the loaded data, bumped when a table edit touches the column.
+        # Cached profile rows, correlations and one-hot blocks remember the version they were computed
+        # from, so after an edit only the touched columns are recomputed.
+        self.loaded_data = None
+        self.data_version = 0
+        self.column_versions = {}
+        self.profile_stats = None
+        self.profile_versions = {}
+        self.corr_versions = {}
+        # One-hot encoding shared by the methods that need it
+        self.one_hot = OneHotEncoding()
+        # Set when the table is edited after the GBM importances were computed
+        self.feature_importances_stale = False
+        # Settings and feature versions the GBM importances were computed with
+        self.importance_key = None
+        # Upper-triangle pairs of `corr_matrix` sorted by correlation magnitude
+        self.corr_pairs = None
+        # Bytes a run may use for intermediates; None for no budget. Over budget, correlations are
+        # computed in tiles into `corr_condensed` instead of `corr_matrix`, the GBM input is float32,
+        # Boruta trains fewer rounds at once and caches are released after every method.
+        self.memory_budget = None
+        self.corr_condensed = None
+        # Highest resident set size of the process during the last run of `select_features`
+        self.peak_rss = None
+        # Features dropped by earlier methods of a cascade, hidden from the later ones
+        self.pruned_features = set()
+        # Library for the column statistics and one-hot encoding, set from the dialog: 'pandas', or the
+        # opt-in 'polars' or 'auto' (see polars_engine.use_polars)
+        self.engine = 'pandas'
+        # Implementation of the loop-shaped kernels: 'auto' uses the compiled Numba kernels when installed
+        self.kernel_backend = 'auto'
         # Dataframes recording information about features to remove
         self.record_missing = None
         self.record_single_unique = None
         self.record_collinear = None
         self.record_zero_importance = None
         self.record_low_importance = None
+        self.record_boruta = None
+        self.record_validation_curve = None
+        self.record_univariate = None
+        self.univariate_stats = None
+        self.record_low_mutual_info = None
+        self.mutual_info_stats = None
+        self.record_mrmr = None
+        self.mrmr_ranking = None
+        self.record_stability = None
+        self.stability_scores = None
+        self.stability_threshold = None
+        self.record_leakage = None
+        self.leakage_stats = None
+        self.record_near_constant = None
+        self.near_constant_stats = None
+        self.record_drift = None
+        self.drift_stats = None
+        self.record_l1_path = None
+        self.l1_path_stats = None
+        # Cached regularization path: alphas, coefficients and the settings they were computed with
+        self.regularization_path = None
+        self.l1_path_n_features = None
         self.feature_importances = None
+        self.validation_curve = None
+        self.validation_curve_n_features = None
         # Dictionary to hold removal operations
         self.removal_ops = {}
 
-    def load_data(self, data):
+    def load_data(self, data, comparison_data=None):
+        if data is not self.loaded_data:
+            # New data: every cached statistic belongs to the previous table
+            self.loaded_data = data
+            self.column_versions = {column: self.data_version for column in data.columns}
+            self.profile_stats = None
+            self.profile_versions = {}
+            self.pruned_features = set()
+            self.missing_stats = None
+            self.corr_matrix = None
+            self.corr_condensed = None
+            self.corr_versions = {}
+            self.one_hot.clear()
+            self.feature_importances = None
+            self.feature_importances_stale = False
+            self.regularization_path = None
         self.data = data
         self.base_features = list(data.columns)
+        self.comparison_data = comparison_data if comparison_data is not None else {}
+
+    def update_columns(self, data, changed=(), removed=()):
+        """
+        Record an in-place edit of the loaded data. The cached statistics of the `changed` and
+        `removed` columns are discarded, so the next run recomputes their profile, their row and
+        column of the correlation matrix and their one-hot block, and reuses everything else.
+        GBM importances depend on all the columns at once, so any edit marks them stale until
+        `identify_zero_importance` runs again.
+
+        Parameters
+        --------
+        data : dataframe
+            The edited table; edits of a table other than the loaded one need no bookkeeping
+
+        changed : list
+            Columns whose values were edited or that were added (a renamed column under its new name)
+
+        removed : list
+            Columns that were deleted (a renamed column under its old name)
+        """
+        if data is not self.loaded_data:
+            return
+
+        self.data_version += 1
+        for column in removed:
+            self.column_versions.pop(column, None)
+        for column in changed:
+            self.column_versions[column] = self.data_version
+        for column in chain(changed, removed):
+            self.profile_versions.pop(column, None)
+        self.one_hot.discard(chain(changed, removed))
+        if self.profile_stats is not None:
+            self.profile_stats = self.profile_stats.drop(index=list(removed), errors='ignore')
+
+        self.column_profile = None
+        self.unique_stats = None
+        self.unique_sketches = None
+        self.regularization_path = None
+        if self.feature_importances is not None:
+            self.feature_importances_stale = True
+
+    def stale_columns(self, columns, cached_versions):
+        """The `columns` whose cached version differs from their current one (or that have none)."""
+        current = self.feature_versions(columns)
+        return [column for column in columns
+                if current[column] is None or cached_versions.get(column) != current[column]]
+
+    def feature_versions(self, features):
+        """Version of every feature: its column's version, or its source column's for a one-hot feature."""
+        sources = {feature: column for column, (_, block) in self.one_hot.blocks.items() for feature in block.columns}
+        return {feature: self.column_versions.get(sources.get(feature, feature)) for feature in features}
+
+    def get_column_profile(self):
+        """
+        Return the column profile of `data`. Profile rows are cached per column, so only the
+        columns that are new or were edited since they were last profiled are scanned.
+        """
+        if self.column_profile is not None and self.column_profile.data is self.data:
+            return self.column_profile
+
+        stale = self.stale_columns(list(self.data.columns), self.profile_versions)
+        if stale:
+            stats = ColumnProfile(self.data if len(stale) == self.data.shape[1] else self.data[stale],
+                                  engine=self.engine).stats
+            if self.profile_stats is not None:
+                stats = pd.concat([self.profile_stats.drop(index=stale, errors='ignore'), stats])
+            self.profile_stats = stats
+            self.profile_versions.update(self.feature_versions(stale))
+
+        self.column_profile = ColumnProfile(self.data, stats=self.profile_stats.loc[list(self.data.columns)])
+        return self.column_profile
+
+    def get_one_hot(self):
+        """
+        One-hot encoding of `data`, identical to pd.get_dummies(data) by default. Served from the
+        shared encoding, so only categorical columns that are new or edited are encoded. Columns
+        above the encoding's cardinality cap get a single frequency, hashed or ordinal encoding.
+        """
+        # The cardinality cap reads the distinct counts from the cached column profile
+        cardinality = self.get_column_profile().stats['nunique'] if self.one_hot.max_levels is not None else None
+        return self.one_hot.encode(self.data, self.column_versions, self.engine, self.pruned_features, cardinality)
+
+    def get_corr_matrix(self, numeric_features):
+        """
+        Pairwise-complete correlation matrix of `numeric_features`. Rows and columns of the previous
+        matrix are reused for features whose columns were not edited since; only the rows and
+        columns of new or edited features are computed, against every feature.
+        """
+        features = list(numeric_features.columns)
+        stale = self.stale_columns(features, self.corr_versions)
+        if self.corr_matrix is not None and not stale and list(self.corr_matrix.columns) == features:
+            return self.corr_matrix
+        values = numeric_features.to_numpy(dtype=np.float64)
+
+        if self.corr_matrix is None or len(stale) == len(features):
+            corr = statistics.pairwise_corr(values)
+        else:
+            corr = self.corr_matrix.reindex(index=features, columns=features).to_numpy(dtype=np.float64, copy=True)
+            if stale:
+                positions = numeric_features.columns.get_indexer(stale)
+                block = statistics.cross_corr(values[:, positions], values)
+                corr[positions, :] = block
+                corr[:, positions] = block.T
+
+        self.corr_versions = self.feature_versions(features)
+        return pd.DataFrame(corr, index=numeric_features.columns, columns=numeric_features.columns)
+
+    def get_unique_stats(self, approximate=False):
+        """
+        Number of unique values for all features, computed on first use.
 
-    def select_features(self, selected_methods_and_params, target_column_name, keep_one_hot=True):
+        Parameters
+        --------
+        approximate : boolean, default = False
+            Estimate the counts with per-column HyperLogLog sketches instead of the exact column
+            profile. Columns with at most 4096 distinct values are still counted exactly; the
+            others have a relative standard error of about 0.8%.
+        """
+        if approximate:
+            if self.unique_sketches is None:
+                self.unique_sketches = hyperloglog.sketch_columns(self.data)
+            counts = pd.Series({column: sketch.count() for column, sketch in self.unique_sketches.items()},
+                               dtype=np.int64)
+            counts.index.name = 'feature'
+            return pd.DataFrame({'nunique': counts}).sort_values('nunique', ascending=True)
+
+        if self.unique_stats is None:
+            self.unique_stats = self.get_column_profile().unique_stats()
+        return self.unique_stats
+
+    def select_features(self, selected_methods_and_params, target_column_name, keep_one_hot=True, cascade=False):
+        """
+        Run the selected methods and remove the features they identify.
+
+        Parameters
+        --------
+        selected_methods_and_params : dict
+            Parameters of every method to run, keyed by the method name shown in the dialog
+
+        target_column_name : string
+            Column holding the labels
+
+        keep_one_hot : boolean, default = True
+            Whether or not to keep one-hot encoded features
+
+        cascade : boolean, default = False
+            Run the methods in ascending order of cost (`cascade_order`), each on the features
+            that survived the previous ones, so the expensive methods never process features a
+            cheap filter already dropped. The summary attributes every drop to the method that
+            caught it first.
+        """
         self.labels = self.data[target_column_name]  # Extracting the target column as labels
         self.data = self.data.drop(columns=[target_column_name])  # Dropping the target column from the data
-        selected_removal_methods = []
         all_methods = ['Missing Values', 'Single Unique Value', 'Collinear Features', 'Zero Importance Features',
-                       'Low Importance Features']
-
-        for method, params in selected_methods_and_params.items():
-            if QThread.currentThread().isInterruptionRequested():
+                       'Low Importance Features', 'Boruta Shadow Features', 'Validation Curve',
+                       'Univariate Statistics', 'Low Mutual Information', 'mRMR', 'Stability Selection',
+                       'Target Leakage', 'Near Constant', 'Distribution Drift', 'L1 Path']
+
+        monitor = PeakRSSMonitor().start()
+        try:
+            run = self.run_methods(selected_methods_and_params, cascade)
+            if run is None:
                 return
+            selected_removal_methods, caught = run
+
+            # If all methods are selected
+            if set(all_methods) == set(selected_methods_and_params.keys()):
+                selected_removal_methods = 'all'
+
+            # Finally, remove the features based on the results of all methods
+            removal_summary = self.remove_features(selected_removal_methods, keep_one_hot)
+            if self.one_hot.capped:
+                removal_summary['removal_summary'].append(
+                    'Encoded with %s encoding instead of one-hot (more than %d levels): %s' % (
+                        self.one_hot.high_cardinality, self.one_hot.max_levels,
+                        ', '.join('%s (%d levels)' % capped for capped in self.one_hot.capped.items())))
+            if cascade:
+                for method, features in caught.items():
+                    removal_summary['removal_summary'].append(
+                        f'{method} caught {len(features)} features first: {", ".join(features)}')
+
+            self.peak_rss = monitor.stop()
+            if self.peak_rss is not None:
+                budget = '' if self.memory_budget is None else \
+                    ' (memory budget %.1f MB)' % (self.memory_budget / 2 ** 20)
+                removal_summary['removal_summary'].append('Peak RSS during the run: %.1f MB%s' % (
+                    self.peak_rss / 2 ** 20, budget))
+                print(removal_summary['removal_summary'][-1])
+            # Emit signal to update the GUI with the final results
+            self.final_results_signal.emit(removal_summary)
+            # Return the result data with the same feature order as the original data
+            return self.result_data
+        finally:
+            # Stops the sampling thread after an interruption or a failing method as well
+            monitor.stop()
+
+    def run_methods(self, selected_methods_and_params, cascade=False):
+        """
+        Run the selected methods of `select_features` on the loaded data, without the target.
 
-            # Match the method name with the appropriate function call
-            if method == 'Missing Values':
-                selected_removal_methods.append('missing')
-                to_drop, details = self.identify_missing(params['missing_threshold'])
-            elif method == 'Single Unique Value':
-                selected_removal_methods.append('single_unique')
-                to_drop, details = self.identify_single_unique()
-            elif method == 'Collinear Features':
-                selected_removal_methods.append('collinear')
-                to_drop, details = self.identify_collinear(params['correlation_threshold'], params['one_hot'])
-            elif method == 'Zero Importance Features':
-                selected_removal_methods.append('zero_importance')
-                to_drop, details = self.identify_zero_importance(**params)  # Using all params here
-            elif method == 'Low Importance Features':
-                selected_removal_methods.append('low_importance')
-                to_drop, details = self.identify_low_importance(params['cumulative_importance'])
-            else:
-                continue
+        Returns
+        --------
+        selected_removal_methods : list
+            Removal operation of every method run
+
+        caught : dict
+            Features every method caught first, in a cascade
+
+        None is returned instead when the run was interrupted. Whether the methods finish, are
+        interrupted or raise, the full data is restored and the pruned features are forgotten,
+        so a failed cascade never hides features from the next run.
+        """
+        methods = list(selected_methods_and_params)
+        full_data = self.data
+        selected_removal_methods = []
+        caught = {}
+        if cascade:
+            methods.sort(key=lambda name: self.cascade_order.index(name) if name in self.cascade_order
+                         else len(self.cascade_order))
+
+        try:
+            for method in methods:
+                params = selected_methods_and_params[method]
+                if QThread.currentThread().isInterruptionRequested():
+                    return None
+
+                if cascade and self.pruned_features:
+                    # Only the survivors of the previous methods are passed on
+                    self.data = full_data.drop(columns=[column for column in full_data.columns
+                                                        if column in self.pruned_features])
+
+                # Match the method name with the appropriate function call
+                if method == 'Missing Values':
+                    selected_removal_methods.append('missing')
+                    to_drop, details = self.identify_missing(params['missing_threshold'])
+                elif method == 'Single Unique Value':
+                    selected_removal_methods.append('single_unique')
+                    to_drop, details = self.identify_single_unique()
+                elif method == 'Collinear Features':
+                    selected_removal_methods.append('collinear')
+                    to_drop, details = self.identify_collinear(params['correlation_threshold'], params['one_hot'])
+                elif method == 'Zero Importance Features':
+                    selected_removal_methods.append('zero_importance')
+                    to_drop, details = self.identify_zero_importance(**params)  # Using all params here
+                elif method == 'Low Importance Features':
+                    selected_removal_methods.append('low_importance')
+                    to_drop, details = self.identify_low_importance(params['cumulative_importance'])
+                elif method == 'Boruta Shadow Features':
+                    selected_removal_methods.append('boruta')
+                    to_drop, details = self.identify_boruta(**params)
+                elif method == 'Validation Curve':
+                    selected_removal_methods.append('validation_curve')
+                    to_drop, details = self.identify_validation_curve(**params)
+                elif method == 'Univariate Statistics':
+                    selected_removal_methods.append('univariate')
+                    to_drop, details = self.identify_univariate(**params)
+                elif method == 'Low Mutual Information':
+                    selected_removal_methods.append('low_mutual_info')
+                    to_drop, details = self.identify_low_mutual_info(**params)
+                elif method == 'mRMR':
+                    selected_removal_methods.append('mrmr')
+                    to_drop, details = self.identify_mrmr(**params)
+                elif method == 'Stability Selection':
+                    selected_removal_methods.append('stability')
+                    to_drop, details = self.identify_stability(**params)
+                elif method == 'Target Leakage':
+                    selected_removal_methods.append('leakage')
+                    to_drop, details = self.identify_leakage(**params)
+                elif method == 'Near Constant':
+                    selected_removal_methods.append('near_constant')
+                    to_drop, details = self.identify_near_constant(**params)
+                elif method == 'Distribution Drift':
+                    selected_removal_methods.append('drift')
+                    to_drop, details = self.identify_drift(**params)
+                elif method == 'L1 Path':
+                    selected_removal_methods.append('l1_path')
+                    to_drop, details = self.identify_l1_path(**params)
+                else:
+                    continue
 
-            # Emit signal to update the GUI with the results of the individual method
-            self.method_result_signal.emit(to_drop, details)
+                if cascade:
+                    # A method may re-identify pruned features (low importance ranks every feature
+                    # the GBM saw); they stay attributed to the method that caught them first
+                    caught[method] = [feature for feature in to_drop if feature not in self.pruned_features]
+                    self.pruned_features.update(to_drop)
 
-        # If all methods are selected
-        if set(all_methods) == set(selected_methods_and_params.keys()):
-            selected_removal_methods = 'all'
+                # Emit signal to update the GUI with the results of the individual method
+                self.method_result_signal.emit(to_drop, details)
 
-        # Finally, remove the features based on the results of all methods
-        removal_summary = self.remove_features(selected_removal_methods, keep_one_hot)
-        # Emit signal to update the GUI with the final results
-        self.final_results_signal.emit(removal_summary)
-        # Return the result data with the same feature order as the original data
-        return self.result_data
+                if self.memory_budget is not None:
+                    self.release_intermediates()
+        finally:
+            self.data = full_data
+            self.pruned_features = set()
+
+        return selected_removal_methods, caught
 
     def identify_missing(self, missing_threshold):
         """Find the features with a fraction of missing values above `missing_threshold`"""
 
         self.missing_threshold = missing_threshold
 
-        # Calculate the fraction of missing in each column
-        missing_series = self.data.isnull().sum() / self.data.shape[0]
-        self.missing_stats = pd.DataFrame(missing_series).rename(columns={'index': 'feature', 0: 'missing_fraction'})
-
-        # Sort with highest number of missing values on top
-        self.missing_stats = self.missing_stats.sort_values('missing_fraction', ascending=False)
+        # Read the fraction of missing in each column from the shared profile
+        profile = self.get_column_profile()
+        missing_series = (profile.stats['null_count'] / profile.n_rows).rename('missing_fraction')
+        self.missing_stats = profile.missing_stats()
 
         # Find the columns with a missing percentage above the threshold
-        record_missing = pd.DataFrame(missing_series[missing_series > missing_threshold]).reset_index().rename(columns=
-        {
-            'index': 'feature',
-            0: 'missing_fraction'})
+        record_missing = missing_series[missing_series > missing_threshold].reset_index()
 
         to_drop = list(record_missing['feature'])
 
@@ -120,15 +513,11 @@ class FeatureSelectorModel(QObject):
     def identify_single_unique(self):
         """Identifies features with only a single unique value. NaNs do not count as a unique value."""
 
-        # Calculate the unique counts in each column
-        unique_counts = self.data.nunique()
-
-        self.unique_stats = pd.DataFrame(unique_counts).rename(columns={'index': 'feature', 0: 'nunique'})
-        self.unique_stats = self.unique_stats.sort_values('nunique', ascending=True)
-
-        # Find the columns with only one unique count
-        record_single_unique = pd.DataFrame(unique_counts[unique_counts == 1]).reset_index().rename(
-            columns={'index': 'feature', 0: 'nunique'})
+        # Compare every column against its first value, stopping at the first difference;
+        # the full unique counts are only computed on demand by `get_unique_stats`
+        self.unique_stats = None
+        self.unique_sketches = None
+        record_single_unique = pd.DataFrame({'feature': constant_columns(self.data), 'nunique': 1})
 
         to_drop = list(record_single_unique['feature'])
 
@@ -139,6 +528,128 @@ class FeatureSelectorModel(QObject):
 
         return to_drop, details
 
+    def identify_near_constant(self, dominant_threshold=0.999, variance_threshold=0.0):
+        """
+        Finds features where a single value dominates or whose variance is negligible.
+        NaNs do not count as a value.
+
+        Parameters
+        --------
+        dominant_threshold : float between 0 and 1, default = 0.999
+            Features whose most frequent value covers at least this fraction of the non-missing
+            values are identified for removal
+
+        variance_threshold : float, default = 0.0
+            Numeric features with a variance below this value are identified for removal
+
+        """
+
+        profile = self.get_column_profile()
+        near_constant_stats = pd.DataFrame({'dominant_value': profile.stats['dominant_value'],
+                                            'dominant_fraction': profile.dominant_fraction(),
+                                            'variance': profile.stats['variance']}).reset_index()
+
+        drop_mask = (near_constant_stats['dominant_fraction'] >= dominant_threshold) | (
+                near_constant_stats['variance'] < variance_threshold)
+        record_near_constant = near_constant_stats[drop_mask].reset_index(drop=True)
+
+        to_drop = list(record_near_constant['feature'])
+
+        self.near_constant_stats = near_constant_stats.sort_values('dominant_fraction', ascending=False)
+        self.record_near_constant = record_near_constant
+        self.removal_ops['near_constant'] = to_drop
+
+        details = '%d features with a dominant value fraction of at least %0.3f or a variance below %g.\n' % (
+            len(self.removal_ops['near_constant']), dominant_threshold, variance_threshold)
+
+        return to_drop, details
+
+    def identify_drift(self, psi_threshold=0.25, n_bins=10):
+        """
+        Finds features whose distribution drifts between the loaded datasets, using the population
+        stability index (PSI). Each feature is binned once on the reference data (`data`) and compared
+        against every dataset in `comparison_data`.
+
+        Parameters
+        --------
+        psi_threshold : float, default = 0.25
+            Features with a PSI above this value against any comparison dataset are identified for removal
+
+        n_bins : int, default = 10
+            Number of quantile bins of the reference data for numeric features
+
+        Notes
+        --------
+        - Missing values get their own bin; categorical levels not seen in the reference data share one bin.
+        - Features missing from a comparison dataset get no PSI for that dataset.
+        - Without comparison datasets no feature is identified and the details say so, so a run of
+          all methods on a single file still completes.
+        """
+
+        if not self.comparison_data:
+            self.drift_stats = None
+            self.record_drift = None
+            self.removal_ops['drift'] = []
+            details = 'No comparison data: distribution drift was not checked. ' \
+                      'Load more than one dataset to check for drift.\n'
+            print(details)
+            return [], details
+
+        numeric_data = self.data.select_dtypes(include=['number', 'bool'])
+        categorical_data = self.data.drop(columns=numeric_data.columns)
+
+        # Bin edges and levels come from the reference data only
+        edges = statistics.quantile_edges(numeric_data.to_numpy(dtype=np.float64), n_bins)
+        levels = {column: pd.unique(categorical_data[column].dropna()) for column in categorical_data.columns}
+
+        def encode(data):
+            numeric_codes = statistics.bin_codes(data[numeric_data.columns].to_numpy(dtype=np.float64), edges,
+                                                 self.kernel_backend)
+            categorical_codes = np.empty((len(data), len(categorical_data.columns)), dtype=np.int64)
+            for position, column in enumerate(categorical_data.columns):
+                column_codes = pd.Index(levels[column]).get_indexer(data[column]).astype(np.int64)
+                # Unseen levels share one code, missing values another
+                column_codes[column_codes < 0] = len(levels[column])
+                column_codes[data[column].isnull().to_numpy()] = len(levels[column]) + 1
+                categorical_codes[:, position] = column_codes
+            return numeric_codes, categorical_codes
+
+        reference_numeric, reference_categorical = encode(self.data)
+        # Every categorical column gets its own levels plus the unseen and missing codes
+        n_levels = np.array([len(levels[column]) + 2 for column in categorical_data.columns], dtype=np.int64)
+
+        drift_stats = pd.DataFrame(index=list(numeric_data.columns) + list(categorical_data.columns))
+        for name, comparison in self.comparison_data.items():
+            # Only features present in both datasets can be compared
+            shared = [column for column in drift_stats.index if column in comparison.columns]
+            comparison = comparison.reindex(columns=drift_stats.index)
+
+            comparison_numeric, comparison_categorical = encode(comparison)
+            psi = np.concatenate([
+                statistics.population_stability_index(reference_numeric, comparison_numeric, n_bins + 1,
+                                                      backend=self.kernel_backend),
+                statistics.population_stability_index(reference_categorical, comparison_categorical, n_levels,
+                                                      backend=self.kernel_backend)])
+
+            drift_stats[name] = np.nan
+            drift_stats.loc[shared, name] = pd.Series(psi, index=drift_stats.index)[shared]
+
+        drift_stats['max_psi'] = drift_stats.max(axis=1)
+        drift_stats = drift_stats.rename_axis('feature').reset_index()
+        self.drift_stats = drift_stats.sort_values('max_psi', ascending=False).reset_index(drop=True)
+
+        record_drift = self.drift_stats[self.drift_stats['max_psi'] > psi_threshold]
+
+        to_drop = list(record_drift['feature'])
+
+        self.record_drift = record_drift
+        self.removal_ops['drift'] = to_drop
+
+        details = '%d features with a population stability index greater than %0.2f across %d datasets.\n' % (
+            len(self.removal_ops['drift']), psi_threshold, len(self.comparison_data))
+
+        return to_drop, details
+
     def identify_collinear(self, correlation_threshold, one_hot=False):
         """
         Finds collinear features based on the correlation coefficient between features.
@@ -159,50 +670,444 @@ class FeatureSelectorModel(QObject):
 
         # Calculate the correlations between every column
         if one_hot:
-            # One hot encoding
-            features = pd.get_dummies(self.data)
-            self.one_hot_features = [column for column in features.columns if column not in self.base_features]
+            # One hot encoding, shared with the other methods
+            features = self.get_one_hot()
+            self.one_hot_features = self.one_hot.one_hot_features
+            self.data_all = self.one_hot.data_all
+
+            numeric_features = features.select_dtypes(include=['number', 'bool'])
+        else:
+            numeric_features = self.data.select_dtypes(include=['number', 'bool'])
+
+        if self.over_budget(self.corr_footprint(*numeric_features.shape)):
+            # The dense matrix and its intermediates would not fit: tile the correlations into a
+            # condensed float32 upper triangle and threshold it directly
+            self.corr_matrix = None
+            self.corr_versions = {}
+            self.corr_condensed = CondensedCorrelation.from_features(
+                numeric_features, self.corr_tile_size(*numeric_features.shape))
+            rows, columns, values = self.corr_condensed.pairs_above(correlation_threshold)
+            strong = pd.DataFrame({'row': rows, 'column': columns, 'corr_value': values}).sort_values(['column', 'row'])
+        else:
+            # Pairwise-complete correlations as DataFrame.corr computes them
+            self.corr_matrix = self.get_corr_matrix(numeric_features)
+            self.corr_condensed = None
+
+            # Pairs above the threshold are a prefix of the cached pairs sorted by magnitude, so a new
+            # threshold needs no pass over the matrix
+            pairs = self.get_corr_pairs()
+            n_strong = np.searchsorted(-np.abs(pairs['corr_value'].to_numpy()), -correlation_threshold, side='left')
+            strong = pairs.iloc[:n_strong].sort_values(['column', 'row'])
+
+        # The later feature of every pair, in column order, is identified for removal
+        features = numeric_features.columns
+        to_drop = list(features[strong['column'].unique()])
+
+        # Dataframe to hold correlated pairs
+        record_collinear = pd.DataFrame({'drop_feature': features[strong['column']],
+                                         'corr_feature': features[strong['row']],
+                                         'corr_value': strong['corr_value'].to_numpy()})
+
+        self.record_collinear = record_collinear
+        self.removal_ops['collinear'] = to_drop
+
+        details = '%d features with a correlation magnitude greater than %0.2f.\n' % (
+            len(self.removal_ops['collinear']), self.correlation_threshold)
+
+        return to_drop, details
+
+    def over_budget(self, n_bytes):
+        """Whether an intermediate of `n_bytes` bytes exceeds the memory budget."""
+        return self.memory_budget is not None and n_bytes > self.memory_budget
+
+    @staticmethod
+    def corr_footprint(n_samples, n_features):
+        """Estimated bytes of the dense correlation: three float64 copies of the data and seven matrices."""
+        return 8 * (3 * n_samples * n_features + 7 * n_features ** 2)
+
+    @staticmethod
+    def boruta_footprint(n_samples, n_features, n_workers):
+        """Bytes of the Boruta intermediates: the float32 features and a buffer of twice their size per worker."""
+        return 4 * n_samples * n_features * (1 + 2 * n_workers)
+
+    def corr_tile_size(self, n_samples, n_features):
+        """Rows of the correlation triangle per tile, so a tile's intermediates take half the budget."""
+        bytes_per_row = 8 * (2 * n_samples + 7 * n_features)
+        return int(np.clip(self.memory_budget // 2 // bytes_per_row, 1, max(n_features, 1)))
+
+    def release_intermediates(self):
+        """
+        Drop what a finished method leaves cached that later methods can rebuild: the assembled
+        one-hot frame (its per-column blocks stay for `data_all`), the sorted correlation pairs
+        and the HyperLogLog sketches.
+        """
+        self.one_hot.features = None
+        self.one_hot.key = None
+        self.corr_pairs = None
+        self.unique_sketches = None
+        gc.collect()
+
+    def get_corr_pairs(self):
+        """
+        Feature pairs of the upper triangle of `corr_matrix` with a defined correlation, strongest
+        magnitude first, as positions 'row' and 'column' and 'corr_value'. Computed once per matrix.
+        """
+        if self.corr_pairs is None or self.corr_pairs[0] is not self.corr_matrix:
+            values = self.corr_matrix.to_numpy()
+            rows, columns = np.triu_indices(values.shape[0], k=1)
+            corr = values[rows, columns]
+            defined = ~np.isnan(corr)
+            order = np.argsort(-np.abs(corr[defined]), kind='stable')
+            pairs = pd.DataFrame({'row': rows[defined][order], 'column': columns[defined][order],
+                                  'corr_value': corr[defined][order]})
+            self.corr_pairs = (self.corr_matrix, pairs)
+        return self.corr_pairs[1]
+
+    def sweep_thresholds(self, missing_thresholds=(), correlation_thresholds=(), cumulative_importances=()):
+        """
+        Number of features that every threshold of a grid would drop, without recomputing any
+        statistic: missing fractions come from the column profile, correlations from the pairs of
+        the last `identify_collinear` and importances from the last `identify_zero_importance`.
+
+        Parameters
+        --------
+        missing_thresholds : list of floats
+            Values of `missing_threshold` for `identify_missing`
+
+        correlation_thresholds : list of floats
+            Values of `correlation_threshold` for `identify_collinear`
+
+        cumulative_importances : list of floats
+            Values of `cumulative_importance` for `identify_low_importance`
+
+        Returns
+        --------
+        sweeps : dict
+            A dataframe with columns 'threshold' and 'n_drop' for every grid given, keyed by
+            'missing', 'collinear' and 'low_importance'
+        """
+        def sweep(thresholds, scores):
+            # Number of scores strictly above every threshold
+            scores = np.sort(scores)
+            thresholds = np.asarray(thresholds, dtype=np.float64)
+            n_drop = len(scores) - np.searchsorted(scores, thresholds, side='right')
+            return pd.DataFrame({'threshold': thresholds, 'n_drop': n_drop})
+
+        sweeps = {}
+        if len(missing_thresholds):
+            profile = self.get_column_profile()
+            sweeps['missing'] = sweep(missing_thresholds, (profile.stats['null_count'] / profile.n_rows).to_numpy())
+
+        if len(correlation_thresholds):
+            if self.corr_matrix is None and self.corr_condensed is None:
+                raise NotImplementedError("""Correlations have not yet been computed.
+                                             Call the `identify_collinear` method first.""")
+            # A feature is dropped once its strongest correlation with an earlier feature exceeds the threshold
+            if self.corr_condensed is not None:
+                strongest = self.corr_condensed.column_maxima()
+                strongest = strongest[~np.isnan(strongest)]
+            else:
+                pairs = self.get_corr_pairs()
+                strongest = pairs.assign(magnitude=pairs['corr_value'].abs()).groupby('column')['magnitude'].max()
+                strongest = strongest.to_numpy()
+            sweeps['collinear'] = sweep(correlation_thresholds, strongest)
+
+        if len(cumulative_importances):
+            if self.feature_importances is None or self.feature_importances_stale:
+                raise NotImplementedError("""Feature importances have not yet been determined.
+                                             Call the `identify_zero_importance` method first.""")
+            sweeps['low_importance'] = sweep(cumulative_importances,
+                                             self.feature_importances['cumulative_importance'].to_numpy())
+
+        return sweeps
+
+    def identify_univariate(self, score_func='anova', p_value_threshold=0.05, score_threshold=None):
+        """
+        Finds numeric features with no significant univariate relationship to the labels.
+        The scores of all features are computed at once from matrix products over the whole data.
+
+        Parameters
+        --------
+        score_func : string, default = 'anova'
+            'anova' for the ANOVA F statistic between classes, 'chi2' for the chi-squared statistic of
+            non-negative features against the classes, or 'pearson' for the absolute Pearson correlation
+            with a numeric target
+
+        p_value_threshold : float between 0 and 1, default = 0.05
+            Features with a p-value above this threshold are identified for removal
+
+        score_threshold : float, default = None
+            If provided, features with a score below this threshold are also identified for removal
 
-            # Add one hot encoded data to original data
-            self.data_all = pd.concat([features[self.one_hot_features], self.data], axis=1)
+        Notes
+        --------
+        - Only numeric features are scored; missing values are excluded per feature.
+        - Features without a score (constant features, or negative features for 'chi2') are not removed.
+        """
+
+        numeric_data = self.data.select_dtypes(include=['number', 'bool'])
+        features = numeric_data.to_numpy(dtype=np.float64)
 
-            corr_matrix = pd.get_dummies(features).corr(numeric_only=True)
+        if score_func == 'anova':
+            scores, p_values = statistics.anova_f(features, self.labels)
+        elif score_func == 'chi2':
+            scores, p_values = statistics.chi2(features, self.labels)
+        elif score_func == 'pearson':
+            scores, p_values = statistics.pearson_r(features, self.labels)
+            scores = np.abs(scores)
         else:
-            corr_matrix = self.data.corr(numeric_only=True)
+            raise ValueError('Score function must be either "anova", "chi2", or "pearson"')
 
-        self.corr_matrix = corr_matrix
+        univariate_stats = pd.DataFrame({'feature': numeric_data.columns, 'score': scores, 'p_value': p_values})
 
-        # Extract the upper triangle of the correlation matrix
-        upper = corr_matrix.where(np.triu(np.ones(corr_matrix.shape), k=1).astype(np.bool))
+        # Select the features in a single pass over the score vectors
+        drop_mask = p_values > p_value_threshold
+        if score_threshold is not None:
+            drop_mask |= scores < score_threshold
+        record_univariate = univariate_stats[drop_mask].reset_index(drop=True)
 
-        # Select the features with correlations above the threshold
-        to_drop = [column for column in upper.columns if any(upper[column].abs() > correlation_threshold)]
+        to_drop = list(record_univariate['feature'])
 
-        # Dataframe to hold correlated pairs
-        record_collinear = pd.DataFrame(columns=['drop_feature', 'corr_feature', 'corr_value'])
+        self.univariate_stats = univariate_stats.sort_values('score', ascending=False)
+        self.record_univariate = record_univariate
+        self.removal_ops['univariate'] = to_drop
 
-        # Iterate through the columns to drop
-        for column in to_drop:
-            # Find the correlated features
-            corr_features = list(upper.index[upper[column].abs() > correlation_threshold])
+        details = '%d features with a p-value greater than %0.2f (%s).\n' % (
+            len(self.removal_ops['univariate']), p_value_threshold, score_func)
 
-            # Find the correlated values
-            corr_values = list(upper[column][upper[column].abs() > correlation_threshold])
-            drop_features = [column for _ in range(len(corr_features))]
+        return to_drop, details
 
-            # Record the information (need a temp df for now)
-            temp_df = pd.DataFrame.from_dict({'drop_feature': drop_features,
-                                              'corr_feature': corr_features,
-                                              'corr_value': corr_values})
+    def identify_low_mutual_info(self, task='classification', n_bins=10, mi_threshold=0.001):
+        """
+        Finds features whose mutual information with the labels is below `mi_threshold`.
+        Numeric features are quantile-binned once into small integer codes and categorical features
+        are factorized, then the mutual information of all features comes from joint histograms.
 
-            # Add to dataframe
-            record_collinear = pd.concat([record_collinear, temp_df], ignore_index=True)
+        Parameters
+        --------
+        task : string, default = 'classification'
+            The machine learning task, either 'classification' or 'regression'. Regression targets
+            are quantile-binned like the features
 
-        self.record_collinear = record_collinear
-        self.removal_ops['collinear'] = to_drop
+        n_bins : int, default = 10
+            Number of quantile bins for numeric features (missing values get an extra bin)
 
-        details = '%d features with a correlation magnitude greater than %0.2f.\n' % (
-            len(self.removal_ops['collinear']), self.correlation_threshold)
+        mi_threshold : float, default = 0.001
+            Features with a bias corrected mutual information (in nats) at or below this value
+            are identified for removal
+
+        """
+
+        if task == 'classification':
+            target_codes, _ = pd.factorize(pd.Series(np.array(self.labels).reshape((-1,))))
+            target_codes = np.where(target_codes < 0, target_codes.max() + 1, target_codes)
+        elif task == 'regression':
+            target = np.array(self.labels, dtype=np.float64).reshape((-1, 1))
+            target_codes = statistics.quantile_codes(target, n_bins, self.kernel_backend)[:, 0]
+        else:
+            raise ValueError('Task must be either "classification" or "regression"')
+
+        numeric_data = self.data.select_dtypes(include=['number'])
+        categorical_data = self.data.drop(columns=numeric_data.columns)
+
+        numeric_codes = statistics.quantile_codes(numeric_data.to_numpy(dtype=np.float64), n_bins, self.kernel_backend)
+        codes = np.hstack([numeric_codes, statistics.factorize_codes(categorical_data)])
+        mi = statistics.mutual_info(codes, target_codes, self.kernel_backend)
+
+        mutual_info_stats = pd.DataFrame({'feature': list(numeric_data.columns) + list(categorical_data.columns),
+                                          'mutual_info': mi})
+        self.mutual_info_stats = mutual_info_stats.sort_values('mutual_info', ascending=False).reset_index(drop=True)
+
+        record_low_mutual_info = self.mutual_info_stats[self.mutual_info_stats['mutual_info'] <= mi_threshold]
+
+        to_drop = list(record_low_mutual_info['feature'])
+
+        self.record_low_mutual_info = record_low_mutual_info
+        self.removal_ops['low_mutual_info'] = to_drop
+
+        details = '%d features with a mutual information of at most %0.4f.\n' % (
+            len(self.removal_ops['low_mutual_info']), mi_threshold)
+
+        return to_drop, details
+
+    def identify_mrmr(self, n_features=20, score_func='pearson', task='classification', n_bins=10):
+        """
+        Ranks features by minimum redundancy maximum relevance (mRMR) and identifies the features
+        outside the top `n_features` for removal. Each step selects the feature with the largest
+        relevance minus mean redundancy to the already selected features.
+
+        Parameters
+        --------
+        n_features : int, default = 20
+            Number of features to select
+
+        score_func : string, default = 'pearson'
+            'pearson' for absolute Pearson correlations on the numeric features, or 'mutual_info' for
+            binned mutual information on all features
+
+        task : string, default = 'classification'
+            The machine learning task, either 'classification' or 'regression'. Only used with 'mutual_info'
+
+        n_bins : int, default = 10
+            Number of quantile bins for numeric features with 'mutual_info'
+
+        Notes
+        --------
+        - A running redundancy vector is kept, so each step only scores the newly selected feature
+          against the others: O(k * p) relevance/redundancy evaluations for k selected of p features.
+        - With 'pearson', categorical features are not ranked and are never identified for removal.
+        """
+
+        if score_func == 'pearson':
+            numeric_data = self.data.select_dtypes(include=['number', 'bool'])
+            feature_names = list(numeric_data.columns)
+            features = numeric_data.to_numpy(dtype=np.float64)
+
+            labels = pd.Series(np.array(self.labels).reshape((-1,)))
+            if not pd.api.types.is_numeric_dtype(labels):
+                labels = pd.Series(pd.factorize(labels)[0]).replace(-1, np.nan)
+
+            relevance = np.abs(statistics.pearson_r(features, labels)[0])
+
+            def score_against(position):
+                return np.abs(statistics.pearson_r(features, features[:, position])[0])
+
+        elif score_func == 'mutual_info':
+            numeric_data = self.data.select_dtypes(include=['number'])
+            categorical_data = self.data.drop(columns=numeric_data.columns)
+            feature_names = list(numeric_data.columns) + list(categorical_data.columns)
+            numeric_codes = statistics.quantile_codes(numeric_data.to_numpy(dtype=np.float64), n_bins,
+                                                      self.kernel_backend)
+            codes = np.hstack([numeric_codes, statistics.factorize_codes(categorical_data)])
+
+            if task == 'classification':
+                target_codes, _ = pd.factorize(pd.Series(np.array(self.labels).reshape((-1,))))
+                target_codes = np.where(target_codes < 0, target_codes.max() + 1, target_codes)
+            else:
+                target = np.array(self.labels, dtype=np.float64).reshape((-1, 1))
+                target_codes = statistics.quantile_codes(target, n_bins, self.kernel_backend)[:, 0]
+
+            relevance = statistics.mutual_info(codes, target_codes, self.kernel_backend)
+
+            def score_against(position):
+                return statistics.mutual_info(codes, codes[:, position], self.kernel_backend)
+
+        else:
+            raise ValueError('Score function must be either "pearson" or "mutual_info"')
+
+        # Features without a score (e.g. constant features) are never selected
+        relevance = np.nan_to_num(relevance, nan=-np.inf)
+        n_features = min(n_features, len(feature_names))
+
+        redundancy = np.zeros(len(feature_names))
+        available = np.ones(len(feature_names), dtype=bool)
+        selected, selected_scores, selected_redundancy = [], [], []
+
+        for step in range(n_features):
+            scores = relevance - (redundancy / step if step else 0.0)
+            scores[~available] = -np.inf
+            position = int(np.argmax(scores))
+            if not np.isfinite(scores[position]):
+                break
+
+            selected.append(position)
+            selected_scores.append(scores[position])
+            selected_redundancy.append(redundancy[position] / step if step else 0.0)
+            available[position] = False
+
+            # Only the column of the newly selected feature is added to the running redundancy
+            redundancy += np.nan_to_num(score_against(position), nan=0.0)
+
+        mrmr_ranking = pd.DataFrame({'feature': [feature_names[position] for position in selected],
+                                     'rank': np.arange(1, len(selected) + 1),
+                                     'relevance': relevance[selected],
+                                     'redundancy': selected_redundancy,
+                                     'score': selected_scores})
+
+        record_mrmr = pd.DataFrame({'feature': [feature_names[position] for position in np.flatnonzero(available)],
+                                    'relevance': relevance[available]})
+
+        to_drop = list(record_mrmr['feature'])
+
+        self.mrmr_ranking = mrmr_ranking
+        self.record_mrmr = record_mrmr
+        self.removal_ops['mrmr'] = to_drop
+
+        details = '%d features selected by mRMR (%s); %d features not selected.\n' % (
+            len(mrmr_ranking), score_func, len(self.removal_ops['mrmr']))
+
+        return to_drop, details
+
+    def identify_leakage(self, task='classification', leakage_threshold=0.95):
+        """
+        Flags features that predict the labels suspiciously well on their own, such as IDs or fields
+        recorded after the outcome. Every feature is scored in one pass before any model is trained.
+
+        Parameters
+        --------
+        task : string, default = 'classification'
+            'classification' scores each feature by its rank-based ROC AUC (the best one-vs-rest
+            class, as max(AUC, 1 - AUC)); 'regression' by its absolute Spearman correlation
+
+        leakage_threshold : float between 0 and 1, default = 0.95
+            Features with a score above this threshold are identified for removal
+
+        Notes
+        --------
+        - For classification, missing values rank below every observed value, so leakage through
+          missingness is detected as well.
+        - Categorical features are scored through their in-sample frequency of every class in
+          turn, which favours high-cardinality ID-like columns; those are suspicious anyway.
+        - For regression, each feature and the labels are ranked over the rows where both are present.
+        """
+
+        numeric_data = self.data.select_dtypes(include=['number', 'bool'])
+        categorical_data = self.data.drop(columns=numeric_data.columns)
+        feature_names = list(numeric_data.columns) + list(categorical_data.columns)
+        features = numeric_data.to_numpy(dtype=np.float64)
+        labels = pd.Series(np.array(self.labels).reshape((-1,)))
+
+        if task == 'classification':
+            codes = statistics.factorize_codes(categorical_data)
+            label_matrix = statistics.one_hot_labels(labels)
+            auc = statistics.rank_auc(np.where(np.isnan(features), -np.inf, features), labels)
+            # Every class ranks the levels by their frequency of that class, so a level that gives
+            # away any one class of a multiclass target is caught
+            categorical_auc = np.empty((label_matrix.shape[1], codes.shape[1]))
+            for position in range(codes.shape[1]):
+                totals = np.bincount(codes[:, position]).reshape((-1, 1))
+                counts = np.zeros((len(totals), label_matrix.shape[1]))
+                np.add.at(counts, codes[:, position], label_matrix)
+                encoded = (counts / np.maximum(totals, 1))[codes[:, position]]
+                categorical_auc[:, position] = np.diagonal(statistics.rank_auc(encoded, labels))
+            auc = np.hstack([auc, categorical_auc])
+            scores = np.nanmax(np.maximum(auc, 1 - auc), axis=0)
+        elif task == 'regression':
+            codes = statistics.factorize_codes(categorical_data)
+            target = labels.to_numpy(dtype=np.float64)
+            encoded = np.empty(codes.shape)
+            for position in range(codes.shape[1]):
+                sums = np.bincount(codes[:, position], weights=np.nan_to_num(target))
+                totals = np.bincount(codes[:, position])
+                encoded[:, position] = (sums / np.maximum(totals, 1))[codes[:, position]]
+            features = np.hstack([features, encoded])
+
+            scores = np.abs(statistics.spearman_r(features, target))
+        else:
+            raise ValueError('Task must be either "classification" or "regression"')
+
+        leakage_stats = pd.DataFrame({'feature': feature_names, 'score': scores})
+        self.leakage_stats = leakage_stats.sort_values('score', ascending=False).reset_index(drop=True)
+
+        record_leakage = self.leakage_stats[self.leakage_stats['score'] > leakage_threshold]
+
+        to_drop = list(record_leakage['feature'])
+
+        self.record_leakage = record_leakage
+        self.removal_ops['leakage'] = to_drop
+
+        details = '%d features with a standalone score greater than %0.2f (suspected target leakage).\n' % (
+            len(self.removal_ops['leakage']), leakage_threshold)
 
         return to_drop, details
 
@@ -220,18 +1125,62 @@ class FeatureSelectorModel(QObject):
         if early_stopping and eval_metric is None:
             raise ValueError("""eval metric must be provided with early stopping. Examples include "auc" for classification,
                              "l2" for regression, or "quantile" for quantile""")
-        # One hot encoding
-        features = pd.get_dummies(self.data)
-        self.one_hot_features = [column for column in features.columns if column not in self.base_features]
-        # Add one hot encoded data to original data
-        self.data_all = pd.concat([features[self.one_hot_features], self.data], axis=1)
+        # One hot encoding, shared with the other methods
+        features = self.get_one_hot()
+        self.one_hot_features = self.one_hot.one_hot_features
+        self.data_all = self.one_hot.data_all
         # Extract feature names
         feature_names = list(features.columns)
-        # Convert to np array
-        features = np.array(features)
+        # Convert to np array; the array and its train/validation split in float32 when their
+        # float64 copies would exceed the memory budget
+        features = features.to_numpy(dtype=np.float32 if self.over_budget(16 * features.size) else np.float64)
         labels = np.array(self.labels).reshape((-1,))
+        # The GBMs depend only on these settings and on the features and labels, so a run that only
+        # changes a threshold reuses the importances of the previous one
+        versions = self.feature_versions(feature_names + [self.labels.name])
+        importance_key = (eval_metric, task, n_iterations, early_stopping, importance_type, n_permutations,
+                          tuple(versions.items()))
+        if (importance_key == self.importance_key and self.feature_importances is not None
+                and not self.feature_importances_stale and None not in versions.values()):
+            print('Reusing the feature importances of the previous run\n')
+            feature_importances = self.feature_importances
+        else:
+            feature_importance_values = self.gbm_importances(features, labels, eval_metric, task, n_iterations,
+                                                             early_stopping, importance_type, n_permutations)
+            self.importance_key = importance_key
+            feature_importances = pd.DataFrame({'feature': feature_names, 'importance': feature_importance_values})
+
+            # Sort based on importance
+            feature_importances = feature_importances.sort_values(by='importance',
+                                                                  ascending=False).reset_index(drop=True)
+
+            # Normalize the feature importances to add up to one
+            postive_features_sum = (feature_importances['importance'] *
+                                    (feature_importances['importance'] >= 0)).sum()
+            feature_importances['normalized_importance'] = feature_importances['importance'] / postive_features_sum
+            feature_importances['cumulative_importance'] = np.cumsum(feature_importances['normalized_importance'])
+
+        # Extract the features with zero or negative importance
+        record_zero_importance = feature_importances[feature_importances['importance'] <= 0.0]
+
+        to_drop = list(record_zero_importance['feature'])
+
+        self.feature_importances = feature_importances
+        self.feature_importances_stale = False
+        self.record_zero_importance = record_zero_importance
+        self.removal_ops['zero_importance'] = to_drop
+
+        details = '\n%d features with zero or negative importance after one-hot encoding.\n' % len(
+            self.removal_ops['zero_importance'])
+        print(details)
+
+        return to_drop, details
+
+    def gbm_importances(self, features, labels, eval_metric, task, n_iterations, early_stopping, importance_type,
+                        n_permutations):
+        """Importances of the columns of `features` averaged over `n_iterations` GBMs."""
         # Empty array for feature importances
-        feature_importance_values = np.zeros(len(feature_names))
+        feature_importance_values = np.zeros(features.shape[1])
         print('Training Gradient Boosting Model\n')
 
         # Iterate through each fold
@@ -302,30 +1251,7 @@ class FeatureSelectorModel(QObject):
             gc.collect()
             # Record the feature importances
 
-        feature_importances = pd.DataFrame({'feature': feature_names, 'importance': feature_importance_values})
-
-        # Sort based on importance
-        feature_importances = feature_importances.sort_values(by='importance', ascending=False).reset_index(drop=True)
-
-        # Normalize the feature importances to add up to one
-        postive_features_sum = (feature_importances['importance'] * (feature_importances['importance'] >= 0)).sum()
-        feature_importances['normalized_importance'] = feature_importances['importance'] / postive_features_sum
-        feature_importances['cumulative_importance'] = np.cumsum(feature_importances['normalized_importance'])
-
-        # Extract the features with zero or negative importance
-        record_zero_importance = feature_importances[feature_importances['importance'] <= 0.0]
-
-        to_drop = list(record_zero_importance['feature'])
-
-        self.feature_importances = feature_importances
-        self.record_zero_importance = record_zero_importance
-        self.removal_ops['zero_importance'] = to_drop
-
-        details = '\n%d features with zero or negative importance after one-hot encoding.\n' % len(
-            self.removal_ops['zero_importance'])
-        print(details)
-
-        return to_drop, details
+        return feature_importance_values
 
     def identify_low_importance(self, cumulative_importance):
         """
@@ -343,6 +1269,9 @@ class FeatureSelectorModel(QObject):
         if self.feature_importances is None:
             raise NotImplementedError("""Feature importances have not yet been determined. 
                                          Call the `identify_zero_importance` method first.""")
+        if self.feature_importances_stale:
+            raise NotImplementedError("""Feature importances are stale after an edit of the data.
+                                         Call the `identify_zero_importance` method again.""")
         # Make sure most important features are on top
         self.feature_importances = self.feature_importances.sort_values('cumulative_importance')
         # Identify the features not needed to reach the cumulative_importance
@@ -360,6 +1289,395 @@ class FeatureSelectorModel(QObject):
         print(details)
         return to_drop, details
 
+    def identify_l1_path(self, task='classification', n_features=20, n_alphas=100, eps=1e-3):
+        """
+        Keeps the `n_features` features that enter the L1 regularization path first, as a fast linear
+        counterpart to the gradient boosting importances. The Lasso (regression) or L1-logistic (binary
+        classification) path is computed over a decreasing grid of alphas, recording the alpha at which
+        each feature enters.
+
+        Parameters
+        --------
+        task : string, default = 'classification'
+            The machine learning task, either 'classification' (binary labels) or 'regression'
+
+        n_features : int, default = 20
+            Number of features to keep
+
+        n_alphas : int, default = 100
+            Number of alphas on the path
+
+        eps : float, default = 1e-3
+            Ratio of the smallest to the largest alpha on the path
+
+        Notes
+        --------
+        - Features are one-hot encoded, missing values filled with the column mean and standardized once.
+        - Fits are warm started along the path and use the sequential strong screening rule.
+        - The path is cached: calling again with only a different `n_features` does not refit.
+        """
+
+        if task not in ['classification', 'regression']:
+            raise ValueError('Task must be either "classification" or "regression"')
+
+        # One hot encoding, shared with the other methods
+        features = self.get_one_hot()
+        self.one_hot_features = self.one_hot.one_hot_features
+        self.data_all = self.one_hot.data_all
+        feature_names = list(features.columns)
+
+        path_key = (task, n_alphas, eps, tuple(feature_names), len(self.data))
+        if self.regularization_path is None or self.regularization_path['key'] != path_key:
+            labels = np.array(self.labels).reshape((-1,))
+            if task == 'classification':
+                labels, classes = pd.factorize(labels)
+                if len(classes) != 2:
+                    raise ValueError('The L1 path for classification requires binary labels')
+            labels = labels.astype(np.float64)
+
+            features = l1_path.standardize(features.to_numpy(dtype=np.float64))
+            alphas = l1_path.alpha_grid(features, labels, n_alphas, eps)
+
+            print('Computing the L1 regularization path over %d alphas\n' % n_alphas)
+            coefs = l1_path.l1_path(features, labels, alphas, task)
+
+            self.regularization_path = {'key': path_key, 'alphas': alphas,
+                                        'coefs': pd.DataFrame(coefs, index=feature_names)}
+
+        alphas, coefs = self.regularization_path['alphas'], self.regularization_path['coefs'].to_numpy()
+
+        # Alpha at which each feature first has a non-zero coefficient
+        entered = coefs != 0
+        entry_alpha = np.where(entered.any(axis=1), alphas[np.argmax(entered, axis=1)], np.nan)
+        l1_path_stats = pd.DataFrame({'feature': feature_names, 'entry_alpha': entry_alpha})
+        self.l1_path_stats = l1_path_stats.sort_values('entry_alpha', ascending=False,
+                                                       na_position='last').reset_index(drop=True)
+
+        record_l1_path = self.l1_path_stats.iloc[n_features:]
+
+        to_drop = list(record_l1_path['feature'])
+
+        self.l1_path_n_features = min(n_features, len(feature_names))
+        self.record_l1_path = record_l1_path
+        self.removal_ops['l1_path'] = to_drop
+
+        details = '%d features do not enter the L1 path among the first %d.\n' % (
+            len(self.removal_ops['l1_path']), self.l1_path_n_features)
+
+        return to_drop, details
+
+    def identify_validation_curve(self, task='classification', eval_metric='auc', n_points=10, tolerance=0.01,
+                                  n_jobs=-1):
+        """
+        Finds the smallest number of top ranked features whose validation score is within `tolerance`
+        of the best score. Models are trained on the top-k features of the `feature_importances` ranking
+        for a geometric grid of k, in parallel worker processes.
+
+        Parameters
+        --------
+        task : string, default = 'classification'
+            The machine learning task, either 'classification' or 'regression'
+
+        eval_metric : string, default = 'auc'
+            Evaluation metric of the validation set used for early stopping and for scoring
+
+        n_points : int, default = 10
+            Number of feature counts on the geometric grid
+
+        tolerance : float, default = 0.01
+            Largest relative difference to the best validation score that is still accepted
+
+        n_jobs : int, default = -1
+            Number of worker processes. -1 uses all processors
+
+        """
+
+        # The feature importances need to be calculated before running
+        if self.feature_importances is None:
+            raise NotImplementedError("""Feature importances have not yet been determined. 
+                                         Call the `identify_zero_importance` method first.""")
+        if self.feature_importances_stale:
+            raise NotImplementedError("""Feature importances are stale after an edit of the data.
+                                         Call the `identify_zero_importance` method again.""")
+        if task not in ['classification', 'regression']:
+            raise ValueError('Task must be either "classification" or "regression"')
+
+        # Rank the one-hot encoded features by importance
+        ranking = list(self.feature_importances.sort_values('importance', ascending=False)['feature'])
+        features = self.get_one_hot()
+        # Features pruned by an earlier method of a cascade are not ranked
+        ranking = [feature for feature in ranking if feature in features.columns]
+        features = features[ranking].to_numpy(dtype=np.float32)
+        labels = np.array(self.labels).reshape((-1,))
+
+        if task == 'classification':
+            train_features, valid_features, train_labels, valid_labels = train_test_split(features, labels,
+                                                                                          test_size=0.2,
+                                                                                          stratify=labels)
+        else:
+            train_features, valid_features, train_labels, valid_labels = train_test_split(features, labels,
+                                                                                          test_size=0.2)
+        del features
+
+        n_features_grid = np.unique(np.geomspace(1, len(ranking), n_points).round().astype(int))
+
+        print('Training Gradient Boosting Models on %d feature counts\n' % len(n_features_grid))
+
+        # Worker processes share the read-only training arrays through joblib memory mapping
+        scores = Parallel(n_jobs=n_jobs)(
+            delayed(fit_validation_score)(train_features, train_labels, valid_features, valid_labels,
+                                          np.arange(n_features), task, eval_metric)
+            for n_features in n_features_grid)
+
+        validation_curve = pd.DataFrame({'n_features': n_features_grid, 'score': scores})
+
+        # Smallest feature count within the tolerance of the best score
+        if eval_metric in HIGHER_IS_BETTER_METRICS:
+            best_score = validation_curve['score'].max()
+            accepted = validation_curve['score'] >= best_score - tolerance * abs(best_score)
+        else:
+            best_score = validation_curve['score'].min()
+            accepted = validation_curve['score'] <= best_score + tolerance * abs(best_score)
+        n_features_suggested = int(validation_curve.loc[accepted, 'n_features'].min())
+
+        record_validation_curve = pd.DataFrame({'feature': ranking[n_features_suggested:],
+                                                'rank': np.arange(n_features_suggested, len(ranking)) + 1})
+
+        to_drop = list(record_validation_curve['feature'])
+
+        self.validation_curve = validation_curve
+        self.validation_curve_n_features = n_features_suggested
+        self.record_validation_curve = record_validation_curve
+        self.removal_ops['validation_curve'] = to_drop
+
+        details = '%d features reach a validation %s within %0.3f of the best score %0.4f; %d features dropped.\n' % (
+            n_features_suggested, eval_metric, tolerance, best_score, len(self.removal_ops['validation_curve']))
+        print(details)
+
+        return to_drop, details
+
+    def identify_stability(self, task='classification', estimator='l1', n_subsamples=100, alpha=0.01,
+                           threshold=0.6, n_jobs=-1, random_state=None):
+        """
+        Finds features that are not selected consistently across random half-samples of the data
+        (stability selection). A model is fitted on each half-sample in parallel worker processes and
+        the fraction of fits that select each feature is recorded.
+
+        Parameters
+        --------
+        task : string, default = 'classification'
+            The machine learning task, either 'classification' or 'regression'
+
+        estimator : string, default = 'l1'
+            'l1' for L1-regularized logistic (classification) or Lasso (regression) models on standardized
+            features, or 'gbm' for shallow gradient boosting machines
+
+        n_subsamples : int, default = 100
+            Number of random half-samples to fit
+
+        alpha : float, default = 0.01
+            L1 regularization strength on the Lasso scale. Only used with 'l1'
+
+        threshold : float between 0 and 1, default = 0.6
+            Features selected in a smaller fraction of the fits are identified for removal
+
+        n_jobs : int, default = -1
+            Number of worker processes. -1 uses all processors
+
+        random_state : int, default = None
+            Seed for drawing the half-samples
+
+        Notes
+        --------
+        - Features are one-hot encoded, missing values are filled with the column mean and the
+          features are standardized once; workers share this read-only matrix through joblib
+          memory mapping instead of receiving copies.
+        """
+
+        if task not in ['classification', 'regression']:
+            raise ValueError('Task must be either "classification" or "regression"')
+        if estimator not in ['l1', 'gbm']:
+            raise ValueError('Estimator must be either "l1" or "gbm"')
+
+        # One hot encoding, shared with the other methods
+        features = self.get_one_hot()
+        self.one_hot_features = self.one_hot.one_hot_features
+        self.data_all = self.one_hot.data_all
+        feature_names = list(features.columns)
+
+        features = features.to_numpy(dtype=np.float64)
+        labels = np.array(self.labels).reshape((-1,))
+
+        if estimator == 'l1':
+            # Standardize once with mean imputation
+            means = np.nanmean(features, axis=0)
+            features = np.where(np.isnan(features), means, features)
+            stds = features.std(axis=0)
+            features = (features - means) / np.where(stds > 0, stds, 1.0)
+
+        n_samples = features.shape[0]
+        rng = np.random.default_rng(random_state)
+        subsamples = [rng.choice(n_samples, n_samples // 2, replace=False) for _ in range(n_subsamples)]
+
+        print('Fitting %d subsampled %s models\n' % (n_subsamples, estimator))
+
+        supports = Parallel(n_jobs=n_jobs)(
+            delayed(fit_subsample_support)(features, labels, sample_indices, task, estimator, alpha)
+            for sample_indices in subsamples)
+
+        stability_scores = pd.DataFrame({'feature': feature_names, 'frequency': np.mean(supports, axis=0)})
+        stability_scores = stability_scores.sort_values('frequency', ascending=False).reset_index(drop=True)
+
+        record_stability = stability_scores[stability_scores['frequency'] < threshold]
+
+        to_drop = list(record_stability['feature'])
+
+        self.stability_scores = stability_scores
+        self.stability_threshold = threshold
+        self.record_stability = record_stability
+        self.removal_ops['stability'] = to_drop
+
+        details = '%d features selected in less than %0.2f of %d subsampled fits.\n' % (
+            len(self.removal_ops['stability']), threshold, n_subsamples)
+
+        return to_drop, details
+
+    def identify_boruta(self, task='classification', n_iterations=50, alpha=0.05, n_jobs=-1, random_state=None):
+        """
+        Finds features whose importance does not beat randomly permuted "shadow" copies of the features (Boruta).
+        Each round trains a gradient boosting machine on the features plus one shadow column per undecided
+        feature and records a hit for every feature more important than the best shadow. A two-sided binomial
+        test with Bonferroni correction accepts or rejects a feature once its hit count is decided.
+
+        Parameters
+        --------
+        task : string, default = 'classification'
+            The machine learning task, either 'classification' or 'regression'
+
+        n_iterations : int, default = 50
+            Maximum number of rounds to train
+
+        alpha : float between 0 and 1, default = 0.05
+            Significance level of the binomial test
+
+        n_jobs : int, default = -1
+            Number of rounds trained in parallel. -1 uses all processors
+
+        random_state : int, default = None
+            Seed for the shadow permutations
+
+        Notes
+        --------
+        - Rounds run in threads sharing one preallocated buffer per worker: LightGBM releases the GIL while training.
+        - Every buffer holds twice the float32 feature matrix, so over the memory budget fewer rounds run at
+          once; a single worker is used even if its buffer alone exceeds the budget.
+        - Decided features leave the shadow set, so later rounds train on fewer columns.
+        - Features still undecided after `n_iterations` are kept (tentative).
+        """
+
+        if task not in ['classification', 'regression']:
+            raise ValueError('Task must be either "classification" or "regression"')
+
+        # One hot encoding, shared with the other methods
+        features = self.get_one_hot()
+        self.one_hot_features = self.one_hot.one_hot_features
+        self.data_all = self.one_hot.data_all
+        feature_names = list(features.columns)
+
+        features = features.to_numpy(dtype=np.float32)
+        labels = np.array(self.labels).reshape((-1,))
+        n_samples, n_features = features.shape
+
+        n_workers = min(effective_n_jobs(n_jobs), n_iterations)
+        budget_note = ''
+        if self.over_budget(self.boruta_footprint(n_samples, n_features, n_workers)):
+            # As many workers as the budget holds next to the feature matrix, and at least one
+            matrix_bytes = self.boruta_footprint(n_samples, n_features, 0)
+            n_workers = int(np.clip((self.memory_budget - matrix_bytes) // max(2 * matrix_bytes, 1), 1, n_workers))
+            budget_note = ' (%d workers to stay within the memory budget)' % n_workers
+        # One [real features | shadow features] buffer per worker, filled in place every round
+        buffers = np.empty((n_workers, n_samples, 2 * n_features), dtype=np.float32)
+        generators = [np.random.default_rng(seed) for seed in np.random.SeedSequence(random_state).spawn(n_workers)]
+
+        lgb_params = {
+            'n_jobs': 1,
+            'n_estimators': 100,
+            'learning_rate': 0.05,
+            'importance_type': 'gain',
+            'verbose': -1
+        }
+
+        def train_round(worker, kept, undecided):
+            n_kept, n_shadow = len(kept), len(undecided)
+            buffer = buffers[worker, :, :n_kept + n_shadow]
+            np.take(features, kept, axis=1, out=buffer[:, :n_kept])
+            # Shuffle every shadow column independently in one vectorized call
+            shadows = buffer[:, n_kept:]
+            np.take(features, undecided, axis=1, out=shadows)
+            # The rounds already run in threads, so the compiled kernel must not start its own
+            statistics.permute_columns(shadows, generators[worker], self.kernel_backend, parallel=False)
+
+            if task == 'classification':
+                model = lgb.LGBMClassifier(**lgb_params)
+            else:
+                model = lgb.LGBMRegressor(**lgb_params)
+            model.fit(buffer, labels)
+
+            importances = model.feature_importances_
+            shadow_max = importances[n_kept:].max()
+            # Hits are reported for the undecided features only, in the order of `undecided`
+            undecided_positions = np.searchsorted(kept, undecided)
+            return importances[undecided_positions] > shadow_max
+
+        hits = np.zeros(n_features, dtype=np.int64)
+        rounds = np.zeros(n_features, dtype=np.int64)
+        decision = np.full(n_features, 'tentative', dtype=object)
+        n_rounds = 0
+
+        print('Training Boruta Gradient Boosting Models\n')
+
+        with Parallel(n_jobs=n_workers, prefer='threads') as parallel:
+            while n_rounds < n_iterations:
+                if QThread.currentThread().isInterruptionRequested():
+                    break
+
+                undecided = np.flatnonzero(decision == 'tentative')
+                if len(undecided) == 0:
+                    break
+                kept = np.flatnonzero(decision != 'rejected')
+
+                batch = min(n_workers, n_iterations - n_rounds)
+                round_hits = parallel(delayed(train_round)(worker, kept, undecided) for worker in range(batch))
+                hits[undecided] += np.sum(round_hits, axis=0)
+                rounds[undecided] += batch
+                n_rounds += batch
+
+                # Two-sided binomial test of the hit counts against p = 0.5, Bonferroni corrected
+                corrected_alpha = alpha / len(undecided)
+                accepted = binom.sf(hits[undecided] - 1, n_rounds, 0.5) < corrected_alpha
+                rejected = binom.cdf(hits[undecided], n_rounds, 0.5) < corrected_alpha
+                decision[undecided[accepted]] = 'accepted'
+                decision[undecided[rejected]] = 'rejected'
+
+        del buffers
+        gc.collect()
+
+        record_boruta = pd.DataFrame({'feature': feature_names, 'hits': hits, 'n_rounds': rounds,
+                                      'decision': decision})
+        record_boruta['hit_fraction'] = record_boruta['hits'] / record_boruta['n_rounds'].clip(lower=1)
+        record_boruta = record_boruta.sort_values('hit_fraction', ascending=False).reset_index(drop=True)
+
+        to_drop = list(record_boruta.loc[record_boruta['decision'] == 'rejected', 'feature'])
+
+        self.record_boruta = record_boruta
+        self.removal_ops['boruta'] = to_drop
+
+        details = '%d features rejected and %d accepted against shadow features after %d rounds%s.\n' % (
+            len(self.removal_ops['boruta']), (record_boruta['decision'] == 'accepted').sum(), n_rounds, budget_note)
+        print(details)
+
+        return to_drop, details
+
     def remove_features(self, selected_methods, keep_one_hot=True):
         """
         Remove the features from the data according to the specified methods.
@@ -374,6 +1692,16 @@ class FeatureSelectorModel(QObject):
                     'collinear': remove collinear features
                     'zero_importance': remove zero importance features
                     'low_importance': remove low importance features
+                    'boruta': remove features rejected against shadow features
+                    'validation_curve': remove features beyond the suggested number of top ranked features
+                    'univariate': remove features without a significant univariate relationship to the labels
+                    'low_mutual_info': remove features with low mutual information with the labels
+                    'mrmr': remove features outside the mRMR selection
+                    'stability': remove features with a low selection frequency across subsamples
+                    'leakage': remove features suspected of target leakage
+                    'near_constant': remove features dominated by a single value
+                    'drift': remove features whose distribution drifts between the loaded datasets
+                    'l1_path': remove features that enter the L1 regularization path late
 
             keep_one_hot : boolean, default = True
                 Whether or not to keep one-hot encoded features.
@@ -395,10 +1723,10 @@ class FeatureSelectorModel(QObject):
 
         else:
             # Check if we need to use one-hot encoded data
-            if 'zero_importance' in selected_methods or 'low_importance' in selected_methods or self.one_hot_correlated:
+            if any(method in selected_methods for method in self.one_hot_removal_methods) or self.one_hot_correlated:
                 data = self.data_all
             else:
-                data = self.data
+                data = ColumnRegistry([(self.data, self.data.columns)])
 
             # Iterate through the selected methods to collect features to drop
             for method in selected_methods:
@@ -413,8 +1741,11 @@ class FeatureSelectorModel(QObject):
             else:
                 features_to_drop = features_to_drop | set(self.one_hot_features)
 
-        # Remove the features from the data
-        data = data.drop(columns=list(features_to_drop))
+        # Remove the features from the data; features a cascade pruned before the one-hot
+        # encoded data was built are already absent from it
+        data = data.drop(columns=list(features_to_drop), errors='ignore')
+        # Only the surviving columns are copied
+        self.result_data = data.materialize()
 
         # Removal summary
         removal_summary = []
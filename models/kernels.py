@@ -0,0 +1,121 @@
+"""
+Compiled versions of the loop-shaped statistics kernels. Each `numba_*` function matches a NumPy
+implementation in `models.statistics`, which dispatches to it when the backend resolves to Numba.
+"""
+import numpy as np
+
+# Numba is optional; without it every kernel runs its NumPy implementation
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def available():
+    return numba is not None
+
+
+def use_numba(backend, min_threads=1):
+    """
+    Whether `backend` ('numpy', 'numba' or 'auto') resolves to the compiled kernels. 'auto' picks
+    them when Numba is installed with at least `min_threads` threads, for kernels whose NumPy
+    version only loses once the loop runs in parallel (see benchmarks/benchmark_kernels.py).
+    """
+    if backend not in ('numpy', 'numba', 'auto'):
+        raise ValueError("backend must be 'numpy', 'numba' or 'auto'.")
+    if backend == 'numba' and not available():
+        raise ValueError('The numba backend requires the numba package.')
+
+    if backend != 'auto' or not available():
+        return backend == 'numba'
+    # get_num_threads starts Numba's parallel runtime, which must not happen in a worker thread,
+    # so it is only asked when a kernel needs several threads
+    return min_threads <= 1 or numba.get_num_threads() >= min_threads
+
+
+def jit(function):
+    """Compile `function` with parallel loops and an on-disk cache, or None without Numba."""
+    if numba is None:
+        return None
+    return numba.njit(parallel=True, cache=True)(function)
+
+
+def jit_serial(function):
+    """Compile `function` without parallel loops, with an on-disk cache, or None without Numba."""
+    if numba is None:
+        return None
+    return numba.njit(cache=True)(function)
+
+
+@jit
+def numba_bin_codes(columns, edges):
+    # `columns` is the transposed feature matrix; the codes are returned in the same layout
+    n_features, n_samples = columns.shape
+    n_edges = edges.shape[0]
+    codes = np.empty((n_features, n_samples), dtype=np.int64)
+    for column in numba.prange(n_features):
+        column_edges = np.ascontiguousarray(edges[:, column])
+        for row in range(n_samples):
+            value = columns[column, row]
+            if np.isnan(value):
+                codes[column, row] = n_edges + 1
+                continue
+            # Few edges, so a linear scan beats a binary search
+            code = 0
+            while code < n_edges and value > column_edges[code]:
+                code += 1
+            codes[column, row] = code
+    return codes
+
+
+@jit
+def numba_joint_histograms(codes, target_codes, offsets, n_classes):
+    # Column j counts into rows offsets[j] .. offsets[j + 1] - 1 of the flat histograms
+    n_samples, n_features = codes.shape
+    joint = np.zeros((offsets[-1], n_classes), dtype=np.int64)
+    for column in numba.prange(n_features):
+        for row in range(n_samples):
+            joint[offsets[column] + codes[row, column], target_codes[row]] += 1
+    return joint
+
+
+@jit
+def numba_column_histograms(codes, offsets):
+    n_samples, n_features = codes.shape
+    counts = np.zeros(offsets[-1], dtype=np.int64)
+    for column in numba.prange(n_features):
+        for row in range(n_samples):
+            counts[offsets[column] + codes[row, column]] += 1
+    return counts
+
+
+@jit_serial
+def shuffle_column(features, column, seed):
+    # Fisher-Yates shuffle driven by a per-column xorshift64* stream seeded with splitmix64,
+    # so columns shuffle independently of the thread that runs them
+    state = np.uint64(seed) + np.uint64(column + 1) * np.uint64(0x9E3779B97F4A7C15)
+    state = (state ^ (state >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    state = (state ^ (state >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    state = state ^ (state >> np.uint64(31))
+    if state == 0:
+        state = np.uint64(1)
+    for row in range(features.shape[0] - 1, 0, -1):
+        state ^= state >> np.uint64(12)
+        state ^= state << np.uint64(25)
+        state ^= state >> np.uint64(27)
+        other = (state * np.uint64(0x2545F4914F6CDD1D)) % np.uint64(row + 1)
+        features[row, column], features[other, column] = features[other, column], features[row, column]
+
+
+@jit
+def numba_permute_columns(features, seed):
+    for column in numba.prange(features.shape[1]):
+        shuffle_column(features, column, seed)
+
+
+@jit_serial
+def numba_permute_columns_serial(features, seed):
+    # Same permutation as `numba_permute_columns`, for callers already running in threads: Numba's
+    # parallel threading layer must not be entered from several Python threads at once
+    for column in range(features.shape[1]):
+        shuffle_column(features, column, seed)
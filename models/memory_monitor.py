@@ -0,0 +1,66 @@
+import os
+import sys
+import threading
+
+# getrusage is POSIX only; elsewhere the RSS cannot be read without extra packages
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+def current_rss():
+    """Resident set size of this process in bytes, or None where it cannot be read."""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    if resource is None:
+        return None
+    # Without /proc only the lifetime peak is available: kilobytes on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class PeakRSSMonitor:
+    """
+    Highest resident set size of the process between `start` and `stop`, sampled every
+    `interval` seconds by a background thread.
+
+    Parameters
+    --------
+    interval : float, default = 0.05
+        Seconds between samples
+    """
+
+    def __init__(self, interval=0.05):
+        self.interval = interval
+        self.peak = None
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def sample(self):
+        rss = current_rss()
+        if rss is not None:
+            self.peak = rss if self.peak is None else max(self.peak, rss)
+
+    def run(self):
+        while not self.stop_event.wait(self.interval):
+            self.sample()
+
+    def start(self):
+        self.sample()
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Stop sampling and return the peak in bytes (None where the RSS cannot be read)."""
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        self.sample()
+        return self.peak
@@ -0,0 +1,169 @@
+import numpy as np
+import pandas as pd
+
+from models import polars_engine
+from models.column_registry import ColumnRegistry
+
+
+class OneHotEncoding:
+    """
+    One-hot encoding of the loaded data, shared by every method that needs it.
+
+    Each categorical column is encoded once into a block of dummies cached with the column's
+    version, so an edit of the table re-encodes only the edited columns. The assembled encoding,
+    its list of dummy columns and the frame of dummy and original columns that `remove_features`
+    drops from are cached with the versions of all the columns, so methods running on the same
+    data share a single copy instead of each concatenating their own. `data_all` is a registry
+    pointing at the cached dummies and the original data rather than a concatenated copy of both.
+
+    Parameters
+    --------
+    dtype : {'bool', 'uint8'}, default = 'bool'
+        Type of the dummy columns
+
+    sparse : boolean, default = False
+        Store the dummies as sparse columns, which only take memory for their nonzero values
+
+    max_levels : int, default = None
+        Cardinality cap: columns with more distinct values are not one-hot encoded but encoded
+        as `high_cardinality` says, so an ID-like column cannot explode into one dummy per row.
+        None one-hot encodes every categorical column.
+
+    high_cardinality : {'frequency', 'hash', 'ordinal'}, default = 'frequency'
+        Encoding of the columns above the cap: the fraction of rows sharing the value
+        ('<column>_frequency'), `n_buckets` dummies of the hashed value ('<column>_hash_<k>'), or
+        the code of the value in sorted order ('<column>_code'). Missing values stay missing.
+
+    n_buckets : int, default = 32
+        Number of hashed buckets
+
+    Attributes
+    --------
+    one_hot_features : list
+        Encoded columns of the last encoding
+
+    capped : dict
+        Number of distinct values of every column of the last encoding that exceeded the cap
+
+    data_all : ColumnRegistry
+        Dummy columns of the last encoding followed by the original columns
+    """
+
+    def __init__(self, dtype='bool', sparse=False, max_levels=None, high_cardinality='frequency', n_buckets=32):
+        if dtype not in ('bool', 'uint8'):
+            raise ValueError("dtype must be 'bool' or 'uint8'.")
+        if high_cardinality not in ('frequency', 'hash', 'ordinal'):
+            raise ValueError("high_cardinality must be 'frequency', 'hash' or 'ordinal'.")
+
+        self.dtype = dtype
+        self.sparse = sparse
+        self.max_levels = max_levels
+        self.high_cardinality = high_cardinality
+        self.n_buckets = n_buckets
+        self.capped = {}
+        # Dummies of every categorical column with the version and settings they were encoded with
+        self.blocks = {}
+        self.key = None
+        self.features = None
+        self.one_hot_features = None
+        self.data_all = None
+
+    def clear(self):
+        """Forget every cached encoding, for example when other data is loaded."""
+        self.blocks = {}
+        self.key = None
+        self.features = None
+        self.one_hot_features = None
+        self.data_all = None
+        self.capped = {}
+
+    @property
+    def settings(self):
+        return self.dtype, self.sparse, self.max_levels, self.high_cardinality, self.n_buckets
+
+    def discard(self, columns):
+        """Forget the dummies of `columns`, which were edited or removed."""
+        for column in columns:
+            self.blocks.pop(column, None)
+
+    def encode_column(self, data, column, engine='pandas', n_levels=None):
+        """Encoding of one column of `data` with `n_levels` distinct values: dummies up to the cap."""
+        if self.max_levels is not None and n_levels is not None and n_levels > self.max_levels:
+            return self.encode_high_cardinality(data[column])
+        if self.dtype == 'bool' and not self.sparse:
+            return polars_engine.get_dummies(data[[column]], engine)
+        return pd.get_dummies(data[[column]], dtype=np.dtype(self.dtype), sparse=self.sparse)
+
+    def encode_high_cardinality(self, series):
+        """Frequency, hashed-bucket or ordinal encoding of a column above the cardinality cap."""
+        missing = series.isnull().to_numpy()
+        if self.high_cardinality == 'frequency':
+            frequency = series.map(series.value_counts(normalize=True)).to_numpy(dtype=np.float64, na_value=np.nan)
+            return pd.DataFrame({f'{series.name}_frequency': frequency}, index=series.index)
+
+        if self.high_cardinality == 'ordinal':
+            codes, _ = pd.factorize(series, sort=True)
+            return pd.DataFrame({f'{series.name}_code': np.where(missing, np.nan, codes)}, index=series.index)
+
+        buckets = pd.util.hash_array(series.to_numpy(dtype=object)) % np.uint64(self.n_buckets)
+        one_hot = np.zeros((len(series), self.n_buckets), dtype=np.dtype(self.dtype))
+        rows = np.flatnonzero(~missing)
+        one_hot[rows, buckets[rows].astype(np.int64)] = 1
+        dummies = pd.DataFrame(one_hot, index=series.index,
+                               columns=[f'{series.name}_hash_{bucket}' for bucket in range(self.n_buckets)])
+        return dummies.astype(pd.SparseDtype(one_hot.dtype, 0)) if self.sparse else dummies
+
+    def encode(self, data, versions, engine='pandas', exclude=(), cardinality=None):
+        """
+        One-hot encoding of `data`, identical to pd.get_dummies(data) with the configured dtype
+        and sparsity, reusing the cached encoding when no column changed version.
+
+        Parameters
+        --------
+        data : dataframe
+            Data to encode
+
+        versions : dict
+            Version of every column of `data`; columns without a version are always encoded again
+
+        engine : {'pandas', 'polars', 'auto'}, default = 'pandas'
+            Library encoding dense boolean dummies
+
+        exclude : set
+            Features left out of the encoding and of `data_all`
+
+        cardinality : dict, default = None
+            Number of distinct values of the categorical columns, when already known; the others
+            are counted if a cap is set
+        """
+        column_versions = tuple(versions.get(column) for column in data.columns)
+        key = (tuple(data.columns), column_versions, self.settings, frozenset(exclude))
+        if key == self.key and None not in column_versions:
+            return self.features
+
+        encoded = data.select_dtypes(include=['object', 'string', 'category']).columns
+        blocks = []
+        self.capped = {}
+        for column in encoded:
+            version = (versions.get(column), self.settings)
+            cached = self.blocks.get(column)
+            n_levels = None
+            if self.max_levels is not None:
+                n_levels = cardinality[column] if cardinality is not None and column in cardinality \
+                    else data[column].nunique()
+                if n_levels > self.max_levels:
+                    self.capped[column] = int(n_levels)
+            if version[0] is None or cached is None or cached[0] != version:
+                cached = (version, self.encode_column(data, column, engine, n_levels))
+                self.blocks[column] = cached
+            blocks.append(cached[1])
+
+        features = pd.concat([data.drop(columns=encoded)] + blocks, axis=1)
+        if exclude:
+            features = features.drop(columns=[feature for feature in features.columns if feature in exclude])
+        self.one_hot_features = [feature for block in blocks for feature in block.columns if feature not in exclude]
+        self.data_all = ColumnRegistry([(frame, [feature for feature in frame.columns if feature not in exclude])
+                                        for frame in blocks + [data]])
+        self.key, self.features = key, features
+
+        return features
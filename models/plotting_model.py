@@ -4,21 +4,31 @@ class PlottingModel:
 
     def get_missing_status(self):
         """
-        Return the missing fraction for each feature.
+        Return the missing fraction for each feature, from the profile if the missing values method has not run.
         """
-        return self.feature_selector_model.missing_stats
+        if self.feature_selector_model.missing_stats is not None:
+            return self.feature_selector_model.missing_stats
+        if self.feature_selector_model.column_profile is None:
+            return None
+        return self.feature_selector_model.column_profile.missing_stats()
 
-    def get_unique_stats(self):
+    def get_unique_stats(self, approximate=False):
         """
-        Return a DataFrame with the unique values statistics for each feature.
+        Return a DataFrame with the unique values statistics for each feature,
+        estimated with HyperLogLog sketches if `approximate`.
         """
-        return self.feature_selector_model.unique_stats
+        if self.feature_selector_model.record_single_unique is None:
+            return None
+        return self.feature_selector_model.get_unique_stats(approximate)
 
     def get_collinear_data(self):
         """
         Get the data for collinear features.
         """
-        return self.feature_selector_model.corr_matrix, self.feature_selector_model.record_collinear
+        model = self.feature_selector_model
+        # Under a memory budget the correlations are kept condensed and only expanded for the plot
+        corr_matrix = model.corr_condensed.to_frame() if model.corr_condensed is not None else model.corr_matrix
+        return corr_matrix, model.record_collinear
 
     def get_feature_importances_data(self):
         """
@@ -26,4 +36,27 @@ class PlottingModel:
         """
         return self.feature_selector_model.feature_importances, self.feature_selector_model.record_zero_importance
 
+    def feature_importances_stale(self):
+        """
+        Whether the data was edited after the feature importances were computed.
+        """
+        return self.feature_selector_model.feature_importances_stale
+
+    def get_validation_curve_data(self):
+        """
+        Get the validation score for each feature count and the suggested feature count.
+        """
+        return self.feature_selector_model.validation_curve, self.feature_selector_model.validation_curve_n_features
 
+    def get_stability_data(self):
+        """
+        Get the selection frequency of each feature and the frequency threshold.
+        """
+        return self.feature_selector_model.stability_scores, self.feature_selector_model.stability_threshold
+
+    def get_l1_path_data(self):
+        """
+        Get the cached L1 regularization path, the entry alpha of each feature and the number of features kept.
+        """
+        return (self.feature_selector_model.regularization_path, self.feature_selector_model.l1_path_stats,
+                self.feature_selector_model.l1_path_n_features)
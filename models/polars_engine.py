@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+
+# Polars is optional; without it every statistic is computed with pandas
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+
+def available():
+    return pl is not None
+
+
+def use_polars(engine):
+    """
+    Whether `engine` ('pandas', 'polars' or 'auto') resolves to Polars. Polars is opt-in: on one
+    thread it is slower than pandas on every bundled dataset (see benchmarks/benchmark_engines.py),
+    so 'pandas' is the default everywhere and 'auto' picks Polars only when it is installed and its
+    thread pool has more than one thread.
+    """
+    if engine not in ('pandas', 'polars', 'auto'):
+        raise ValueError("engine must be 'pandas', 'polars' or 'auto'.")
+    if engine == 'polars' and not available():
+        raise ValueError('The polars engine requires the polars package.')
+
+    # Polars can only pay off over the pandas path when it uses several threads
+    return engine == 'polars' or (engine == 'auto' and available() and pl.thread_pool_size() > 1)
+
+
+def to_polars(series):
+    """
+    Polars series of a pandas column with missing values as nulls, or None when the column
+    has no native Polars type (mixed objects, categoricals, datetimes), so pandas handles it.
+    """
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_extension_array_dtype(series):
+        values = series.to_numpy()
+        return pl.Series('value', values, nan_to_null=values.dtype.kind == 'f')
+
+    if pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+        try:
+            converted = pl.Series('value', series.to_numpy(dtype=object, na_value=None))
+        except TypeError:
+            # Values of mixed types
+            return None
+        if converted.dtype == pl.String:
+            return converted
+
+    return None
+
+
+def level_counts(data):
+    """
+    Distinct non-missing values of every column in order of first appearance (as pd.factorize
+    orders them), their counts and the null count, or None for columns left to pandas.
+    The per-column group-bys run as one batch of lazy queries on the Polars thread pool.
+    """
+    converted = [to_polars(data.iloc[:, position]) for position in range(data.shape[1])]
+    queries = [pl.LazyFrame({'value': series}).with_row_index('row').drop_nulls('value').group_by('value')
+               .agg(pl.len().alias('count'), pl.col('row').min().alias('first')).sort('first')
+               for series in converted if series is not None]
+    results = iter(pl.collect_all(queries))
+
+    counts = []
+    for series in converted:
+        if series is None:
+            counts.append(None)
+            continue
+        result = next(results)
+        levels = result['value'].to_numpy() if series.dtype != pl.String else np.array(
+            result['value'].to_list(), dtype=object)
+        counts.append((levels, result['count'].to_numpy().astype(np.int64), series.null_count()))
+
+    return counts
+
+
+def get_dummies(data, engine='pandas'):
+    """One-hot encoding of a dataframe, identical to pd.get_dummies(data) with either engine."""
+    return polars_get_dummies(data) if use_polars(engine) else pd.get_dummies(data)
+
+
+def polars_get_dummies(data):
+    """
+    One-hot encode the object and string columns of a dataframe with Polars, returning exactly
+    what pd.get_dummies(data) returns: the other columns first, then one boolean column
+    '<column>_<value>' per sorted distinct value. Columns Polars cannot represent are encoded by pandas.
+    """
+    encoded = data.select_dtypes(include=['object', 'string', 'category']).columns
+    if len(encoded) == 0:
+        return pd.get_dummies(data)
+
+    dummies = []
+    for column in encoded:
+        series = to_polars(data[column]) if not isinstance(data[column].dtype, pd.CategoricalDtype) else None
+        if series is None:
+            dummies.append(pd.get_dummies(data[[column]]))
+            continue
+
+        # Dense ranks are the codes of the sorted distinct values; nulls get no column
+        levels = series.drop_nulls().unique().sort().to_list()
+        codes = series.rank('dense').fill_null(0).to_numpy().astype(np.int64)
+        one_hot = np.zeros((len(codes), len(levels) + 1), dtype=bool)
+        one_hot[np.arange(len(codes)), codes] = True
+        dummies.append(pd.DataFrame(one_hot[:, 1:], index=data.index,
+                                    columns=[f'{column}_{level}' for level in levels]))
+
+    return pd.concat([data.drop(columns=encoded)] + dummies, axis=1)
@@ -0,0 +1,389 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from models import kernels
+
+
+def one_hot_labels(labels):
+    """
+    One-hot encode class labels into a dense (n_samples, n_classes) float matrix.
+    Missing labels get an all-zero row so they drop out of every class sum.
+    """
+    codes, classes = pd.factorize(pd.Series(np.asarray(labels).reshape((-1,))))
+    label_matrix = np.zeros((len(codes), len(classes)))
+    observed = codes >= 0
+    label_matrix[np.flatnonzero(observed), codes[observed]] = 1.0
+    return label_matrix
+
+
+def anova_f(features, labels):
+    """
+    ANOVA F statistic and p-value of every column of `features` against class `labels`.
+    Group counts, sums and sums of squares come from one matrix product each, so missing
+    values are excluded per column without looping over the columns.
+    """
+    label_matrix = one_hot_labels(labels)
+    observed = ~np.isnan(features)
+    values = np.where(observed, features, 0.0)
+
+    # (n_classes, n_features) group statistics
+    group_counts = label_matrix.T @ observed
+    group_sums = label_matrix.T @ values
+    squares_total = (label_matrix.T @ values ** 2).sum(axis=0)
+
+    counts = group_counts.sum(axis=0)
+    sums = group_sums.sum(axis=0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        correction = sums ** 2 / counts
+        squares_between = np.nansum(group_sums ** 2 / group_counts, axis=0) - correction
+        squares_within = squares_total - correction - squares_between
+
+        df_between = (group_counts > 0).sum(axis=0) - 1
+        df_within = counts - df_between - 1
+
+        f_statistic = (squares_between / df_between) / (squares_within / df_within)
+    p_values = stats.f.sf(f_statistic, df_between, df_within)
+
+    return f_statistic, p_values
+
+
+def chi2(features, labels):
+    """
+    Chi-squared statistic and p-value of every non-negative column of `features` against class `labels`.
+    Observed class totals are the product of the one-hot label matrix with the feature matrix.
+    Columns with negative values have no chi-squared statistic and are returned as NaN.
+    """
+    label_matrix = one_hot_labels(labels)
+    values = np.nan_to_num(features, nan=0.0)
+
+    observed = label_matrix.T @ values
+    class_prob = label_matrix.mean(axis=0).reshape((-1, 1))
+    expected = class_prob @ values.sum(axis=0).reshape((1, -1))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        chi2_statistic = np.nansum((observed - expected) ** 2 / expected, axis=0)
+    chi2_statistic[(values < 0).any(axis=0)] = np.nan
+    p_values = stats.chi2.sf(chi2_statistic, label_matrix.shape[1] - 1)
+
+    return chi2_statistic, p_values
+
+
+def pearson_r(features, target):
+    """
+    Pearson correlation and two-sided p-value of every column of `features` with a numeric `target`.
+    Each column uses the rows where both the column and the target are present.
+    """
+    target = np.asarray(target, dtype=np.float64).reshape((-1,))
+    target_observed = ~np.isnan(target)
+    observed = ~np.isnan(features) & target_observed.reshape((-1, 1))
+    values = np.where(observed, features, 0.0)
+    target = np.where(target_observed, target, 0.0)
+
+    counts = observed.sum(axis=0)
+    sum_x = values.sum(axis=0)
+    sum_xx = (values ** 2).sum(axis=0)
+    sum_y = target @ observed
+    sum_yy = target ** 2 @ observed
+    sum_xy = target @ values
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r = (counts * sum_xy - sum_x * sum_y) / np.sqrt(
+            (counts * sum_xx - sum_x ** 2) * (counts * sum_yy - sum_y ** 2))
+        r = np.clip(r, -1.0, 1.0)
+        t_statistic = r * np.sqrt((counts - 2) / (1 - r ** 2))
+    p_values = 2 * stats.t.sf(np.abs(t_statistic), counts - 2)
+
+    return r, p_values
+
+
+def quantile_edges(features, n_bins=10):
+    """Inner quantile bin edges of every column of `features`, as an (n_bins - 1, n_features) array."""
+    quantiles = np.linspace(0, 1, n_bins + 1)[1:-1]
+    with np.errstate(invalid='ignore'):
+        return np.nanquantile(features, quantiles, axis=0).reshape((len(quantiles), features.shape[1]))
+
+
+def bin_codes(features, edges, backend='auto'):
+    """
+    Assign every value of `features` the index of its bin among the per-column `edges`
+    (an (n_edges, n_features) array), as np.searchsorted would column by column. The loop runs
+    over the edges, each step comparing all columns at once. Missing values get the code n_edges + 1.
+    """
+    # Single-threaded, the compiled scan only matches the vectorized comparisons
+    if kernels.use_numba(backend, min_threads=2):
+        columns = np.ascontiguousarray(np.asarray(features, dtype=np.float64).T)
+        return kernels.numba_bin_codes(columns, np.asarray(edges, dtype=np.float64)).T
+
+    codes = np.zeros(features.shape, dtype=np.int64)
+    for edge in edges:
+        codes += features > edge
+    codes[np.isnan(features)] = len(edges) + 1
+
+    return codes
+
+
+def quantile_codes(features, n_bins=10, backend='auto'):
+    """
+    Quantile-bin every column of `features` into integer codes 0 .. n_bins - 1.
+    Missing values get their own code `n_bins`.
+    """
+    return bin_codes(features, quantile_edges(features, n_bins), backend)
+
+
+def factorize_codes(data):
+    """
+    Factorize every column of a dataframe into integer codes 0 .. n_levels - 1.
+    Missing values get the code after the last level.
+    """
+    codes = np.empty(data.shape, dtype=np.int64)
+    for position, column in enumerate(data.columns):
+        column_codes, levels = pd.factorize(data[column])
+        codes[:, position] = np.where(column_codes < 0, len(levels), column_codes)
+
+    return codes
+
+
+def level_offsets(n_levels):
+    """
+    Start of every column's histogram in the flat histograms of `joint_histograms` and
+    `column_histograms`, followed by their total length.
+    """
+    return np.concatenate([[0], np.cumsum(n_levels, dtype=np.int64)])
+
+
+def joint_histograms(codes, target_codes, n_levels, n_classes, backend='auto'):
+    """
+    (sum(n_levels), n_classes) counts of every pair of a column code and a target code. Column j
+    has `n_levels[j]` codes (an int applies to every column) and its histogram is the rows
+    level_offsets(n_levels)[j] to level_offsets(n_levels)[j + 1], so a column with many levels
+    does not widen the histograms of the others. The codes of each column are offset so all
+    histograms share one bincount.
+    """
+    offsets = level_offsets(np.broadcast_to(n_levels, codes.shape[1:]))
+    if kernels.use_numba(backend):
+        return kernels.numba_joint_histograms(codes, target_codes, offsets, n_classes)
+
+    joint_codes = (codes + offsets[:-1]) * n_classes + target_codes.reshape((-1, 1))
+    joint = np.bincount(joint_codes.ravel(), minlength=offsets[-1] * n_classes)
+    return joint.reshape((offsets[-1], n_classes))
+
+
+def column_histograms(codes, n_levels, backend='auto'):
+    """
+    Flat counts of the codes 0 .. n_levels[j] - 1 of every column j, from one bincount, laid out
+    by `level_offsets` as in `joint_histograms`.
+    """
+    offsets = level_offsets(np.broadcast_to(n_levels, codes.shape[1:]))
+    if kernels.use_numba(backend):
+        return kernels.numba_column_histograms(codes, offsets)
+
+    return np.bincount((codes + offsets[:-1]).ravel(), minlength=offsets[-1])
+
+
+def mutual_info(codes, target_codes, backend='auto'):
+    """
+    Mutual information (in nats) between every column of integer `codes` and integer `target_codes`.
+    The joint histograms of all columns are counted together by `joint_histograms`, each sized
+    by the number of levels of its own column.
+    A Miller-Madow correction removes the positive bias of the histogram estimate.
+    """
+    n_samples, n_features = codes.shape
+    if not n_features:
+        return np.zeros(0)
+    n_levels = codes.max(axis=0) + 1 if n_samples else np.ones(n_features, dtype=np.int64)
+    n_classes = target_codes.max() + 1
+    offsets = level_offsets(n_levels)
+    starts = offsets[:-1]
+
+    joint = joint_histograms(codes, target_codes, n_levels, n_classes, backend) / n_samples
+
+    # Every column sees every row, so all columns share the target marginal
+    feature_marginal = joint.sum(axis=1, keepdims=True)
+    target_marginal = np.bincount(target_codes, minlength=n_classes) / n_samples
+    with np.errstate(divide='ignore', invalid='ignore'):
+        terms = joint * np.log(joint / (feature_marginal * target_marginal))
+    mi = np.add.reduceat(np.nansum(terms, axis=1), starts)
+
+    # Miller-Madow bias correction from the number of occupied cells
+    occupied_levels = np.add.reduceat((feature_marginal[:, 0] > 0).astype(np.int64), starts)
+    occupied_classes = (target_marginal > 0).sum()
+    occupied_cells = np.add.reduceat((joint > 0).sum(axis=1), starts)
+    bias = (occupied_cells - occupied_levels - occupied_classes + 1) / (2 * n_samples)
+
+    return mi - bias
+
+
+def rank_auc(features, labels):
+    """
+    One-vs-rest ROC AUC of every column of `features` for every class of `labels`.
+    The columns are ranked in one vectorized sort (ties get average ranks), and each AUC
+    follows from the rank sum of the class (Mann-Whitney U). Returns an (n_classes, n_features) array.
+    """
+    label_matrix = one_hot_labels(labels)
+    # Rows without a label are left out before ranking, so they do not shift the ranks
+    labelled = label_matrix.sum(axis=1) > 0
+    ranks = stats.rankdata(features[labelled], axis=0)
+    label_matrix = label_matrix[labelled]
+
+    n_positive = label_matrix.sum(axis=0).reshape((-1, 1))
+    n_negative = len(label_matrix) - n_positive
+    rank_sums = label_matrix.T @ ranks
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (rank_sums - n_positive * (n_positive + 1) / 2) / (n_positive * n_negative)
+
+
+def spearman_r(features, target):
+    """
+    Spearman rank correlation of every column of `features` with a numeric `target`.
+    Each column and the target are ranked over the rows where both are present, as
+    scipy.stats.spearmanr(nan_policy='omit') does pair by pair. Columns observed wherever the
+    target is share one ranking of the target; the others re-rank it over their own rows.
+    """
+    features = np.asarray(features, dtype=np.float64)
+    target = np.asarray(target, dtype=np.float64).reshape((-1,))
+    target_observed = ~np.isnan(target)
+    observed = ~np.isnan(features) & target_observed.reshape((-1, 1))
+    complete = observed.sum(axis=0) == target_observed.sum()
+
+    r = np.empty(features.shape[1])
+    if complete.any():
+        ranks = stats.rankdata(features[target_observed][:, complete], axis=0)
+        r[complete] = pearson_r(ranks, stats.rankdata(target[target_observed]))[0]
+    for position in np.flatnonzero(~complete):
+        rows = observed[:, position]
+        ranks = stats.rankdata(features[rows, position]).reshape((-1, 1))
+        r[position] = pearson_r(ranks, stats.rankdata(target[rows]))[0][0]
+
+    return r
+
+
+def pairwise_moments(features):
+    """
+    Pairwise-complete moments of the columns of `features`, as (n_features, n_features) arrays:
+    entry (i, j) of the count, mean and M2 describes column i over the rows where column j is
+    also present, and the comoment is the sum of the products of both columns' deviations there.
+    The columns are centred on their means first, so the sums of the matrix products do not
+    cancel catastrophically.
+    """
+    with np.errstate(invalid='ignore'):
+        centre = np.nan_to_num(np.nanmean(features, axis=0)) if len(features) else np.zeros(features.shape[1])
+    observed = (~np.isnan(features)).astype(np.float64)
+    values = np.where(observed > 0, features - centre, 0.0)
+
+    count = observed.T @ observed
+    sums = values.T @ observed
+    with np.errstate(divide='ignore', invalid='ignore'):
+        shift = np.where(count > 0, sums / count, 0.0)
+    mean = centre.reshape((-1, 1)) + shift
+    m2 = (values ** 2).T @ observed - shift * sums
+    comoment = values.T @ values - shift * sums.T
+
+    return count, mean, m2, comoment
+
+
+def moments_correlation(count, m2, comoment):
+    """Pearson correlations from `pairwise_moments`; NaN for pairs with fewer than two shared rows or a constant column."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr = np.clip(comoment / np.sqrt(m2 * m2.T), -1.0, 1.0)
+    # M2 of a column that is constant over the shared rows is rounding error, and its correlation undefined
+    constant = m2 <= 1e-12 * np.maximum(np.abs(m2), 1.0) * count
+    corr[(count < 2) | constant | constant.T] = np.nan
+
+    return corr
+
+
+def pairwise_corr(features):
+    """
+    Pairwise-complete Pearson correlation matrix of the columns of a float array with NaN for
+    missing values, as DataFrame.corr computes it, built from four matrix products on BLAS.
+    """
+    features = np.asarray(features, dtype=np.float64)
+    count, _, m2, comoment = pairwise_moments(features)
+    return moments_correlation(count, m2, comoment)
+
+
+def cross_corr(features, others):
+    """
+    Pairwise-complete Pearson correlations between every column of `features` and every column
+    of `others`, as a (n_features, n_others) array: the rows of `pairwise_corr` for a subset of
+    the columns, for updating a correlation matrix after some of its columns change.
+    """
+    observed, values = [], []
+    for matrix in (features, others):
+        with np.errstate(invalid='ignore'):
+            centre = np.nan_to_num(np.nanmean(matrix, axis=0)) if len(matrix) else np.zeros(matrix.shape[1])
+        present = (~np.isnan(matrix)).astype(np.float64)
+        observed.append(present)
+        values.append(np.where(present > 0, matrix - centre, 0.0))
+    (observed_x, observed_y), (values_x, values_y) = observed, values
+
+    count = observed_x.T @ observed_y
+    sums_x = values_x.T @ observed_y
+    sums_y = observed_x.T @ values_y
+    with np.errstate(divide='ignore', invalid='ignore'):
+        shift_x = np.where(count > 0, sums_x / count, 0.0)
+        shift_y = np.where(count > 0, sums_y / count, 0.0)
+    m2_x = (values_x ** 2).T @ observed_y - shift_x * sums_x
+    m2_y = observed_x.T @ values_y ** 2 - shift_y * sums_y
+    comoment = values_x.T @ values_y - shift_x * sums_y
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr = np.clip(comoment / np.sqrt(m2_x * m2_y), -1.0, 1.0)
+    constant_x = m2_x <= 1e-12 * np.maximum(np.abs(m2_x), 1.0) * count
+    constant_y = m2_y <= 1e-12 * np.maximum(np.abs(m2_y), 1.0) * count
+    corr[(count < 2) | constant_x | constant_y] = np.nan
+
+    return corr
+
+
+def permute_columns(features, generator, backend='auto', parallel=True):
+    """
+    Shuffle every column of `features` independently, in place. The compiled kernel draws its
+    seed from `generator`, so both backends are reproducible but give different permutations.
+    Callers running in threads pass parallel=False, which gives the same permutation without
+    Numba's parallel threading layer.
+    """
+    if kernels.use_numba(backend):
+        permute = kernels.numba_permute_columns if parallel else kernels.numba_permute_columns_serial
+        permute(features, generator.integers(0, 2 ** 63))
+    else:
+        generator.permuted(features, axis=0, out=features)
+
+
+def merge_pairwise_moments(moments, other):
+    """Merge two sets of `pairwise_moments` of the same columns (Chan et al. parallel update)."""
+    count, mean, m2, comoment = moments
+    other_count, other_mean, other_m2, other_comoment = other
+    total = count + other_count
+    delta = other_mean - mean
+    with np.errstate(divide='ignore', invalid='ignore'):
+        weight = np.where(total > 0, count * other_count / total, 0.0)
+        merged_mean = np.where(total > 0, mean + delta * other_count / total, 0.0)
+    merged_m2 = m2 + other_m2 + delta ** 2 * weight
+    merged_comoment = comoment + other_comoment + delta * delta.T * weight
+
+    return total, merged_mean, merged_m2, merged_comoment
+
+
+def population_stability_index(reference_codes, codes, n_levels, epsilon=1e-4, backend='auto'):
+    """
+    Population stability index of every column between two integer code matrices with codes
+    0 .. n_levels[j] - 1 in column j (an int applies to every column). The histograms of all
+    columns are counted together by `column_histograms`, and empty bins are smoothed with
+    `epsilon` so the logarithm stays finite.
+    """
+    n_levels = np.broadcast_to(n_levels, codes.shape[1:])
+    starts = level_offsets(n_levels)[:-1]
+    if not len(starts):
+        return np.zeros(0)
+
+    def histograms(column_codes):
+        return column_histograms(column_codes, n_levels, backend) / max(column_codes.shape[0], 1)
+
+    reference = np.maximum(histograms(reference_codes), epsilon)
+    comparison = np.maximum(histograms(codes), epsilon)
+
+    return np.add.reduceat((comparison - reference) * np.log(comparison / reference), starts)
@@ -0,0 +1,80 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from models import kernels, statistics
+from models.feature_selector_model import FeatureSelectorModel
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+BACKENDS = ['numpy'] + (['numba'] if kernels.available() else [])
+
+
+def make_model(backend='numpy'):
+    rng = np.random.default_rng(0)
+    features = pd.DataFrame(rng.normal(size=(600, 6)), columns=['signal_a', 'signal_b', 'noise_a', 'noise_b',
+                                                                 'noise_c', 'noise_d'])
+    labels = (features['signal_a'] + features['signal_b'] + 0.3 * rng.normal(size=600) > 0).astype(int)
+    model = FeatureSelectorModel()
+    model.load_data(features)
+    model.labels = labels
+    model.kernel_backend = backend
+    return model
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_boruta_accepts_signal_and_rejects_noise(backend):
+    model = make_model(backend)
+    to_drop, details = model.identify_boruta(n_iterations=20, n_jobs=2, random_state=0)
+
+    decisions = model.record_boruta.set_index('feature')['decision']
+    assert decisions['signal_a'] == 'accepted'
+    assert decisions['signal_b'] == 'accepted'
+    assert not set(to_drop) & {'signal_a', 'signal_b'}
+    assert (decisions.filter(like='noise') != 'accepted').all()
+    assert set(to_drop) == set(decisions[decisions == 'rejected'].index)
+    assert 'after' in details
+
+
+def test_boruta_is_reproducible():
+    first, second = make_model(), make_model()
+    first.identify_boruta(n_iterations=8, n_jobs=2, random_state=1)
+    second.identify_boruta(n_iterations=8, n_jobs=2, random_state=1)
+    pd.testing.assert_frame_equal(first.record_boruta, second.record_boruta)
+
+
+def test_memory_budget_limits_the_boruta_workers():
+    # 600 x 6 float32 features take 14400 bytes, and every worker's buffer twice that
+    assert FeatureSelectorModel.boruta_footprint(600, 6, 3) == 14400 + 3 * 28800
+    budgeted, serial = make_model(), make_model()
+    budgeted.memory_budget = 80000
+    _, details = budgeted.identify_boruta(n_iterations=8, n_jobs=3, random_state=1)
+    assert '(2 workers to stay within the memory budget)' in details
+
+    # Below a single buffer the rounds still run, one at a time, as with one job
+    budgeted.memory_budget = 1000
+    _, details = budgeted.identify_boruta(n_iterations=8, n_jobs=3, random_state=1)
+    serial.identify_boruta(n_iterations=8, n_jobs=1, random_state=1)
+    assert '(1 workers to stay within the memory budget)' in details
+    pd.testing.assert_frame_equal(budgeted.record_boruta, serial.record_boruta)
+
+
+@pytest.mark.skipif(not kernels.available(), reason='numba is not installed')
+def test_serial_permutation_matches_parallel():
+    values = np.arange(4000, dtype=np.float32).reshape((500, 8))
+    parallel, serial = values.copy(), values.copy()
+    statistics.permute_columns(parallel, np.random.default_rng(3), 'numba')
+    statistics.permute_columns(serial, np.random.default_rng(3), 'numba', parallel=False)
+    np.testing.assert_array_equal(parallel, serial)
+    np.testing.assert_array_equal(np.sort(serial, axis=0), values)
+
+
+@pytest.mark.skipif(not kernels.available(), reason='numba is not installed')
+def test_process_exits_after_threaded_boruta():
+    # Starting Numba's parallel runtime from the threaded rounds used to hang the interpreter at exit
+    script = ('from tests.test_boruta import make_model\n'
+              "make_model('auto').identify_boruta(n_iterations=4, n_jobs=2, random_state=0)\n")
+    subprocess.run([sys.executable, '-c', script], cwd=ROOT_DIR, timeout=120, check=True, capture_output=True)
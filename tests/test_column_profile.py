@@ -0,0 +1,110 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from models import polars_engine
+from models.column_profile import ChunkedColumnProfile, ColumnProfile, constant_columns, is_constant
+
+DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    n_rows = 2000
+    data = pd.DataFrame({
+        'normal': rng.normal(size=n_rows),
+        'counts': rng.poisson(2.0, n_rows),
+        'constant': np.ones(n_rows),
+        'city': rng.choice(['a', 'b', 'c'], n_rows),
+        'flag': rng.random(n_rows) < 0.9,
+    })
+    data.loc[rng.random(n_rows) < 0.2, 'normal'] = np.nan
+    data.loc[rng.random(n_rows) < 0.1, 'city'] = None
+    data.loc[5, 'constant'] = np.nan
+    return data
+
+
+def test_profile_matches_pandas(data):
+    profile = ColumnProfile(data)
+    stats = profile.stats
+    pd.testing.assert_series_equal(stats['null_count'], data.isnull().sum(), check_names=False, check_dtype=False)
+    pd.testing.assert_series_equal(stats['nunique'], data.nunique(), check_names=False, check_dtype=False)
+
+    numeric = ['normal', 'counts', 'constant']
+    for column in numeric:
+        assert stats.loc[column, 'mean'] == pytest.approx(data[column].mean(), rel=1e-12)
+        assert stats.loc[column, 'variance'] == pytest.approx(data[column].var(), rel=1e-9, abs=1e-15)
+        assert stats.loc[column, 'min'] == data[column].min()
+        assert stats.loc[column, 'max'] == data[column].max()
+    assert stats.loc['city', 'dominant_value'] == data['city'].value_counts().idxmax()
+    assert stats.loc['city', 'dominant_count'] == data['city'].value_counts().max()
+    # Profiling does not rename the columns of the data
+    assert data.columns.name is None
+
+
+def test_parallel_profile_matches_sequential(data):
+    sequential = ColumnProfile(data, n_jobs=1).stats
+    parallel = ColumnProfile(data, n_jobs=2, min_parallel_cells=0).stats
+    pd.testing.assert_frame_equal(parallel, sequential)
+
+
+@pytest.mark.skipif(not polars_engine.available(), reason='polars is not installed')
+def test_polars_profile_matches_pandas(data):
+    pd.testing.assert_frame_equal(ColumnProfile(data, engine='polars').stats, ColumnProfile(data).stats)
+
+
+def test_missing_and_dominant_fractions(data):
+    profile = ColumnProfile(data)
+    missing = profile.missing_stats()['missing_fraction']
+    pd.testing.assert_series_equal(missing.sort_index(), data.isnull().mean().sort_index(), check_names=False)
+    assert profile.dominant_fraction()['constant'] == 1.0
+
+
+def test_constant_columns(data):
+    assert constant_columns(data) == ['constant']
+    assert is_constant(pd.Series([np.nan] * 3000 + [1.0] * 3000))
+    assert not is_constant(pd.Series([np.nan, np.nan]))
+    assert not is_constant(pd.Series([1] * 5000 + [2]), block_size=16)
+    assert is_constant(pd.Series(['x', None, 'x'], dtype='category'))
+
+
+def test_chunked_profile_matches_in_memory(data):
+    numeric = ['normal', 'counts', 'constant']
+    chunked = ChunkedColumnProfile(data.columns, numeric)
+    for start in range(0, len(data), 300):
+        chunked.update(data.iloc[start:start + 300])
+    in_memory = ColumnProfile(data)
+
+    pd.testing.assert_frame_equal(chunked.missing_stats().sort_index(), in_memory.missing_stats().sort_index())
+    pd.testing.assert_frame_equal(chunked.unique_stats().sort_index(), in_memory.unique_stats().sort_index(),
+                                  check_dtype=False)
+    assert chunked.constant_columns() == ['constant']
+    np.testing.assert_allclose(chunked.correlation().to_numpy(), data[numeric].corr().to_numpy(), atol=1e-12)
+
+
+def test_merged_chunked_profiles_match_one_pass(data):
+    numeric = ['normal', 'counts']
+    first, second, whole = (ChunkedColumnProfile(data.columns, numeric) for _ in range(3))
+    first.update(data.iloc[:700])
+    second.update(data.iloc[700:])
+    whole.update(data)
+    merged = first.merge(second)
+
+    assert merged.n_rows == whole.n_rows
+    pd.testing.assert_series_equal(merged.null_count, whole.null_count)
+    assert merged.constant_columns() == whole.constant_columns()
+    np.testing.assert_allclose(merged.correlation().to_numpy(), whole.correlation().to_numpy(), atol=1e-12)
+
+
+def test_chunked_profile_from_csv():
+    path = DATA_DIR / '1.csv'
+    data = pd.read_csv(path)
+    chunked = ChunkedColumnProfile.from_csv(path, chunksize=700)
+
+    assert chunked.n_rows == len(data)
+    pd.testing.assert_frame_equal(chunked.missing_stats().sort_index(),
+                                  ColumnProfile(data).missing_stats().sort_index())
+    np.testing.assert_allclose(chunked.correlation().to_numpy(), data.corr().to_numpy(), atol=1e-12)
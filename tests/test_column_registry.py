@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.column_registry import ColumnRegistry
+
+
+@pytest.fixture
+def frames():
+    dummies = pd.DataFrame({'city_a': [True, False, True], 'city_b': [False, True, False]})
+    data = pd.DataFrame({'value': [1.0, 2.0, np.nan], 'city': ['a', 'b', 'a'], 'city_a': [0, 0, 0]})
+    return dummies, data
+
+
+def test_materialize_matches_concatenation(frames):
+    dummies, data = frames
+    registry = ColumnRegistry([(dummies, dummies.columns), (data, data.columns)])
+    expected = pd.concat([dummies, data.drop(columns=['city_a'])], axis=1)
+
+    # A name registered twice keeps its first source
+    pd.testing.assert_frame_equal(registry.materialize(), expected)
+    assert registry.columns == list(expected.columns)
+    assert registry.shape == expected.shape
+    assert len(registry) == 4
+    assert 'city' in registry
+
+
+def test_drop_matches_dataframe_drop(frames):
+    dummies, data = frames
+    registry = ColumnRegistry([(dummies, dummies.columns), (data, data.columns)])
+    expected = pd.concat([dummies, data.drop(columns=['city_a'])], axis=1).drop(columns=['city_b', 'value'])
+
+    dropped = registry.drop(['city_b', 'value'])
+    pd.testing.assert_frame_equal(dropped.materialize(), expected)
+    # Dropping returns a new registry
+    assert len(registry) == 4
+
+
+def test_drop_of_unknown_columns(frames):
+    dummies, data = frames
+    registry = ColumnRegistry([(data, data.columns)])
+    with pytest.raises(KeyError):
+        registry.drop(['missing'])
+    assert registry.drop(['missing', 'city'], errors='ignore').columns == ['value', 'city_a']
+
+
+def test_materialized_frame_is_independent(frames):
+    dummies, data = frames
+    result = ColumnRegistry([(data, ['value'])]).materialize()
+    result.loc[0, 'value'] = 10.0
+    assert data.loc[0, 'value'] == 1.0
+
+
+def test_empty_registry():
+    registry = ColumnRegistry()
+    assert registry.shape == (0, 0)
+    assert registry.materialize().empty
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from models import statistics
+from models.condensed_correlation import CondensedCorrelation
+from models.feature_selector_model import FeatureSelectorModel
+
+
+@pytest.fixture
+def features():
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(400, 9)) @ rng.normal(size=(9, 9))
+    values[rng.random(values.shape) < 0.1] = np.nan
+    values[:, 4] = 2.0
+    return pd.DataFrame(values, columns=[f'f{i}' for i in range(9)])
+
+
+@pytest.mark.parametrize('tile_size', [1, 4, 256])
+def test_condensed_matches_dense(features, tile_size):
+    condensed = CondensedCorrelation.from_features(features, tile_size)
+    dense = statistics.pairwise_corr(features.to_numpy())
+
+    assert condensed.values.dtype == np.float32
+    assert condensed.nbytes == 4 * 9 * 8 // 2
+    assert condensed.shape == (9, 9)
+    rows, columns = np.triu_indices(9, k=1)
+    np.testing.assert_allclose(condensed.values, dense[rows, columns], atol=1e-7)
+    np.testing.assert_allclose(condensed.to_frame().to_numpy(), features.corr().to_numpy(), atol=1e-7)
+
+
+def test_pairs_above_matches_dense_threshold(features):
+    condensed = CondensedCorrelation.from_features(features, tile_size=3)
+    dense = statistics.pairwise_corr(features.to_numpy())
+    rows, columns = np.triu_indices(9, k=1)
+    expected = np.abs(np.nan_to_num(dense[rows, columns])) > 0.3
+
+    found_rows, found_columns, values = condensed.pairs_above(0.3)
+    np.testing.assert_array_equal(found_rows, rows[expected])
+    np.testing.assert_array_equal(found_columns, columns[expected])
+    np.testing.assert_allclose(values, dense[found_rows, found_columns], atol=1e-7)
+
+
+def test_column_maxima_match_dense(features):
+    condensed = CondensedCorrelation.from_features(features)
+    dense = np.abs(statistics.pairwise_corr(features.to_numpy()))
+    # Strongest correlation of every column with an earlier column, skipping NaN
+    expected = pd.DataFrame(np.where(np.triu(np.ones((9, 9), dtype=bool), k=1), dense, np.nan)).max().to_numpy()
+    np.testing.assert_allclose(condensed.column_maxima(), expected, atol=1e-7)
+
+
+def test_memory_budget_keeps_collinear_results(features):
+    features['f8'] = features['f0'] * 2 + 0.01 * features['f1']
+    results = []
+    for memory_budget in (None, 1):
+        model = FeatureSelectorModel()
+        model.load_data(features)
+        model.memory_budget = memory_budget
+        to_drop, _ = model.identify_collinear(0.5)
+        sweep = model.sweep_thresholds(correlation_thresholds=[0.2, 0.5, 0.9])['collinear']
+        results.append((to_drop, model.record_collinear.reset_index(drop=True), sweep))
+    assert model.corr_condensed is not None
+
+    assert results[0][0] == results[1][0]
+    pd.testing.assert_frame_equal(results[0][1], results[1][1], check_exact=False, atol=1e-7)
+    pd.testing.assert_frame_equal(results[0][2], results[1][2])
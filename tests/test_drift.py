@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.feature_selector_model import FeatureSelectorModel
+
+
+def make_datasets():
+    rng = np.random.default_rng(0)
+    reference = pd.DataFrame({'stable': rng.normal(size=2000), 'shifted': rng.normal(size=2000),
+                              'city': rng.choice(['a', 'b'], 2000), 'target': rng.integers(0, 2, 2000)})
+    comparison = pd.DataFrame({'stable': rng.normal(size=1500), 'shifted': rng.normal(1.5, 1.0, 1500),
+                               'city': rng.choice(['a', 'b', 'c'], 1500, p=[0.2, 0.2, 0.6]),
+                               'target': rng.integers(0, 2, 1500)})
+    return reference, comparison
+
+
+def reference_psi(reference, comparison, n_bins=10, epsilon=1e-4):
+    """PSI of one numeric column over quantile bins of the reference data, computed directly."""
+    edges = np.nanquantile(reference, np.linspace(0, 1, n_bins + 1)[1:-1])
+    expected = np.bincount(np.searchsorted(edges, reference), minlength=n_bins) / len(reference)
+    actual = np.bincount(np.searchsorted(edges, comparison), minlength=n_bins) / len(comparison)
+    expected, actual = np.maximum(expected, epsilon), np.maximum(actual, epsilon)
+    return ((actual - expected) * np.log(actual / expected)).sum()
+
+
+def test_drift_end_to_end():
+    reference, comparison = make_datasets()
+    model = FeatureSelectorModel()
+    model.load_data(reference, {'next_month': comparison})
+    result = model.select_features({'Distribution Drift': {'psi_threshold': 0.25, 'n_bins': 10}}, 'target')
+
+    stats = model.drift_stats.set_index('feature')
+    assert set(model.removal_ops['drift']) == {'shifted', 'city'}
+    assert 'stable' in result.columns and 'shifted' not in result.columns
+    for column in ('stable', 'shifted'):
+        assert stats.loc[column, 'next_month'] == pytest.approx(
+            reference_psi(reference[column].to_numpy(), comparison[column].to_numpy()), rel=1e-9)
+
+    # Unseen level 'c' shares one bin, next to the reference levels and the missing bin
+    city = pd.Index(['a', 'b']).get_indexer(comparison['city'])
+    actual = np.maximum(np.bincount(np.where(city < 0, 2, city), minlength=4) / len(comparison), 1e-4)
+    expected = np.maximum(np.append(reference['city'].value_counts(normalize=True)[['a', 'b']].to_numpy(),
+                                    [0, 0]), 1e-4)
+    assert stats.loc['city', 'next_month'] == pytest.approx(((actual - expected) * np.log(actual / expected)).sum())
+
+
+def test_drift_without_comparison_data_is_skipped():
+    reference, _ = make_datasets()
+    details = []
+    model = FeatureSelectorModel()
+    model.method_result_signal.connect(lambda to_drop, text: details.append((to_drop, text)))
+    model.load_data(reference)
+    result = model.select_features({'Missing Values': {'missing_threshold': 0.5},
+                                    'Distribution Drift': {'psi_threshold': 0.25, 'n_bins': 10}}, 'target')
+
+    assert list(result.columns) == ['stable', 'shifted', 'city']
+    assert details[1][0] == []
+    assert 'No comparison data' in details[1][1]
@@ -0,0 +1,66 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.dtype_plan import optimize_dtypes, plan_dtypes
+from models.feature_selector_model import FeatureSelectorModel
+
+DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
+
+
+def test_integers_narrow_to_signed_types():
+    data = pd.DataFrame({'small': [0, 100], 'unsigned_range': [0, 200], 'negative': [-40000, 5],
+                         'wide': [0, 2 ** 40]})
+    assert plan_dtypes(data) == {'small': np.dtype(np.int8), 'unsigned_range': np.dtype(np.int16),
+                                 'negative': np.dtype(np.int32)}
+    narrowed, _ = optimize_dtypes(data)
+    # Differences of non-negative columns do not wrap around
+    assert (narrowed['unsigned_range'].diff().dropna() == 200).all()
+
+
+def test_floats_narrow_within_tolerance():
+    data = pd.DataFrame({'decimals': [0.1, 2.35, np.nan], 'halves': [0.5, 1.5, 2.0],
+                         'large': [1e300, 1.0, 2.0], 'precise': [1.0, 1.0 + 1e-12, 3.0]})
+    # Lossless by default: only values float32 holds exactly narrow
+    assert plan_dtypes(data) == {'halves': np.dtype(np.float32)}
+    assert plan_dtypes(data, rtol=1e-6) == {'decimals': np.dtype(np.float32), 'halves': np.dtype(np.float32),
+                                            'precise': np.dtype(np.float32)}
+
+
+def test_strings_become_categoricals_below_the_fraction():
+    data = pd.DataFrame({'level': ['a', 'b', 'a', 'b'], 'id': ['w', 'x', 'y', 'z']})
+    assert plan_dtypes(data) == {'level': 'category'}
+
+
+def test_report_measures_the_memory_saved():
+    data = pd.DataFrame({'value': np.arange(1000), 'level': ['a', 'b'] * 500})
+    narrowed, report = optimize_dtypes(data)
+    assert report['memory_before'] == data.memory_usage(deep=True).sum()
+    assert report['memory_after'] == narrowed.memory_usage(deep=True).sum()
+    assert report['memory_after'] < report['memory_before']
+
+
+@pytest.mark.parametrize('file_name', ['1.csv', '3.csv'])
+@pytest.mark.parametrize('rtol', [0, 1e-6])
+def test_filter_results_match_on_planned_dtypes(file_name, rtol):
+    raw = pd.read_csv(DATA_DIR / file_name)
+    planned, report = optimize_dtypes(raw, rtol=rtol)
+    assert report['plan']
+
+    for column in raw.columns:
+        if pd.api.types.is_numeric_dtype(raw[column]):
+            np.testing.assert_allclose(planned[column].to_numpy(np.float64), raw[column].to_numpy(np.float64),
+                                       rtol=rtol, atol=0)
+        else:
+            assert planned[column].astype(object).equals(raw[column].astype(object))
+
+    results = []
+    for data in (raw, planned):
+        model = FeatureSelectorModel()
+        model.load_data(data)
+        results.append([model.identify_missing(0.3)[0], model.identify_single_unique()[0],
+                        model.identify_collinear(0.8)[0], model.identify_collinear(0.8, one_hot=True)[0],
+                        model.identify_near_constant(0.95)[0]])
+    assert results[0] == results[1]
@@ -0,0 +1,185 @@
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.feature_selector_model import FeatureSelectorModel
+
+
+def make_data(seed=0, n_rows=1000):
+    rng = np.random.default_rng(seed)
+    base = rng.normal(size=(n_rows, 3))
+    data = pd.DataFrame({
+        'a': base[:, 0],
+        'b': base[:, 0] + 0.1 * base[:, 1],
+        'c': base[:, 1],
+        'd': np.where(rng.random(n_rows) < 0.6, np.nan, base[:, 2]),
+        'e': -base[:, 1] + 0.05 * base[:, 2],
+        'city': rng.choice(['x', 'y', 'z'], n_rows),
+        'kind': rng.choice(['p', 'q'], n_rows),
+    })
+    return data
+
+
+def run_filters(model):
+    results = {}
+    for one_hot in (False, True):
+        model.identify_collinear(0.8, one_hot=one_hot)
+        results[one_hot] = (model.corr_matrix.copy(), model.record_collinear.reset_index(drop=True))
+    model.identify_missing(0.5)
+    return results, model.missing_stats, model.column_profile.stats, model.get_one_hot()
+
+
+def test_update_columns_matches_a_fresh_model():
+    data = make_data()
+    model = FeatureSelectorModel()
+    model.load_data(data)
+    run_filters(model)
+
+    # Edit, remove, rename and add columns in place, recording each edit
+    data['a'] = data['a'] * 2 + np.random.default_rng(1).random(len(data))
+    model.update_columns(data, changed=['a'])
+    data.drop(columns=['c'], inplace=True)
+    model.update_columns(data, removed=['c'])
+    data.rename(columns={'city': 'town'}, inplace=True)
+    model.update_columns(data, changed=['town'], removed=['city'])
+    data['f'] = data['e'] * 3 + 1
+    model.update_columns(data, changed=['f'])
+    model.load_data(data)
+    incremental = run_filters(model)
+
+    fresh = FeatureSelectorModel()
+    fresh.load_data(data.copy())
+    expected = run_filters(fresh)
+
+    for one_hot in (False, True):
+        corr, record = incremental[0][one_hot]
+        expected_corr, expected_record = expected[0][one_hot]
+        assert list(corr.columns) == list(expected_corr.columns)
+        np.testing.assert_allclose(corr.to_numpy(), expected_corr.to_numpy(), atol=1e-12)
+        pd.testing.assert_frame_equal(record, expected_record, check_exact=False, atol=1e-12)
+    for result, expected_result in zip(incremental[1:], expected[1:]):
+        pd.testing.assert_frame_equal(result, expected_result)
+
+
+def test_edits_mark_importances_stale():
+    data = make_data()
+    model = FeatureSelectorModel()
+    model.load_data(data)
+    model.feature_importances = pd.DataFrame({'feature': ['a'], 'importance': [1.0]})
+    data['a'] = 0.0
+    model.update_columns(data, changed=['a'])
+
+    assert model.feature_importances_stale
+    with pytest.raises(NotImplementedError):
+        model.identify_low_importance(0.9)
+
+
+def test_one_hot_encoding_is_shared_until_an_edit():
+    data = make_data()
+    model = FeatureSelectorModel()
+    model.load_data(data)
+    encoded = model.get_one_hot()
+    assert model.get_one_hot() is encoded
+    pd.testing.assert_frame_equal(encoded, pd.get_dummies(data))
+
+    data['kind'] = data['kind'].replace({'q': 'r'})
+    model.update_columns(data, changed=['kind'])
+    pd.testing.assert_frame_equal(model.get_one_hot(), pd.get_dummies(data))
+
+
+def make_labelled_data(seed=0, n_rows=1000):
+    data = make_data(seed, n_rows)
+    data['target'] = (data['a'] + data['c'] > 0).astype(int)
+    data['empty'] = np.nan
+    data.loc[::2, 'empty'] = 1.0
+    data.loc[::3, 'empty'] = np.nan
+    return data
+
+
+CASCADE_METHODS = {
+    'Collinear Features': {'correlation_threshold': 0.8, 'one_hot': False},
+    'Missing Values': {'missing_threshold': 0.5},
+    'Single Unique Value': {},
+}
+
+
+def test_cascade_runs_cheap_methods_first_and_attributes_each_drop_once():
+    data = make_labelled_data()
+    summaries = []
+    model = FeatureSelectorModel()
+    model.final_results_signal.connect(summaries.append)
+    model.load_data(data)
+    model.select_features(CASCADE_METHODS, 'target', cascade=True)
+
+    caught = {line.split(' caught ')[0]: line for line in summaries[0]['removal_summary'] if ' caught ' in line}
+    assert list(caught) == ['Missing Values', 'Single Unique Value', 'Collinear Features']
+    # 'd' and 'empty' are mostly missing, so the correlation step never sees them
+    assert set(model.removal_ops['missing']) == {'d', 'empty'}
+    assert not {'d', 'empty'} & set(model.corr_matrix.columns)
+    assert model.pruned_features == set()
+    assert list(model.data.columns) == [column for column in data.columns if column != 'target']
+
+
+def test_cascade_and_plain_runs_drop_the_same_features():
+    results = []
+    for cascade in (False, True):
+        model = FeatureSelectorModel()
+        model.load_data(make_labelled_data())
+        results.append(set(model.select_features(CASCADE_METHODS, 'target', cascade=cascade).columns))
+    assert results[0] == results[1]
+
+
+def test_failed_cascade_restores_the_data():
+    data = make_labelled_data()
+    model = FeatureSelectorModel()
+    model.load_data(data)
+    threads = threading.active_count()
+
+    # Low importance needs the zero importance method first, so the cascade fails after pruning
+    methods = dict(CASCADE_METHODS, **{'Low Importance Features': {'cumulative_importance': 0.9}})
+    with pytest.raises(NotImplementedError):
+        model.select_features(methods, 'target', cascade=True)
+
+    assert model.pruned_features == set()
+    assert list(model.data.columns) == [column for column in data.columns if column != 'target']
+    assert threading.active_count() == threads
+
+    # A following plain run sees every feature again
+    model.identify_collinear(0.8, one_hot=True)
+    assert {'d', 'empty'} <= set(model.corr_matrix.columns)
+
+
+def test_load_data_forgets_pruned_features():
+    model = FeatureSelectorModel()
+    model.pruned_features = {'a'}
+    model.load_data(make_data())
+    assert model.pruned_features == set()
+
+
+def test_cardinality_cap_reaches_the_removal_summary():
+    data = make_labelled_data(n_rows=1500)
+    data['user_id'] = ['user_%d' % row for row in range(len(data))]
+    data['store'] = ['store_%d' % (row % 800) for row in range(len(data))]
+    summaries = []
+    model = FeatureSelectorModel()
+    model.final_results_signal.connect(summaries.append)
+    # The policy the dialog passes on with its default cap
+    model.one_hot.max_levels = 1000
+    model.one_hot.high_cardinality = 'frequency'
+    model.load_data(data)
+    model.select_features({'Collinear Features': {'correlation_threshold': 0.8, 'one_hot': True}}, 'target')
+
+    assert model.one_hot.capped == {'user_id': 1500}
+    assert 'user_id_frequency' in model.corr_matrix.columns
+    assert 'store_store_0' in model.corr_matrix.columns
+    assert ('Encoded with frequency encoding instead of one-hot (more than 1000 levels): user_id (1500 levels)'
+            in summaries[0]['removal_summary'])
+
+    # Without a cap every column is one-hot encoded and the summary has no such line
+    model.one_hot.max_levels = None
+    model.load_data(data)
+    model.select_features({'Collinear Features': {'correlation_threshold': 0.8, 'one_hot': True}}, 'target')
+    assert model.one_hot.capped == {}
+    assert not any(line.startswith('Encoded with') for line in summaries[1]['removal_summary'])
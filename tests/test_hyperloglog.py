@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.hyperloglog import HyperLogLog, leading_zeros, sketch_columns
+
+
+def test_leading_zeros():
+    words = np.array([0, 1, 2 ** 31, 2 ** 32, 2 ** 63, 2 ** 64 - 1], dtype=np.uint64)
+    np.testing.assert_array_equal(leading_zeros(words), [64, 63, 32, 31, 0, 0])
+
+
+def test_count_is_exact_below_the_limit():
+    sketch = HyperLogLog(exact_limit=4096).update(np.arange(3000) % 1000)
+    assert sketch.is_exact
+    assert sketch.count() == 1000
+
+
+def test_missing_values_are_not_counted():
+    sketch = HyperLogLog().update(pd.Series(['a', None, 'b', np.nan, 'a']))
+    assert sketch.count() == 2
+
+
+@pytest.mark.parametrize('n_distinct', [10000, 200000])
+def test_approximate_count_within_error_bound(n_distinct):
+    sketch = HyperLogLog(precision=14).update(np.arange(n_distinct).astype(np.float64) * 0.5)
+    assert not sketch.is_exact
+    # Four standard errors, so a correct sketch practically never fails
+    assert abs(sketch.count() - n_distinct) <= 4 * sketch.relative_error * n_distinct
+
+
+def test_merge_counts_the_union():
+    values = np.arange(50000)
+    left = HyperLogLog().update(values[:30000])
+    right = HyperLogLog().update(values[20000:])
+    merged = left.merge(right)
+    assert merged.registers is not None
+    np.testing.assert_array_equal(merged.registers, HyperLogLog().update(values).registers)
+
+
+def test_merge_of_exact_sketches_stays_exact():
+    merged = HyperLogLog().update(np.arange(100)).merge(HyperLogLog().update(np.arange(50, 150)))
+    assert merged.is_exact
+    assert merged.count() == 150
+
+
+def test_merge_rejects_different_precisions():
+    with pytest.raises(ValueError):
+        HyperLogLog(precision=10).merge(HyperLogLog(precision=12))
+
+
+def test_sketch_columns_matches_whole_column_sketches():
+    data = pd.DataFrame({'id': np.arange(20000), 'level': np.arange(20000) % 7})
+    sketches = sketch_columns(data, chunk_size=3000)
+    assert sketches['level'].count() == 7
+    np.testing.assert_array_equal(sketches['id'].registers, HyperLogLog().update(data['id']).registers)
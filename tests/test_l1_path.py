@@ -0,0 +1,57 @@
+import warnings
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression, lasso_path
+
+from models import l1_path
+
+
+@pytest.fixture
+def features():
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(400, 8)) @ rng.normal(size=(8, 8))
+    values[rng.random(values.shape) < 0.05] = np.nan
+    return l1_path.standardize(values)
+
+
+def test_standardize(features):
+    assert not np.isnan(features).any()
+    np.testing.assert_allclose(features.mean(axis=0), 0.0, atol=1e-12)
+    np.testing.assert_allclose(features.std(axis=0), 1.0)
+
+
+def test_no_feature_enters_at_the_largest_alpha(features):
+    labels = features[:, 0] + np.random.default_rng(1).normal(size=len(features))
+    alphas = l1_path.alpha_grid(features, labels, n_alphas=20)
+    coefs = l1_path.l1_path(features, labels, alphas)
+    assert not coefs[:, 0].any()
+    assert coefs[:, -1].any()
+    assert alphas[-1] == pytest.approx(alphas[0] * 1e-3)
+
+
+def test_lasso_path_matches_sklearn(features):
+    labels = 2 * features[:, 1] - features[:, 3] + np.random.default_rng(2).normal(size=len(features))
+    alphas = l1_path.alpha_grid(features, labels, n_alphas=30)
+    coefs = l1_path.l1_path(features, labels, alphas, tol=1e-10, max_iter=10000)
+    _, expected, _ = lasso_path(features, labels - labels.mean(), alphas=alphas, tol=1e-10, max_iter=10000)
+    np.testing.assert_allclose(coefs, expected, atol=1e-6)
+
+
+def test_logistic_path_matches_liblinear(features):
+    rng = np.random.default_rng(3)
+    labels = (features[:, 2] - features[:, 5] + rng.logistic(size=len(features)) > 0).astype(np.float64)
+    alphas = l1_path.alpha_grid(features, labels, n_alphas=10, eps=0.05)
+    coefs = l1_path.l1_path(features, labels, alphas, task='classification', tol=1e-10, max_iter=100000)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        model = LogisticRegression(penalty='l1', solver='liblinear', C=1 / (alphas[-1] * len(labels)),
+                                   tol=1e-10, max_iter=100000, intercept_scaling=1e4).fit(features, labels)
+    np.testing.assert_allclose(coefs[:, -1], model.coef_[0], atol=1e-3)
+
+
+def test_logistic_step_bounds_every_active_set(features):
+    step = l1_path.logistic_step(features)
+    for columns in ([0], [1, 4], [2, 3, 6, 7]):
+        assert step <= l1_path.logistic_step(features[:, columns])
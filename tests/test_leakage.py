@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+from models.feature_selector_model import FeatureSelectorModel
+
+
+def test_leakage_catches_a_level_that_gives_away_one_of_several_classes():
+    rng = np.random.default_rng(0)
+    labels = pd.Series(rng.integers(0, 3, 900), name='target')
+    _, other, leaked = pd.unique(labels)
+    # 'x' marks exactly the rows of one class. Half of the rows of another class are 'y', so the
+    # frequency of the first class (zero for both 'x' and 'y') alone would not separate them
+    leak = np.where(labels == leaked, 'x', np.where((labels == other) & (rng.random(900) < 0.5), 'y',
+                                                     rng.choice(['a', 'b'], 900)))
+    data = pd.DataFrame({'leak': leak, 'city': rng.choice(['a', 'b', 'c'], 900), 'value': rng.normal(size=900)})
+    model = FeatureSelectorModel()
+    model.load_data(data)
+    model.labels = labels
+    to_drop, _ = model.identify_leakage(leakage_threshold=0.95)
+
+    scores = model.leakage_stats.set_index('feature')['score']
+    assert to_drop == ['leak']
+    assert scores['leak'] == 1.0
+    assert scores[['city', 'value']].max() < 0.6
+
+
+def test_leakage_regression_ranks_pairwise_complete_rows():
+    rng = np.random.default_rng(1)
+    target = pd.Series(rng.normal(size=600), name='target')
+    copy = target.copy()
+    # Missing values only where the copy would rank lowest: the observed rows still rank perfectly
+    copy[target < target.quantile(0.3)] = np.nan
+    target[rng.random(600) < 0.05] = np.nan
+    model = FeatureSelectorModel()
+    model.load_data(pd.DataFrame({'copy': copy, 'noise': rng.normal(size=600)}))
+    model.labels = target
+    to_drop, _ = model.identify_leakage(task='regression', leakage_threshold=0.95)
+
+    scores = model.leakage_stats.set_index('feature')['score']
+    assert to_drop == ['copy']
+    assert scores['copy'] == 1.0
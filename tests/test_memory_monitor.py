@@ -0,0 +1,21 @@
+import numpy as np
+
+from models.memory_monitor import PeakRSSMonitor, current_rss
+
+
+def test_current_rss_is_positive():
+    rss = current_rss()
+    assert rss is None or rss > 0
+
+
+def test_peak_covers_a_large_allocation():
+    monitor = PeakRSSMonitor(interval=0.01).start()
+    before = monitor.peak
+    block = np.ones(64 * 2 ** 20 // 8)
+    peak = monitor.stop()
+    del block
+
+    if peak is not None:
+        assert peak >= before
+        assert peak >= 64 * 2 ** 20
+    assert monitor.thread is None
@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.one_hot import OneHotEncoding
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        'value': rng.normal(size=300),
+        'city': rng.choice(['a', 'b', 'c'], 300),
+        'id': [f'user{i}' for i in range(300)],
+        'grade': pd.Categorical(rng.choice(['low', 'high'], 300)),
+    })
+    data.loc[::7, 'city'] = None
+    data.loc[::11, 'id'] = None
+    return data
+
+
+def versions_of(data, version=0):
+    return {column: version for column in data.columns}
+
+
+@pytest.mark.parametrize('dtype', ['bool', 'uint8'])
+@pytest.mark.parametrize('sparse', [False, True])
+def test_encoding_matches_get_dummies(data, dtype, sparse):
+    encoding = OneHotEncoding(dtype=dtype, sparse=sparse)
+    encoded = encoding.encode(data, versions_of(data))
+    pd.testing.assert_frame_equal(encoded, pd.get_dummies(data, dtype=np.dtype(dtype), sparse=sparse))
+    assert pd.Index(encoding.one_hot_features).equals(encoded.columns.drop('value'))
+
+
+def test_encoding_is_cached_per_version(data):
+    encoding = OneHotEncoding()
+    encoded = encoding.encode(data, versions_of(data))
+    assert encoding.encode(data, versions_of(data)) is encoded
+
+    city_block = encoding.blocks['city'][1]
+    edited = data.copy()
+    edited['id'] = edited['id'].str.upper()
+    versions = dict(versions_of(edited), id=1)
+    pd.testing.assert_frame_equal(encoding.encode(edited, versions), pd.get_dummies(edited))
+    # Only the edited column was encoded again
+    assert encoding.blocks['city'][1] is city_block
+
+
+def test_excluded_features_are_left_out(data):
+    encoding = OneHotEncoding()
+    encoded = encoding.encode(data, versions_of(data), exclude={'city_a', 'value'})
+    expected = pd.get_dummies(data).drop(columns=['city_a', 'value'])
+    pd.testing.assert_frame_equal(encoded, expected)
+    assert 'city_a' not in encoding.data_all
+    assert 'value' not in encoding.data_all
+
+
+def test_data_all_holds_dummies_and_original_columns(data):
+    encoding = OneHotEncoding()
+    encoded = encoding.encode(data, versions_of(data))
+    expected = pd.concat([encoded[encoding.one_hot_features], data], axis=1)
+    pd.testing.assert_frame_equal(encoding.data_all.materialize(), expected)
+
+
+@pytest.mark.parametrize('policy', ['frequency', 'hash', 'ordinal'])
+def test_cardinality_cap(data, policy):
+    encoding = OneHotEncoding(max_levels=10, high_cardinality=policy, n_buckets=8)
+    encoded = encoding.encode(data, versions_of(data))
+    n_ids = data['id'].nunique()
+    assert encoding.capped == {'id': n_ids}
+    # Columns under the cap are still one-hot encoded
+    pd.testing.assert_frame_equal(encoded.filter(like='city_'), pd.get_dummies(data[['city']]))
+    missing = data['id'].isnull().to_numpy()
+
+    if policy == 'frequency':
+        expected = data['id'].map(data['id'].value_counts(normalize=True))
+        np.testing.assert_allclose(encoded['id_frequency'], expected)
+    elif policy == 'ordinal':
+        codes = encoded['id_code'].to_numpy()
+        assert np.isnan(codes[missing]).all()
+        assert np.array_equal(np.argsort(codes[~missing]), np.argsort(data['id'][~missing].to_numpy()))
+    else:
+        buckets = encoded.filter(like='id_hash_').to_numpy()
+        assert buckets.shape[1] == 8
+        np.testing.assert_array_equal(buckets.sum(axis=1), (~missing).astype(int))
+
+
+def test_invalid_settings_raise():
+    with pytest.raises(ValueError):
+        OneHotEncoding(dtype='int64')
+    with pytest.raises(ValueError):
+        OneHotEncoding(high_cardinality='target')
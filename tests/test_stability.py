@@ -0,0 +1,46 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+
+from models.feature_selector_model import FeatureSelectorModel
+
+
+def make_model():
+    rng = np.random.default_rng(0)
+    features = pd.DataFrame(rng.normal(size=(400, 5)), columns=['signal_a', 'signal_b', 'noise_a', 'noise_b',
+                                                                'noise_c'])
+    labels = (features['signal_a'] - features['signal_b'] + 0.3 * rng.normal(size=400) > 0).astype(int)
+    model = FeatureSelectorModel()
+    model.load_data(features)
+    model.labels = labels
+    return model, features, labels
+
+
+def test_stability_frequencies_match_direct_fits():
+    model, features, labels = make_model()
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        to_drop, details = model.identify_stability(n_subsamples=20, alpha=0.05, threshold=0.6, n_jobs=1,
+                                                    random_state=0)
+
+    # Refit the same half-samples on the standardized features
+    values = features.to_numpy()
+    values = (values - values.mean(axis=0)) / values.std(axis=0)
+    rng = np.random.default_rng(0)
+    supports = []
+    for _ in range(20):
+        rows = rng.choice(len(values), len(values) // 2, replace=False)
+        fit = LogisticRegression(l1_ratio=1, solver='liblinear', C=1.0 / (0.05 * len(rows)))
+        fit.fit(values[rows], labels.to_numpy()[rows])
+        supports.append(fit.coef_[0] != 0)
+    expected = pd.Series(np.mean(supports, axis=0), index=features.columns)
+
+    frequencies = model.stability_scores.set_index('feature')['frequency']
+    assert frequencies.to_dict() == expected.to_dict()
+    assert frequencies['signal_a'] == 1.0 and frequencies['signal_b'] == 1.0
+    assert frequencies.filter(like='noise').max() < 0.6
+    assert set(to_drop) == {'noise_a', 'noise_b', 'noise_c'}
+    assert list(model.record_stability['feature']) == list(frequencies[frequencies < 0.6].index)
+    assert '3 features' in details
@@ -0,0 +1,157 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+from sklearn import feature_selection, metrics
+
+from models import kernels, statistics
+
+BACKENDS = ['numpy'] + (['numba'] if kernels.available() else [])
+
+
+@pytest.fixture
+def features():
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(500, 6)) @ rng.normal(size=(6, 6))
+    values[rng.random(values.shape) < 0.1] = np.nan
+    return values
+
+
+@pytest.fixture
+def labels():
+    return np.random.default_rng(1).integers(0, 3, 500)
+
+
+def test_anova_f_matches_sklearn(labels):
+    values = np.random.default_rng(2).normal(size=(500, 5)) + labels.reshape((-1, 1))
+    f_statistic, p_values = statistics.anova_f(values, labels)
+    expected_f, expected_p = feature_selection.f_classif(values, labels)
+    np.testing.assert_allclose(f_statistic, expected_f, rtol=1e-9)
+    np.testing.assert_allclose(p_values, expected_p, rtol=1e-6, atol=1e-300)
+
+
+def test_anova_f_skips_missing_values_per_column(features, labels):
+    f_statistic, _ = statistics.anova_f(features, labels)
+    for position in range(features.shape[1]):
+        observed = ~np.isnan(features[:, position])
+        groups = [features[observed & (labels == label), position] for label in range(3)]
+        assert f_statistic[position] == pytest.approx(stats.f_oneway(*groups).statistic, rel=1e-9)
+
+
+def test_chi2_matches_sklearn(labels):
+    values = np.random.default_rng(3).poisson(3.0, size=(500, 5)).astype(np.float64)
+    chi2_statistic, p_values = statistics.chi2(values, labels)
+    expected_chi2, expected_p = feature_selection.chi2(values, labels)
+    np.testing.assert_allclose(chi2_statistic, expected_chi2, rtol=1e-9)
+    np.testing.assert_allclose(p_values, expected_p, rtol=1e-6)
+
+
+def test_rank_auc_matches_sklearn(labels):
+    rng = np.random.default_rng(4)
+    # Rounded values give ties; -inf stands for missing values as in `identify_leakage`
+    values = np.round(rng.normal(size=(500, 4)) + labels.reshape((-1, 1)), 1)
+    values[rng.random(values.shape) < 0.1] = -np.inf
+    auc = statistics.rank_auc(values, labels)
+    # sklearn rejects infinities: any value below the observed ones ranks the same
+    finite = np.where(np.isinf(values), -100.0, values)
+    # Classes in order of appearance, as `one_hot_labels` encodes them
+    for row, label in enumerate(pd.unique(labels)):
+        for position in range(values.shape[1]):
+            assert auc[row, position] == pytest.approx(
+                metrics.roc_auc_score(labels == label, finite[:, position]), rel=1e-12)
+
+
+def test_rank_auc_ignores_missing_labels(labels):
+    values = np.random.default_rng(5).normal(size=(500, 2))
+    partial = labels.astype(np.float64)
+    partial[:50] = np.nan
+    np.testing.assert_allclose(statistics.rank_auc(values, partial),
+                               statistics.rank_auc(values[50:], labels[50:]), rtol=1e-12)
+
+
+def test_spearman_r_matches_scipy_on_pairwise_complete_rows(features):
+    target = np.round(np.nan_to_num(features[:, 0]) + np.random.default_rng(6).normal(size=500), 1)
+    target[np.random.default_rng(7).random(500) < 0.05] = np.nan
+    values = np.column_stack([features, np.round(np.arange(500.0) % 7)])
+    r = statistics.spearman_r(values, target)
+    for position in range(values.shape[1]):
+        expected = stats.spearmanr(values[:, position], target, nan_policy='omit').statistic
+        assert r[position] == pytest.approx(expected, rel=1e-12)
+
+
+def test_pairwise_corr_matches_dataframe_corr(features):
+    np.testing.assert_allclose(statistics.pairwise_corr(features), pd.DataFrame(features).corr().to_numpy(),
+                               atol=1e-12)
+
+
+def test_cross_corr_matches_rows_of_pairwise_corr(features):
+    corr = statistics.pairwise_corr(features)
+    np.testing.assert_allclose(statistics.cross_corr(features[:, [1, 4]], features), corr[[1, 4]], atol=1e-12)
+
+
+def test_merged_pairwise_moments_match_full_correlation(features):
+    moments = statistics.pairwise_moments(features[:200])
+    moments = statistics.merge_pairwise_moments(moments, statistics.pairwise_moments(features[200:]))
+    count, _, m2, comoment = moments
+    np.testing.assert_allclose(statistics.moments_correlation(count, m2, comoment),
+                               statistics.pairwise_corr(features), atol=1e-12)
+
+
+def miller_madow_bias(codes, target_codes):
+    """Bias removed by `mutual_info`, to compare it with the plug-in estimate."""
+    bias = []
+    for column in codes.T:
+        occupied_cells = len(set(zip(column, target_codes)))
+        bias.append((occupied_cells - len(np.unique(column)) - len(np.unique(target_codes)) + 1) /
+                    (2 * len(column)))
+    return np.array(bias)
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_mutual_info_matches_sklearn_on_discrete_data(labels, backend):
+    rng = np.random.default_rng(4)
+    codes = np.column_stack([rng.integers(0, 4, 500), (labels + rng.integers(0, 2, 500)) % 3,
+                             rng.integers(0, 10, 500)])
+    expected = feature_selection.mutual_info_classif(codes, labels, discrete_features=True)
+    mi = statistics.mutual_info(codes, labels, backend)
+    np.testing.assert_allclose(mi + miller_madow_bias(codes, labels), expected, atol=1e-12)
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_mutual_info_sizes_histograms_per_column(labels, backend):
+    rng = np.random.default_rng(5)
+    low_cardinality = rng.integers(0, 3, (500, 2))
+    # An ID-like column with a level per row must not change the other columns' scores
+    codes = np.column_stack([low_cardinality, np.arange(500)])
+    mi = statistics.mutual_info(codes, labels, backend)
+    np.testing.assert_allclose(mi[:2], statistics.mutual_info(low_cardinality, labels, backend), atol=1e-15)
+
+    offsets = statistics.level_offsets(codes.max(axis=0) + 1)
+    assert statistics.joint_histograms(codes, labels, codes.max(axis=0) + 1, 3, backend).shape == (offsets[-1], 3)
+    assert offsets[-1] == 3 + 3 + 500
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_population_stability_index_per_column_levels(backend):
+    rng = np.random.default_rng(6)
+    reference = np.column_stack([rng.integers(0, 3, 400), rng.integers(0, 8, 400)])
+    comparison = np.column_stack([rng.integers(0, 3, 300), rng.integers(0, 8, 300)])
+    psi = statistics.population_stability_index(reference, comparison, np.array([3, 8]), backend=backend)
+
+    for position, n_levels in enumerate([3, 8]):
+        expected_reference = np.maximum(np.bincount(reference[:, position], minlength=n_levels) / 400, 1e-4)
+        expected_comparison = np.maximum(np.bincount(comparison[:, position], minlength=n_levels) / 300, 1e-4)
+        expected = ((expected_comparison - expected_reference) *
+                    np.log(expected_comparison / expected_reference)).sum()
+        assert psi[position] == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_bin_codes_match_searchsorted(features, backend):
+    edges = statistics.quantile_edges(features, 5)
+    codes = statistics.bin_codes(features, edges, backend)
+    for position in range(features.shape[1]):
+        observed = ~np.isnan(features[:, position])
+        np.testing.assert_array_equal(codes[observed, position],
+                                      np.searchsorted(edges[:, position], features[observed, position]))
+        assert (codes[~observed, position] == len(edges) + 1).all()
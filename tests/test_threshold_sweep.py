@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.feature_selector_model import FeatureSelectorModel
+
+IMPORTANCE_PARAMS = {'eval_metric': 'auc', 'task': 'classification', 'n_iterations': 2, 'early_stopping': True}
+
+
+def make_data():
+    rng = np.random.default_rng(0)
+    base = rng.normal(size=500)
+    data = pd.DataFrame({'base': base,
+                         'close': base + 0.1 * rng.normal(size=500),
+                         'loose': base + 0.8 * rng.normal(size=500),
+                         'negated': -base + 0.4 * rng.normal(size=500),
+                         'noise': rng.normal(size=500),
+                         'sparse': rng.normal(size=500),
+                         'gappy': rng.normal(size=500)})
+    data.loc[rng.random(500) < 0.7, 'sparse'] = np.nan
+    data.loc[rng.random(500) < 0.3, 'gappy'] = np.nan
+    data.loc[rng.random(500) < 0.05, 'noise'] = np.nan
+    data['target'] = (base + rng.normal(size=500) > 0).astype(int)
+    data['other_target'] = (data['noise'].fillna(0) + rng.normal(size=500) > 0).astype(int)
+    return data
+
+
+def count_fits(model):
+    """Count the GBM trainings of `model` while keeping their results."""
+    calls = []
+    fit = model.gbm_importances
+
+    def counted(*args, **kwargs):
+        calls.append(args)
+        return fit(*args, **kwargs)
+
+    model.gbm_importances = counted
+    return calls
+
+
+def test_sweep_counts_match_fresh_runs():
+    data = make_data()
+    model = FeatureSelectorModel()
+    model.load_data(data)
+    model.select_features({'Missing Values': {'missing_threshold': 0.5},
+                           'Collinear Features': {'correlation_threshold': 0.5, 'one_hot': False},
+                           'Zero Importance Features': IMPORTANCE_PARAMS}, 'target')
+
+    missing_grid = [0.0, 0.1, 0.2, 0.5, 0.9]
+    correlation_grid = [0.1, 0.5, 0.8, 0.999]
+    importance_grid = [0.5, 0.8, 0.95, 0.99]
+    sweeps = model.sweep_thresholds(missing_grid, correlation_grid, importance_grid)
+
+    for name, grid, identify in [('missing', missing_grid, 'identify_missing'),
+                                 ('collinear', correlation_grid, 'identify_collinear'),
+                                 ('low_importance', importance_grid, 'identify_low_importance')]:
+        assert list(sweeps[name]['threshold']) == grid
+        for threshold, n_drop in zip(grid, sweeps[name]['n_drop']):
+            fresh = FeatureSelectorModel()
+            fresh.load_data(data.drop(columns=['target']))
+            fresh.labels = data['target']
+            fresh.feature_importances = model.feature_importances
+            to_drop, _ = getattr(fresh, identify)(threshold)
+            assert n_drop == len(to_drop), (name, threshold)
+
+    # The grids span thresholds from nearly every feature dropped to none
+    assert list(sweeps['missing']['n_drop']) == [3, 2, 2, 1, 0]
+    assert sweeps['collinear']['n_drop'].iloc[-1] == 0 < sweeps['collinear']['n_drop'].iloc[1]
+
+
+def test_sweep_requires_computed_statistics():
+    model = FeatureSelectorModel()
+    model.load_data(make_data())
+    with pytest.raises(NotImplementedError):
+        model.sweep_thresholds(correlation_thresholds=[0.5])
+    with pytest.raises(NotImplementedError):
+        model.sweep_thresholds(cumulative_importances=[0.9])
+
+
+def test_importances_reused_until_target_changes():
+    data = make_data()
+    model = FeatureSelectorModel()
+    fits = count_fits(model)
+    low_importance = {'Zero Importance Features': IMPORTANCE_PARAMS,
+                      'Low Importance Features': {'cumulative_importance': 0.9}}
+
+    model.load_data(data)
+    model.select_features(low_importance, 'target')
+    importances = model.feature_importances.sort_values('feature')
+    assert len(fits) == 1
+
+    # Only a threshold changes: the importances of the previous run are reused
+    model.load_data(data)
+    model.select_features(dict(low_importance, **{'Low Importance Features': {'cumulative_importance': 0.5}}),
+                          'target')
+    assert len(fits) == 1
+    pd.testing.assert_frame_equal(model.feature_importances.sort_values('feature'), importances)
+
+    # Another target column: the GBMs are trained again on its labels
+    model.load_data(data)
+    model.select_features(low_importance, 'other_target')
+    assert len(fits) == 2
+    assert list(fits[-1][1]) == list(data['other_target'])
+
+    # The target column edited in place: trained again as well
+    data['other_target'] = 1 - data['other_target']
+    model.update_columns(data, changed=['other_target'])
+    model.load_data(data)
+    model.select_features(low_importance, 'other_target')
+    assert len(fits) == 3
+    assert list(fits[-1][1]) == list(data['other_target'])
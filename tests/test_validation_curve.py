@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.model_selection import train_test_split
+
+from models.feature_selector_model import FeatureSelectorModel, fit_validation_score
+
+RANKING = ['signal_a', 'signal_b', 'noise_a', 'noise_b', 'noise_c', 'noise_d', 'noise_e', 'noise_f']
+
+
+def make_model():
+    rng = np.random.default_rng(0)
+    features = pd.DataFrame(rng.normal(size=(600, 8)), columns=RANKING)
+    labels = (features['signal_a'] + features['signal_b'] + 0.3 * rng.normal(size=600) > 0).astype(int)
+    model = FeatureSelectorModel()
+    # Columns in another order than the ranking, which the curve has to follow
+    model.load_data(features[RANKING[::-1]])
+    model.labels = labels
+    model.feature_importances = pd.DataFrame({'feature': RANKING, 'importance': np.arange(8, 0, -1.0)})
+    return model, features, labels
+
+
+@pytest.mark.parametrize('eval_metric, tolerance', [('auc', 0.02), ('binary_logloss', 0.2)])
+def test_validation_curve_scores_and_cutoff(eval_metric, tolerance):
+    model, features, labels = make_model()
+    # The split draws from the global generator
+    np.random.seed(0)
+    to_drop, details = model.identify_validation_curve(eval_metric=eval_metric, n_points=4, tolerance=tolerance,
+                                                       n_jobs=1)
+
+    np.random.seed(0)
+    split = train_test_split(features.to_numpy(dtype=np.float32), labels.to_numpy(), test_size=0.2,
+                             stratify=labels.to_numpy())
+    curve = model.validation_curve
+    assert list(curve['n_features']) == [1, 2, 4, 8]
+    for n_features, score in zip(curve['n_features'], curve['score']):
+        assert score == pytest.approx(fit_validation_score(split[0], split[2], split[1], split[3],
+                                                           np.arange(n_features), 'classification',
+                                                           eval_metric))
+
+    # Both signal features are needed, and adding noise does not help
+    best = curve['score'].max() if eval_metric == 'auc' else curve['score'].min()
+    distance = np.abs(curve['score'] - best) / abs(best)
+    assert distance[0] > tolerance
+    assert model.validation_curve_n_features == curve.loc[distance <= tolerance, 'n_features'].min() == 2
+    assert to_drop == RANKING[2:]
+    assert list(model.record_validation_curve['rank']) == list(range(3, 9))
+    assert details.startswith('2 features reach a validation %s' % eval_metric)
+
+
+def test_validation_curve_requires_fresh_importances():
+    model, _, _ = make_model()
+    model.update_columns(model.data, changed=['noise_a'])
+    with pytest.raises(NotImplementedError):
+        model.identify_validation_curve(n_jobs=1)
@@ -5,12 +5,25 @@ from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QCheckBox, QLabe
 
 
 class FeatureSelectionDialog(QDialog):
+    # Methods that run on one-hot encoded data, so one-hot features must be kept
+    one_hot_methods = ["Zero Importance Features", "Low Importance Features", "Boruta Shadow Features",
+                       "Validation Curve", "Stability Selection", "L1 Path"]
+
     def __init__(self):
         super().__init__()
         self.all_methods_checkbox = None
         self.one_hot_checkbox = None
         self.keep_one_hot_combo = None
         self.keep_one_hot = None
+        self.cascade_combo = None
+        self.cascade = False
+        self.max_levels_edit = None
+        self.high_cardinality_combo = None
+        self.encoding_policy = None
+        self.memory_budget_edit = None
+        self.memory_budget = None
+        self.engine_combo = None
+        self.engine = 'pandas'
         self.selected_methods = None
         self.methods_checkboxes = None
         self.init_ui()
@@ -40,7 +53,17 @@ class FeatureSelectionDialog(QDialog):
             ("Single Unique Value", None, None, None),
             ("Collinear Features", (QLineEdit("0.975"), QComboBox()), "Threshold: 0 to 1", "correlation_threshold"),
             ("Zero Importance Features", None, "Settings for Zero Importance Features", None),
-            ("Low Importance Features", QLineEdit("0.99"), "Threshold: 0 to 1", "cumulative_importance")
+            ("Low Importance Features", QLineEdit("0.99"), "Threshold: 0 to 1", "cumulative_importance"),
+            ("Boruta Shadow Features", None, "Settings for Boruta Shadow Features", None),
+            ("Validation Curve", None, "Settings for Validation Curve", None),
+            ("Univariate Statistics", None, "Settings for Univariate Statistics", None),
+            ("Low Mutual Information", None, "Settings for Low Mutual Information", None),
+            ("mRMR", None, "Settings for mRMR", None),
+            ("Stability Selection", None, "Settings for Stability Selection", None),
+            ("Target Leakage", None, "Settings for Target Leakage", None),
+            ("Near Constant", None, "Settings for Near Constant", None),
+            ("Distribution Drift", None, "Settings for Distribution Drift", None),
+            ("L1 Path", None, "Settings for L1 Path", None)
         ]
 
         self.methods_checkboxes = {}
@@ -102,6 +125,165 @@ class FeatureSelectionDialog(QDialog):
                     checkbox, (task_combobox, eval_metric_combobox, n_iterations_line_edit, early_stopping_checkbox,
                                importance_type_combobox, n_permutations_line_edit))
 
+            elif method_name == "Boruta Shadow Features":
+                task_combobox = QComboBox()
+                task_combobox.addItems(['classification', 'regression'])
+                n_iterations_line_edit = QLineEdit("50")
+                alpha_line_edit = QLineEdit("0.05")
+
+                hbox.addWidget(QLabel("Task:"))
+                hbox.addWidget(task_combobox)
+                hbox.addWidget(QLabel("Iterations:"))
+                hbox.addWidget(n_iterations_line_edit)
+                hbox.addWidget(QLabel("Alpha:"))
+                hbox.addWidget(alpha_line_edit)
+
+                self.methods_checkboxes[method_name] = (
+                    checkbox, (task_combobox, n_iterations_line_edit, alpha_line_edit))
+
+            elif method_name == "Validation Curve":
+                task_combobox = QComboBox()
+                task_combobox.addItems(['classification', 'regression'])
+                eval_metric_combobox = QComboBox()
+                eval_metric_combobox.addItems(['auc', 'l2'])
+                n_points_line_edit = QLineEdit("10")
+                tolerance_line_edit = QLineEdit("0.01")
+
+                hbox.addWidget(QLabel("Task:"))
+                hbox.addWidget(task_combobox)
+                hbox.addWidget(QLabel("Eval Metric:"))
+                hbox.addWidget(eval_metric_combobox)
+                hbox.addWidget(QLabel("Points:"))
+                hbox.addWidget(n_points_line_edit)
+                hbox.addWidget(QLabel("Tolerance:"))
+                hbox.addWidget(tolerance_line_edit)
+
+                self.methods_checkboxes[method_name] = (
+                    checkbox, (task_combobox, eval_metric_combobox, n_points_line_edit, tolerance_line_edit))
+
+            elif method_name == "Univariate Statistics":
+                score_func_combobox = QComboBox()
+                score_func_combobox.addItems(['anova', 'chi2', 'pearson'])
+                p_value_threshold_line_edit = QLineEdit("0.05")
+
+                hbox.addWidget(QLabel("Score Function:"))
+                hbox.addWidget(score_func_combobox)
+                hbox.addWidget(QLabel("P-value Threshold:"))
+                hbox.addWidget(p_value_threshold_line_edit)
+                hbox.addWidget(QLabel("Threshold: 0 to 1"))
+
+                self.methods_checkboxes[method_name] = (
+                    checkbox, (score_func_combobox, p_value_threshold_line_edit))
+
+            elif method_name == "Low Mutual Information":
+                task_combobox = QComboBox()
+                task_combobox.addItems(['classification', 'regression'])
+                n_bins_line_edit = QLineEdit("10")
+                mi_threshold_line_edit = QLineEdit("0.001")
+
+                hbox.addWidget(QLabel("Task:"))
+                hbox.addWidget(task_combobox)
+                hbox.addWidget(QLabel("Bins:"))
+                hbox.addWidget(n_bins_line_edit)
+                hbox.addWidget(QLabel("MI Threshold:"))
+                hbox.addWidget(mi_threshold_line_edit)
+
+                self.methods_checkboxes[method_name] = (
+                    checkbox, (task_combobox, n_bins_line_edit, mi_threshold_line_edit))
+
+            elif method_name == "mRMR":
+                n_features_line_edit = QLineEdit("20")
+                score_func_combobox = QComboBox()
+                score_func_combobox.addItems(['pearson', 'mutual_info'])
+                task_combobox = QComboBox()
+                task_combobox.addItems(['classification', 'regression'])
+
+                hbox.addWidget(QLabel("Features:"))
+                hbox.addWidget(n_features_line_edit)
+                hbox.addWidget(QLabel("Score Function:"))
+                hbox.addWidget(score_func_combobox)
+                hbox.addWidget(QLabel("Task:"))
+                hbox.addWidget(task_combobox)
+
+                self.methods_checkboxes[method_name] = (
+                    checkbox, (n_features_line_edit, score_func_combobox, task_combobox))
+
+            elif method_name == "Stability Selection":
+                task_combobox = QComboBox()
+                task_combobox.addItems(['classification', 'regression'])
+                estimator_combobox = QComboBox()
+                estimator_combobox.addItems(['l1', 'gbm'])
+                n_subsamples_line_edit = QLineEdit("100")
+                alpha_line_edit = QLineEdit("0.01")
+                threshold_line_edit = QLineEdit("0.6")
+
+                hbox.addWidget(QLabel("Task:"))
+                hbox.addWidget(task_combobox)
+                hbox.addWidget(QLabel("Estimator:"))
+                hbox.addWidget(estimator_combobox)
+                hbox.addWidget(QLabel("Subsamples:"))
+                hbox.addWidget(n_subsamples_line_edit)
+                hbox.addWidget(QLabel("Alpha:"))
+                hbox.addWidget(alpha_line_edit)
+                hbox.addWidget(QLabel("Threshold:"))
+                hbox.addWidget(threshold_line_edit)
+
+                self.methods_checkboxes[method_name] = (
+                    checkbox, (task_combobox, estimator_combobox, n_subsamples_line_edit, alpha_line_edit,
+                               threshold_line_edit))
+
+            elif method_name == "Target Leakage":
+                task_combobox = QComboBox()
+                task_combobox.addItems(['classification', 'regression'])
+                leakage_threshold_line_edit = QLineEdit("0.95")
+
+                hbox.addWidget(QLabel("Task:"))
+                hbox.addWidget(task_combobox)
+                hbox.addWidget(QLabel("Leakage Threshold:"))
+                hbox.addWidget(leakage_threshold_line_edit)
+                hbox.addWidget(QLabel("Threshold: 0 to 1"))
+
+                self.methods_checkboxes[method_name] = (checkbox, (task_combobox, leakage_threshold_line_edit))
+
+            elif method_name == "Near Constant":
+                dominant_threshold_line_edit = QLineEdit("0.999")
+                variance_threshold_line_edit = QLineEdit("0.0")
+
+                hbox.addWidget(QLabel("Dominant Threshold:"))
+                hbox.addWidget(dominant_threshold_line_edit)
+                hbox.addWidget(QLabel("Variance Threshold:"))
+                hbox.addWidget(variance_threshold_line_edit)
+
+                self.methods_checkboxes[method_name] = (
+                    checkbox, (dominant_threshold_line_edit, variance_threshold_line_edit))
+
+            elif method_name == "Distribution Drift":
+                psi_threshold_line_edit = QLineEdit("0.25")
+                n_bins_line_edit = QLineEdit("10")
+
+                hbox.addWidget(QLabel("PSI Threshold:"))
+                hbox.addWidget(psi_threshold_line_edit)
+                hbox.addWidget(QLabel("Bins:"))
+                hbox.addWidget(n_bins_line_edit)
+
+                self.methods_checkboxes[method_name] = (checkbox, (psi_threshold_line_edit, n_bins_line_edit))
+
+            elif method_name == "L1 Path":
+                task_combobox = QComboBox()
+                task_combobox.addItems(['classification', 'regression'])
+                n_features_line_edit = QLineEdit("20")
+                n_alphas_line_edit = QLineEdit("100")
+
+                hbox.addWidget(QLabel("Task:"))
+                hbox.addWidget(task_combobox)
+                hbox.addWidget(QLabel("Features:"))
+                hbox.addWidget(n_features_line_edit)
+                hbox.addWidget(QLabel("Alphas:"))
+                hbox.addWidget(n_alphas_line_edit)
+
+                self.methods_checkboxes[method_name] = (
+                    checkbox, (task_combobox, n_features_line_edit, n_alphas_line_edit))
+
             else:
                 if parameter_widgets and param_name:
                     hbox.addWidget(QLabel(f"{param_name.capitalize()}:"))
@@ -134,6 +316,50 @@ class FeatureSelectionDialog(QDialog):
         keep_one_hot_layout.addWidget(self.keep_one_hot_combo)
         layout.addLayout(keep_one_hot_layout)
 
+        # Execution mode: every method on all features, or a cascade where the cheapest methods
+        # run first and each later method only sees the features that survived them
+        cascade_layout = QHBoxLayout()
+        cascade_label = QLabel("Execution Mode:")
+        self.cascade_combo = QComboBox()
+        self.cascade_combo.addItem('Independent')
+        self.cascade_combo.addItem('Cascade (cheapest first)')
+        cascade_layout.addWidget(cascade_label)
+        cascade_layout.addWidget(self.cascade_combo)
+        layout.addLayout(cascade_layout)
+
+        # Categorical encoding: one-hot up to a cardinality cap, a single column above it
+        encoding_layout = QHBoxLayout()
+        max_levels_label = QLabel("One-Hot Cardinality Cap:")
+        self.max_levels_edit = QLineEdit("1000")
+        self.max_levels_edit.setPlaceholderText("No cap")
+        high_cardinality_label = QLabel("Above the Cap:")
+        self.high_cardinality_combo = QComboBox()
+        self.high_cardinality_combo.addItems(['frequency', 'hash', 'ordinal'])
+        encoding_layout.addWidget(max_levels_label)
+        encoding_layout.addWidget(self.max_levels_edit)
+        encoding_layout.addWidget(high_cardinality_label)
+        encoding_layout.addWidget(self.high_cardinality_combo)
+        layout.addLayout(encoding_layout)
+
+        # Memory budget: over it, runs tile the correlations, train fewer Boruta rounds at once and release
+        # caches between methods
+        memory_budget_layout = QHBoxLayout()
+        memory_budget_label = QLabel("Memory Budget (MB):")
+        self.memory_budget_edit = QLineEdit()
+        self.memory_budget_edit.setPlaceholderText("No budget")
+        memory_budget_layout.addWidget(memory_budget_label)
+        memory_budget_layout.addWidget(self.memory_budget_edit)
+        layout.addLayout(memory_budget_layout)
+
+        # Library for the column statistics and one-hot encoding; Polars is opt-in
+        engine_layout = QHBoxLayout()
+        engine_label = QLabel("Statistics Engine:")
+        self.engine_combo = QComboBox()
+        self.engine_combo.addItems(['pandas', 'polars', 'auto'])
+        engine_layout.addWidget(engine_label)
+        engine_layout.addWidget(self.engine_combo)
+        layout.addLayout(engine_layout)
+
         # Adjust keep_one_hot_combo based on initial checkbox states
         self.adjust_keep_one_hot_state()
 
@@ -158,8 +384,9 @@ class FeatureSelectionDialog(QDialog):
             missing_checkbox, _ = self.methods_checkboxes["Missing Values"]
             single_unique_checkbox, _ = self.methods_checkboxes["Single Unique Value"]
             collinear_checkbox, collinear_widgets = self.methods_checkboxes["Collinear Features"]
-            zero_importance_checkbox, _ = self.methods_checkboxes["Zero Importance Features"]
-            low_importance_checkbox, _ = self.methods_checkboxes["Low Importance Features"]
+            # 是否选择了在独热编码数据上运行的方法
+            one_hot_method_checked = any(self.methods_checkboxes[method_name][0].isChecked()
+                                         for method_name in self.one_hot_methods)
 
             # 获取 "Collinear Features" 方法的 one_hot 下拉框状态
             _, one_hot_combobox = collinear_widgets
@@ -168,18 +395,18 @@ class FeatureSelectionDialog(QDialog):
 
             # 情况一：只选择了前两种方法
             if (
-                    missing_checkbox.isChecked() or single_unique_checkbox.isChecked()) and not collinear_checkbox.isChecked():
+                    missing_checkbox.isChecked() or single_unique_checkbox.isChecked()) and not collinear_checkbox.isChecked() \
+                    and not one_hot_method_checked:
                 self.keep_one_hot_combo.setCurrentText('False')
                 self.keep_one_hot_combo.setEnabled(False)
 
             # 情况二：只选择了前三种方法且必定选择了第三种方法
-            elif collinear_checkbox.isChecked() and not zero_importance_checkbox.isChecked() and not low_importance_checkbox.isChecked():
+            elif collinear_checkbox.isChecked() and not one_hot_method_checked:
                 self.keep_one_hot_combo.setCurrentText('True' if one_hot_state else 'False')
                 self.keep_one_hot_combo.setEnabled(False)
 
             # 情况三：选择了第四五种方法或者第三种方法的One Hot为True
-            elif (
-                    one_hot_state and collinear_checkbox.isChecked()) or zero_importance_checkbox.isChecked() or low_importance_checkbox.isChecked():
+            elif (one_hot_state and collinear_checkbox.isChecked()) or one_hot_method_checked:
                 self.keep_one_hot_combo.setCurrentText('True')
                 self.keep_one_hot_combo.setEnabled(False)
 
@@ -207,15 +434,17 @@ class FeatureSelectionDialog(QDialog):
         self.adjust_keep_one_hot_state()
 
     def on_zero_importance_checkbox_changed(self, state):
-        low_importance_checkbox, _ = self.methods_checkboxes["Low Importance Features"]
+        # 依赖特征重要性的方法
+        for method_name in ["Low Importance Features", "Validation Curve"]:
+            dependent_checkbox, _ = self.methods_checkboxes[method_name]
 
-        # 如果 "Zero Importance Features" 复选框被选中，则启用 "Low Importance Features" 复选框
-        if state == Qt.Checked:
-            low_importance_checkbox.setEnabled(True)
-        else:
-            # 如果 "Zero Importance Features" 复选框未选中，则取消选中并禁用 "Low Importance Features" 复选框
-            low_importance_checkbox.setChecked(False)
-            low_importance_checkbox.setEnabled(False)
+            # 如果 "Zero Importance Features" 复选框被选中，则启用依赖它的复选框
+            if state == Qt.Checked:
+                dependent_checkbox.setEnabled(True)
+            else:
+                # 如果 "Zero Importance Features" 复选框未选中，则取消选中并禁用依赖它的复选框
+                dependent_checkbox.setChecked(False)
+                dependent_checkbox.setEnabled(False)
         self.adjust_keep_one_hot_state()
 
     def apply_selection(self):
@@ -295,6 +524,197 @@ class FeatureSelectionDialog(QDialog):
                         "cumulative_importance": float(cumulative_importance_threshold)
                     }
 
+            # Boruta Shadow Features
+            checkbox, boruta_widgets = self.methods_checkboxes["Boruta Shadow Features"]
+            if checkbox.isChecked():
+                task_combobox, n_iterations_line_edit, alpha_line_edit = boruta_widgets
+                task = task_combobox.currentText()
+                n_iterations = n_iterations_line_edit.text()
+                alpha = alpha_line_edit.text()
+
+                error_message = self.validate_parameter("Boruta Shadow Features", (task, n_iterations, alpha))
+                if error_message:
+                    validation_errors.append(error_message)
+                else:
+                    selected_methods["Boruta Shadow Features"] = {
+                        "task": task,
+                        "n_iterations": int(n_iterations),
+                        "alpha": float(alpha)
+                    }
+
+            # Validation Curve
+            checkbox, validation_curve_widgets = self.methods_checkboxes["Validation Curve"]
+            if checkbox.isChecked():
+                task_combobox, eval_metric_combobox, n_points_line_edit, tolerance_line_edit = validation_curve_widgets
+                task = task_combobox.currentText()
+                eval_metric = eval_metric_combobox.currentText()
+                n_points = n_points_line_edit.text()
+                tolerance = tolerance_line_edit.text()
+
+                error_message = self.validate_parameter("Validation Curve", (task, eval_metric, n_points, tolerance))
+                if error_message:
+                    validation_errors.append(error_message)
+                else:
+                    selected_methods["Validation Curve"] = {
+                        "task": task,
+                        "eval_metric": eval_metric,
+                        "n_points": int(n_points),
+                        "tolerance": float(tolerance)
+                    }
+
+            # Univariate Statistics
+            checkbox, univariate_widgets = self.methods_checkboxes["Univariate Statistics"]
+            if checkbox.isChecked():
+                score_func_combobox, p_value_threshold_line_edit = univariate_widgets
+                score_func = score_func_combobox.currentText()
+                p_value_threshold = p_value_threshold_line_edit.text()
+
+                error_message = self.validate_parameter("Univariate Statistics", (score_func, p_value_threshold))
+                if error_message:
+                    validation_errors.append(error_message)
+                else:
+                    selected_methods["Univariate Statistics"] = {
+                        "score_func": score_func,
+                        "p_value_threshold": float(p_value_threshold)
+                    }
+
+            # Low Mutual Information
+            checkbox, mutual_info_widgets = self.methods_checkboxes["Low Mutual Information"]
+            if checkbox.isChecked():
+                task_combobox, n_bins_line_edit, mi_threshold_line_edit = mutual_info_widgets
+                task = task_combobox.currentText()
+                n_bins = n_bins_line_edit.text()
+                mi_threshold = mi_threshold_line_edit.text()
+
+                error_message = self.validate_parameter("Low Mutual Information", (task, n_bins, mi_threshold))
+                if error_message:
+                    validation_errors.append(error_message)
+                else:
+                    selected_methods["Low Mutual Information"] = {
+                        "task": task,
+                        "n_bins": int(n_bins),
+                        "mi_threshold": float(mi_threshold)
+                    }
+
+            # mRMR
+            checkbox, mrmr_widgets = self.methods_checkboxes["mRMR"]
+            if checkbox.isChecked():
+                n_features_line_edit, score_func_combobox, task_combobox = mrmr_widgets
+                n_features = n_features_line_edit.text()
+                score_func = score_func_combobox.currentText()
+                task = task_combobox.currentText()
+
+                error_message = self.validate_parameter("mRMR", (n_features, score_func, task))
+                if error_message:
+                    validation_errors.append(error_message)
+                else:
+                    selected_methods["mRMR"] = {
+                        "n_features": int(n_features),
+                        "score_func": score_func,
+                        "task": task
+                    }
+
+            # Stability Selection
+            checkbox, stability_widgets = self.methods_checkboxes["Stability Selection"]
+            if checkbox.isChecked():
+                task_combobox, estimator_combobox, n_subsamples_line_edit, alpha_line_edit, threshold_line_edit = \
+                    stability_widgets
+                task = task_combobox.currentText()
+                estimator = estimator_combobox.currentText()
+                n_subsamples = n_subsamples_line_edit.text()
+                alpha = alpha_line_edit.text()
+                threshold = threshold_line_edit.text()
+                param_values = (task, estimator, n_subsamples, alpha, threshold)
+
+                error_message = self.validate_parameter("Stability Selection", param_values)
+                if error_message:
+                    validation_errors.append(error_message)
+                else:
+                    selected_methods["Stability Selection"] = {
+                        "task": task,
+                        "estimator": estimator,
+                        "n_subsamples": int(n_subsamples),
+                        "alpha": float(alpha),
+                        "threshold": float(threshold)
+                    }
+
+            # Target Leakage
+            checkbox, leakage_widgets = self.methods_checkboxes["Target Leakage"]
+            if checkbox.isChecked():
+                task_combobox, leakage_threshold_line_edit = leakage_widgets
+                task = task_combobox.currentText()
+                leakage_threshold = leakage_threshold_line_edit.text()
+
+                error_message = self.validate_parameter("Target Leakage", (task, leakage_threshold))
+                if error_message:
+                    validation_errors.append(error_message)
+                else:
+                    selected_methods["Target Leakage"] = {
+                        "task": task,
+                        "leakage_threshold": float(leakage_threshold)
+                    }
+
+            # Near Constant
+            checkbox, near_constant_widgets = self.methods_checkboxes["Near Constant"]
+            if checkbox.isChecked():
+                dominant_threshold_line_edit, variance_threshold_line_edit = near_constant_widgets
+                dominant_threshold = dominant_threshold_line_edit.text()
+                variance_threshold = variance_threshold_line_edit.text()
+
+                error_message = self.validate_parameter("Near Constant", (dominant_threshold, variance_threshold))
+                if error_message:
+                    validation_errors.append(error_message)
+                else:
+                    selected_methods["Near Constant"] = {
+                        "dominant_threshold": float(dominant_threshold),
+                        "variance_threshold": float(variance_threshold)
+                    }
+
+            # Distribution Drift
+            checkbox, drift_widgets = self.methods_checkboxes["Distribution Drift"]
+            if checkbox.isChecked():
+                psi_threshold_line_edit, n_bins_line_edit = drift_widgets
+                psi_threshold = psi_threshold_line_edit.text()
+                n_bins = n_bins_line_edit.text()
+
+                error_message = self.validate_parameter("Distribution Drift", (psi_threshold, n_bins))
+                if error_message:
+                    validation_errors.append(error_message)
+                else:
+                    selected_methods["Distribution Drift"] = {
+                        "psi_threshold": float(psi_threshold),
+                        "n_bins": int(n_bins)
+                    }
+
+            # L1 Path
+            checkbox, l1_path_widgets = self.methods_checkboxes["L1 Path"]
+            if checkbox.isChecked():
+                task_combobox, n_features_line_edit, n_alphas_line_edit = l1_path_widgets
+                task = task_combobox.currentText()
+                n_features = n_features_line_edit.text()
+                n_alphas = n_alphas_line_edit.text()
+
+                error_message = self.validate_parameter("L1 Path", (task, n_features, n_alphas))
+                if error_message:
+                    validation_errors.append(error_message)
+                else:
+                    selected_methods["L1 Path"] = {
+                        "task": task,
+                        "n_features": int(n_features),
+                        "n_alphas": int(n_alphas)
+                    }
+
+            max_levels = self.max_levels_edit.text().strip()
+            if max_levels and (not max_levels.isdigit() or int(max_levels) < 1):
+                validation_errors.append("The one-hot cardinality cap must be a positive integer or empty.")
+
+            memory_budget = self.memory_budget_edit.text().strip()
+            try:
+                if memory_budget and float(memory_budget) <= 0:
+                    raise ValueError
+            except ValueError:
+                validation_errors.append("The memory budget must be a positive number of megabytes or empty.")
+
             # If there are validation errors, show them and do not proceed
             if validation_errors:
                 error_message = "\n".join(validation_errors)
@@ -305,6 +725,11 @@ class FeatureSelectionDialog(QDialog):
             # Get the value from the Keep One Hot combo box
             self.keep_one_hot = self.keep_one_hot_combo.currentText()
             print(self.keep_one_hot)
+            self.cascade = self.cascade_combo.currentIndex() == 1
+            self.encoding_policy = {'max_levels': int(max_levels) if max_levels else None,
+                                    'high_cardinality': self.high_cardinality_combo.currentText()}
+            self.memory_budget = int(float(memory_budget) * 2 ** 20) if memory_budget else None
+            self.engine = self.engine_combo.currentText()
 
             self.accept()
         except Exception as e:
@@ -369,6 +794,178 @@ class FeatureSelectionDialog(QDialog):
             except ValueError:
                 return "Low Importance Features threshold must be a number."
 
+        elif method_name == "Boruta Shadow Features":
+            task, n_iterations, alpha = param_values
+            if task not in ["classification", "regression"]:
+                return "Invalid task value for Boruta Shadow Features."
+            try:
+                n_iterations = int(n_iterations)
+                if n_iterations <= 0:
+                    return "n_iterations must be greater than 0 for Boruta Shadow Features."
+            except ValueError:
+                return "n_iterations must be an integer for Boruta Shadow Features."
+            try:
+                alpha = float(alpha)
+                if not 0 < alpha < 1:
+                    return "Boruta Shadow Features alpha must be between 0 and 1."
+            except ValueError:
+                return "Boruta Shadow Features alpha must be a number."
+            return None
+
+        elif method_name == "Validation Curve":
+            task, eval_metric, n_points, tolerance = param_values
+            if task not in ["classification", "regression"]:
+                return "Invalid task value for Validation Curve."
+            if eval_metric not in ["auc", "l2"]:
+                return "Invalid eval_metric value for Validation Curve."
+            try:
+                n_points = int(n_points)
+                if n_points < 2:
+                    return "n_points must be at least 2 for Validation Curve."
+            except ValueError:
+                return "n_points must be an integer for Validation Curve."
+            try:
+                tolerance = float(tolerance)
+                if not 0 <= tolerance <= 1:
+                    return "Validation Curve tolerance must be between 0 and 1."
+            except ValueError:
+                return "Validation Curve tolerance must be a number."
+            return None
+
+        elif method_name == "Univariate Statistics":
+            score_func, p_value_threshold = param_values
+            if score_func not in ["anova", "chi2", "pearson"]:
+                return "Invalid score_func value for Univariate Statistics."
+            try:
+                p_value_threshold = float(p_value_threshold)
+                if 0 <= p_value_threshold <= 1:
+                    return None
+                else:
+                    return "Univariate Statistics p-value threshold must be between 0 and 1."
+            except ValueError:
+                return "Univariate Statistics p-value threshold must be a number."
+
+        elif method_name == "Low Mutual Information":
+            task, n_bins, mi_threshold = param_values
+            if task not in ["classification", "regression"]:
+                return "Invalid task value for Low Mutual Information."
+            try:
+                n_bins = int(n_bins)
+                if n_bins < 2:
+                    return "n_bins must be at least 2 for Low Mutual Information."
+            except ValueError:
+                return "n_bins must be an integer for Low Mutual Information."
+            try:
+                mi_threshold = float(mi_threshold)
+                if mi_threshold < 0:
+                    return "Low Mutual Information threshold must not be negative."
+            except ValueError:
+                return "Low Mutual Information threshold must be a number."
+            return None
+
+        elif method_name == "mRMR":
+            n_features, score_func, task = param_values
+            try:
+                n_features = int(n_features)
+                if n_features <= 0:
+                    return "n_features must be greater than 0 for mRMR."
+            except ValueError:
+                return "n_features must be an integer for mRMR."
+            if score_func not in ["pearson", "mutual_info"]:
+                return "Invalid score_func value for mRMR."
+            if task not in ["classification", "regression"]:
+                return "Invalid task value for mRMR."
+            return None
+
+        elif method_name == "Stability Selection":
+            task, estimator, n_subsamples, alpha, threshold = param_values
+            if task not in ["classification", "regression"]:
+                return "Invalid task value for Stability Selection."
+            if estimator not in ["l1", "gbm"]:
+                return "Invalid estimator value for Stability Selection."
+            try:
+                n_subsamples = int(n_subsamples)
+                if n_subsamples <= 0:
+                    return "n_subsamples must be greater than 0 for Stability Selection."
+            except ValueError:
+                return "n_subsamples must be an integer for Stability Selection."
+            try:
+                alpha = float(alpha)
+                if alpha <= 0:
+                    return "Stability Selection alpha must be greater than 0."
+            except ValueError:
+                return "Stability Selection alpha must be a number."
+            try:
+                threshold = float(threshold)
+                if not 0 <= threshold <= 1:
+                    return "Stability Selection threshold must be between 0 and 1."
+            except ValueError:
+                return "Stability Selection threshold must be a number."
+            return None
+
+        elif method_name == "Target Leakage":
+            task, leakage_threshold = param_values
+            if task not in ["classification", "regression"]:
+                return "Invalid task value for Target Leakage."
+            try:
+                leakage_threshold = float(leakage_threshold)
+                if 0 <= leakage_threshold <= 1:
+                    return None
+                else:
+                    return "Target Leakage threshold must be between 0 and 1."
+            except ValueError:
+                return "Target Leakage threshold must be a number."
+
+        elif method_name == "Near Constant":
+            dominant_threshold, variance_threshold = param_values
+            try:
+                dominant_threshold = float(dominant_threshold)
+                if not 0 <= dominant_threshold <= 1:
+                    return "Near Constant dominant threshold must be between 0 and 1."
+            except ValueError:
+                return "Near Constant dominant threshold must be a number."
+            try:
+                variance_threshold = float(variance_threshold)
+                if variance_threshold < 0:
+                    return "Near Constant variance threshold must not be negative."
+            except ValueError:
+                return "Near Constant variance threshold must be a number."
+            return None
+
+        elif method_name == "Distribution Drift":
+            psi_threshold, n_bins = param_values
+            try:
+                psi_threshold = float(psi_threshold)
+                if psi_threshold < 0:
+                    return "Distribution Drift PSI threshold must not be negative."
+            except ValueError:
+                return "Distribution Drift PSI threshold must be a number."
+            try:
+                n_bins = int(n_bins)
+                if n_bins < 2:
+                    return "n_bins must be at least 2 for Distribution Drift."
+            except ValueError:
+                return "n_bins must be an integer for Distribution Drift."
+            return None
+
+        elif method_name == "L1 Path":
+            task, n_features, n_alphas = param_values
+            if task not in ["classification", "regression"]:
+                return "Invalid task value for L1 Path."
+            try:
+                n_features = int(n_features)
+                if n_features <= 0:
+                    return "n_features must be greater than 0 for L1 Path."
+            except ValueError:
+                return "n_features must be an integer for L1 Path."
+            try:
+                n_alphas = int(n_alphas)
+                if n_alphas < 2:
+                    return "n_alphas must be at least 2 for L1 Path."
+            except ValueError:
+                return "n_alphas must be an integer for L1 Path."
+            return None
+
         return "Unknown method."
 
     def get_selected_methods(self):
@@ -376,3 +973,15 @@ class FeatureSelectionDialog(QDialog):
 
     def get_one_hot(self):
         return self.keep_one_hot
+
+    def get_cascade(self):
+        return self.cascade
+
+    def get_encoding_policy(self):
+        return self.encoding_policy
+
+    def get_memory_budget(self):
+        return self.memory_budget
+
+    def get_engine(self):
+        return self.engine
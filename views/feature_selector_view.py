@@ -11,6 +11,10 @@ from views.themes import ALL_THEMES
 
 
 class FeatureSelectorView(QMainWindow):
+    add_row_signal = pyqtSignal()
+    delete_row_signal = pyqtSignal(int)
+    add_column_signal = pyqtSignal()
+    delete_column_signal = pyqtSignal(int)
     rename_column_signal = pyqtSignal(int)
     set_target_column_signal = pyqtSignal(int)
 
@@ -234,14 +238,15 @@ class FeatureSelectorView(QMainWindow):
         rename_column_action = context_menu.addAction("Rename Column")
         action = context_menu.exec_(global_position)
 
+        # The controller edits the table together with its dataframe
         if action == add_row_action:
-            current_table.insertRow(current_table.rowCount())
+            self.add_row_signal.emit()
         elif action == delete_row_action:
-            current_table.removeRow(current_table.currentRow())
+            self.delete_row_signal.emit(current_table.currentRow())
         elif action == add_column_action:
-            current_table.insertColumn(current_table.columnCount())
+            self.add_column_signal.emit()
         elif action == delete_column_action:
-            current_table.removeColumn(current_table.currentColumn())
+            self.delete_column_signal.emit(current_table.currentColumn())
         elif action == rename_column_action:
             column_index = current_table.currentColumn()
             self.rename_column_signal.emit(column_index)
@@ -33,7 +33,8 @@ class PlottingView(QWidget):
         # 选择绘图类型的组合框
         select_layout = QFormLayout()
         self.plot_dropdown = QComboBox()
-        self.plot_dropdown.addItems(["Missing Values", "Unique Values", "Collinear Features", "Feature Importances"])
+        self.plot_dropdown.addItems(["Missing Values", "Unique Values", "Collinear Features", "Feature Importances",
+                                     "Validation Curve", "Stability Selection", "L1 Path"])
         select_layout.addRow("Select Plot Type:", self.plot_dropdown)
         control_layout.addLayout(select_layout)
 
@@ -76,8 +77,14 @@ class PlottingView(QWidget):
         # Missing Values: 无参数
         self.parameters_stacked_widget.addWidget(QWidget())
 
-        # Unique Values: 无参数
-        self.parameters_stacked_widget.addWidget(QWidget())
+        # Unique Values
+        unique_widget = QWidget()
+        unique_layout = QFormLayout()
+        self.unique_count_combobox = QComboBox()
+        self.unique_count_combobox.addItems(["Exact", "Approximate (HyperLogLog)"])
+        unique_layout.addRow("Count:", self.unique_count_combobox)
+        unique_widget.setLayout(unique_layout)
+        self.parameters_stacked_widget.addWidget(unique_widget)
 
         # Collinear Features
         collinear_widget = QWidget()
@@ -100,16 +107,35 @@ class PlottingView(QWidget):
         feature_importances_widget.setLayout(feature_importances_layout)
         self.parameters_stacked_widget.addWidget(feature_importances_widget)
 
+        # Validation Curve: 无参数
+        self.parameters_stacked_widget.addWidget(QWidget())
+
+        # Stability Selection
+        stability_widget = QWidget()
+        stability_layout = QFormLayout()
+        self.stability_plot_n_lineedit = QLineEdit("15")
+        self.stability_plot_n_lineedit.setFixedWidth(50)
+        stability_layout.addRow("Plot N:", self.stability_plot_n_lineedit)
+        stability_widget.setLayout(stability_layout)
+        self.parameters_stacked_widget.addWidget(stability_widget)
+
+        # L1 Path: 无参数
+        self.parameters_stacked_widget.addWidget(QWidget())
+
         self.plot_dropdown.currentIndexChanged.connect(self.parameters_stacked_widget.setCurrentIndex)
 
     def generate_plot(self):
         plot_type = self.plot_dropdown.currentText()
         parameters = {}
-        if plot_type == "Collinear Features":
+        if plot_type == "Unique Values":
+            parameters['approximate'] = self.unique_count_combobox.currentIndex() == 1
+        elif plot_type == "Collinear Features":
             parameters['plot_all'] = self.plot_all_combobox.currentText() == "True"
         elif plot_type == "Feature Importances":
             parameters['plot_n'] = int(self.plot_n_lineedit.text())
             parameters['threshold'] = float(self.threshold_lineedit.text())
+        elif plot_type == "Stability Selection":
+            parameters['plot_n'] = int(self.stability_plot_n_lineedit.text())
         self.plot_requested.emit(plot_type, parameters)
 
     def context_menu(self, event):
@@ -155,9 +181,9 @@ class PlottingView(QWidget):
         # Redraw the canvas
         self.canvas.draw()
 
-    def plot_unique(self):
-        """Histogram of number of unique values in each feature"""
-        unique_stats = self.model.get_unique_stats()
+    def plot_unique(self, approximate=False):
+        """Histogram of number of unique values in each feature, optionally from HyperLogLog estimates"""
+        unique_stats = self.model.get_unique_stats(approximate)
 
         if unique_stats is None:
             self.message_label.setText('Unique values have not been calculated. Run `identify_single_unique`')
@@ -172,7 +198,10 @@ class PlottingView(QWidget):
 
         ax.set_ylabel('Frequency', size=14)
         ax.set_xlabel('Unique Values', size=14)
-        ax.set_title('Number of Unique Values Histogram', size=16)
+        title = 'Number of Unique Values Histogram'
+        if approximate:
+            title += ' (HyperLogLog, ±0.8% above 4096)'
+        ax.set_title(title, size=16)
 
         # Redraw the canvas
         self.canvas.draw()
@@ -246,6 +275,11 @@ class PlottingView(QWidget):
             self.message_label.setText('Feature importances have not been determined. Run `identify_zero_importance`')
             return
 
+        if self.model.feature_importances_stale():
+            self.message_label.setText('Feature importances are stale after an edit of the data. '
+                                       'Run `identify_zero_importance` again')
+            return
+
         if plot_n > feature_importances.shape[0]:
             plot_n = feature_importances.shape[0] - 1
 
@@ -286,3 +320,85 @@ class PlottingView(QWidget):
         self.figure.tight_layout()
 
         self.canvas.draw()
+
+    def plot_validation_curve(self):
+        """Validation score against the number of top ranked features, with the suggested feature count"""
+        validation_curve, n_features_suggested = self.model.get_validation_curve_data()
+
+        if validation_curve is None:
+            self.message_label.setText('Validation curve has not been calculated. Run `identify_validation_curve`')
+            return
+
+        # Clear previous figures
+        self.figure.clear()
+
+        ax = self.figure.add_subplot(111)
+        ax.plot(validation_curve['n_features'], validation_curve['score'], 'o-')
+        ax.set_xscale('log')
+        ax.axvline(x=n_features_suggested, linestyle='--', color='blue')
+        ax.set_xlabel('Number of Features', size=14)
+        ax.set_ylabel('Validation Score', size=14)
+        ax.set_title('Validation Score vs Number of Features', size=16)
+        self.message_label.setText('%d features suggested' % n_features_suggested)
+
+        # Redraw the canvas
+        self.canvas.draw()
+
+    def plot_stability(self, plot_n=15):
+        """Selection frequency of the `plot_n` most stable features, with the frequency threshold"""
+        stability_scores, threshold = self.model.get_stability_data()
+
+        if stability_scores is None:
+            self.message_label.setText('Stability selection has not been run. Run `identify_stability`')
+            return
+
+        plot_n = min(plot_n, stability_scores.shape[0])
+
+        # Clear previous figures
+        self.figure.clear()
+
+        ax = self.figure.add_subplot(111)
+        ax.barh(list(reversed(range(plot_n))), stability_scores['frequency'].iloc[:plot_n],
+                align='center', edgecolor='k')
+        ax.set_yticks(list(reversed(range(plot_n))))
+        ax.set_yticklabels(stability_scores['feature'].iloc[:plot_n], size=10)
+        ax.axvline(x=threshold, linestyle='--', color='blue')
+        ax.set_xlim(0, 1)
+        ax.set_xlabel('Selection Frequency', size=14)
+        ax.set_title('Stability Selection', size=16)
+
+        self.figure.tight_layout()
+
+        # Redraw the canvas
+        self.canvas.draw()
+
+    def plot_l1_path(self):
+        """Coefficient of every feature along the L1 regularization path, with the alpha where the selection stops"""
+        regularization_path, l1_path_stats, n_features = self.model.get_l1_path_data()
+
+        if regularization_path is None:
+            self.message_label.setText('L1 path has not been calculated. Run `identify_l1_path`')
+            return
+
+        # Clear previous figures
+        self.figure.clear()
+
+        ax = self.figure.add_subplot(111)
+        alphas = regularization_path['alphas']
+        ax.plot(alphas, regularization_path['coefs'].to_numpy().T, linewidth=1)
+        ax.set_xscale('log')
+        ax.invert_xaxis()
+
+        # Entry alpha of the last kept feature; no cut line when no feature is kept
+        if n_features > 0:
+            cut_alpha = l1_path_stats['entry_alpha'].iloc[n_features - 1]
+            if not np.isnan(cut_alpha):
+                ax.axvline(x=cut_alpha, linestyle='--', color='blue')
+
+        ax.set_xlabel('Alpha', size=14)
+        ax.set_ylabel('Standardized Coefficient', size=14)
+        ax.set_title('L1 Regularization Path', size=16)
+        self.message_label.setText('%d features kept' % n_features)
+
+        # Redraw the canvas
+        self.canvas.draw()
@@ -68,5 +68,95 @@ class UsageDialog(QDialog):
         self.text_browser.append(
             "<b>Usage :</b> Use One-Hot Encoding on categorical features before feeding the data to algorithms that require numerical input, such as linear regression or support vector machines.")
 
+        # Details for Boruta Shadow Features
+        self.text_browser.append("<h2>7. Boruta Shadow Features (Boruta影子特征)</h2>")
+        self.text_browser.append(
+            "<b>Introduction :</b> A feature with non-zero importance is not necessarily better than noise. Boruta compares every feature against randomly shuffled copies of the features.")
+        self.text_browser.append(
+            "<b>Principle :</b> Each round appends a permuted \"shadow\" copy of every undecided feature and trains a gradient boosting model. A feature scores a hit when it is more important than the best shadow. A binomial test on the hits accepts or rejects each feature, and decided features leave the shadow set.")
+        self.text_browser.append(
+            "<b>Usage :</b> Choose the task, the maximum number of rounds and the significance level. Rejected features will be identified for removal; features still undecided after the last round are kept.")
+
+        # Details for Validation Curve
+        self.text_browser.append("<h2>8. Validation Curve (验证曲线)</h2>")
+        self.text_browser.append(
+            "<b>Introduction :</b> A cumulative importance threshold says nothing about how well a model performs with the remaining features.")
+        self.text_browser.append(
+            "<b>Principle :</b> Using the ranking from the Zero Importance Features method, models are trained on the top-k features for a geometric grid of k in parallel, and the validation score is recorded for each k.")
+        self.text_browser.append(
+            "<b>Usage :</b> Enable Zero Importance Features first, then set the number of grid points and the tolerance. The smallest k whose score is within the tolerance of the best score is suggested, and the remaining features will be identified for removal.")
+
+        # Details for Univariate Statistics
+        self.text_browser.append("<h2>9. Univariate Statistics (单变量统计检验)</h2>")
+        self.text_browser.append(
+            "<b>Introduction :</b> A cheap supervised screen that runs before any model is trained.")
+        self.text_browser.append(
+            "<b>Principle :</b> Every numeric feature is tested against the target on its own: the ANOVA F test compares the feature means between classes, the chi-squared test compares the class totals of non-negative features with their expected values, and the Pearson test measures the linear correlation with a numeric target.")
+        self.text_browser.append(
+            "<b>Usage :</b> Choose the score function and a p-value threshold. Features with a p-value above the threshold will be identified for removal.")
+
+        # Details for Low Mutual Information
+        self.text_browser.append("<h2>10. Low Mutual Information (低互信息)</h2>")
+        self.text_browser.append(
+            "<b>Introduction :</b> Mutual information measures any kind of dependency between a feature and the target, not only linear ones.")
+        self.text_browser.append(
+            "<b>Principle :</b> Numeric features are split into quantile bins and categorical features keep their categories. The mutual information of every feature with the target is computed from joint histograms, with a bias correction so that unrelated features score close to zero.")
+        self.text_browser.append(
+            "<b>Usage :</b> Choose the task, the number of bins and the threshold. Features with a mutual information at or below the threshold will be identified for removal.")
+
+        # Details for mRMR
+        self.text_browser.append("<h2>11. mRMR (最小冗余最大相关)</h2>")
+        self.text_browser.append(
+            "<b>Introduction :</b> Features that are each relevant to the target can still carry the same information. mRMR picks a subset that is relevant but not redundant.")
+        self.text_browser.append(
+            "<b>Principle :</b> Features are selected one at a time. Each step takes the feature with the largest relevance to the target minus its mean redundancy with the features already selected, measured by Pearson correlation or binned mutual information.")
+        self.text_browser.append(
+            "<b>Usage :</b> Set the number of features to select and the score function. Features that are not selected will be identified for removal.")
+
+        # Details for Stability Selection
+        self.text_browser.append("<h2>12. Stability Selection (稳定性选择)</h2>")
+        self.text_browser.append(
+            "<b>Introduction :</b> The features picked by a single model can change from run to run. Stability selection keeps only the features that are picked consistently.")
+        self.text_browser.append(
+            "<b>Principle :</b> An L1-regularized linear model (or a shallow gradient boosting model) is fitted on many random half-samples of the data in parallel. The fraction of fits in which each feature is selected is its selection frequency.")
+        self.text_browser.append(
+            "<b>Usage :</b> Choose the estimator, the number of half-samples, the regularization strength and the frequency threshold. Features selected less often than the threshold will be identified for removal. The frequencies can be plotted in the visualization panel.")
+
+        # Details for Target Leakage
+        self.text_browser.append("<h2>13. Target Leakage (目标泄露)</h2>")
+        self.text_browser.append(
+            "<b>Introduction :</b> Columns such as IDs or fields recorded after the outcome can predict the target almost perfectly, which makes every model-based method useless.")
+        self.text_browser.append(
+            "<b>Principle :</b> Each feature is scored on its own before any model is trained: by its ROC AUC for classification, or by its absolute Spearman correlation for regression.")
+        self.text_browser.append(
+            "<b>Usage :</b> Choose the task and a suspicion threshold. Features scoring above the threshold will be identified for removal.")
+
+        # Details for Near Constant
+        self.text_browser.append("<h2>14. Near Constant (近似常量)</h2>")
+        self.text_browser.append(
+            "<b>Introduction :</b> A feature where almost every row has the same value is nearly as useless as a constant one, but the Single Unique Value method does not catch it.")
+        self.text_browser.append(
+            "<b>Principle :</b> For every feature, the fraction of rows taken by its most frequent value and, for numeric features, the variance are computed in one pass.")
+        self.text_browser.append(
+            "<b>Usage :</b> Set the dominant value threshold and the variance threshold. Features whose dominant value fraction reaches the threshold, or whose variance is below the threshold, will be identified for removal.")
+
+        # Details for Distribution Drift
+        self.text_browser.append("<h2>15. Distribution Drift (分布漂移)</h2>")
+        self.text_browser.append(
+            "<b>Introduction :</b> When several files are time slices of the same table, features whose distribution changes between slices make models unreliable over time.")
+        self.text_browser.append(
+            "<b>Principle :</b> Each feature is binned on the dataset being run, and the population stability index (PSI) compares its bin frequencies with those of every other open dataset.")
+        self.text_browser.append(
+            "<b>Usage :</b> Load several datasets, run on the reference one and set the PSI threshold (0.1 is a moderate shift, 0.25 a large one). Features with a PSI above the threshold against any dataset will be identified for removal.")
+
+        # Details for L1 Path
+        self.text_browser.append("<h2>16. L1 Path (L1正则化路径)</h2>")
+        self.text_browser.append(
+            "<b>Introduction :</b> A fast linear counterpart to the gradient boosting importances. The stronger the L1 penalty, the fewer features a linear model keeps.")
+        self.text_browser.append(
+            "<b>Principle :</b> A Lasso (regression) or L1-logistic (binary classification) model is fitted for a decreasing sequence of penalties, each fit starting from the previous solution. Features are ranked by the penalty at which they first enter the model.")
+        self.text_browser.append(
+            "<b>Usage :</b> Choose the task, the number of features to keep and the number of penalties. The features that enter the path after the first ones will be identified for removal. Changing only the number of features reuses the computed path, which can be plotted in the visualization panel.")
+
         layout.addWidget(self.text_browser)
         self.setLayout(layout)